@@ -2,15 +2,19 @@
 """Count remaining YAML blocks in the system"""
 
 import os
-import re
+import sys
 from pathlib import Path
 
+# Add utilities directory to path
+sys.path.append(str(Path(__file__).parent.parent / "utilities"))
+from code_fences import count_yaml_blocks
+
 def count_yaml_blocks_in_file(file_path):
     """Count YAML blocks in a single file"""
     try:
         with open(file_path, 'r', encoding='utf-8') as f:
             content = f.read()
-            return len(re.findall(r'```ya?ml', content))
+        return count_yaml_blocks(content)
     except Exception as e:
         print(f"Error reading {file_path}: {e}")
         return 0
@@ -8,15 +8,24 @@ supporting multiple output formats and maintaining full functionality.
 """
 
 import os
-import re
+import sys
 import json
+import time
 import yaml
-from typing import List, Dict, Any, Tuple
+import shutil
+import hashlib
+import tempfile
+from typing import List, Dict, Any, Optional, Tuple
 from pathlib import Path
 from datetime import datetime
+from multiprocessing import Pool, cpu_count
 import argparse
 import logging
 
+# Add utilities directory to path
+sys.path.append(str(Path(__file__).parent.parent / "utilities"))
+from code_fences import iter_yaml_blocks
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -24,17 +33,25 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+JOURNAL_VERSION = 1
+SLOWEST_FILES_REPORTED = 10
+
 class YAMLConverter:
     """Enhanced YAML to structured format converter with semantic preservation"""
     
-    def __init__(self, root_dir: str):
+    def __init__(self, root_dir: str, journal_path: Optional[Path] = None):
         self.root_dir = Path(root_dir)
+        self.journal_path = Path(journal_path) if journal_path else self.root_dir / 'logs' / 'yaml-elimination-journal.jsonl'
         self.conversions = []
+        self.conversion_memo: Dict[str, str] = {}  # sha256 of block content -> converted text
+        self.run_seconds = 0.0
         self.stats = {
             'files_processed': 0,
+            'files_resumed': 0,
             'yaml_blocks_found': 0,
             'yaml_blocks_converted': 0,
-            'conversion_errors': 0
+            'conversion_errors': 0,
+            'memo_hits': 0
         }
         
     def find_yaml_files(self) -> List[Path]:
@@ -58,20 +75,7 @@ class YAMLConverter:
     
     def extract_yaml_blocks(self, content: str) -> List[Tuple[str, str, int, int]]:
         """Extract YAML blocks with positions for replacement"""
-        blocks = []
-        
-        # Pattern to match YAML blocks
-        pattern = r'```ya?ml\n(.*?)\n```'
-        
-        for match in re.finditer(pattern, content, re.DOTALL):
-            yaml_content = match.group(1)
-            start_pos = match.start()
-            end_pos = match.end()
-            full_block = match.group(0)
-            
-            blocks.append((full_block, yaml_content, start_pos, end_pos))
-            
-        return blocks
+        return list(iter_yaml_blocks(content))
     
     def convert_yaml_to_structured(self, yaml_content: str) -> str:
         """Convert YAML content to structured markdown format"""
@@ -234,72 +238,193 @@ class YAMLConverter:
         except (yaml.YAMLError, json.JSONEncodeError):
             return self.convert_yaml_to_structured(yaml_content)
     
-    def process_file(self, file_path: Path) -> bool:
-        """Process a single file and convert all YAML blocks"""
+    def convert_block(self, yaml_content: str) -> str:
+        """Convert one YAML block to its best structured format"""
+        # Determine best conversion format
+        format_type = self.determine_conversion_format(yaml_content)
+        
+        if format_type == 'table':
+            converted = self.convert_to_table_format(yaml_content)
+        elif format_type == 'json':
+            converted = self.convert_to_json_format(yaml_content)
+        else:
+            converted = self.convert_yaml_to_structured(yaml_content)
+        
+        return converted
+    
+    def convert_file(self, file_path: Path) -> Dict[str, Any]:
+        """Convert all YAML blocks of one file in place and describe the outcome"""
+        start_time = time.time()
+        result = {
+            'file': str(file_path),
+            'yaml_blocks': 0,
+            'converted_blocks': 0,
+            'conversion_errors': 0,
+            'memo_hits': 0,
+            'memo': {},
+            'changed': False
+        }
         try:
             with open(file_path, 'r', encoding='utf-8') as f:
                 content = f.read()
             
-            original_content = content
             yaml_blocks = self.extract_yaml_blocks(content)
+            result['yaml_blocks'] = len(yaml_blocks)
+            if yaml_blocks:
+                logger.info(f"Processing {file_path}: {len(yaml_blocks)} YAML blocks")
             
-            if not yaml_blocks:
-                return True
-                
-            logger.info(f"Processing {file_path}: {len(yaml_blocks)} YAML blocks")
-            
-            # Process blocks in reverse order to maintain positions
-            for full_block, yaml_content, start_pos, end_pos in reversed(yaml_blocks):
+            # Output is assembled from segments in one pass, in document order
+            segments = []
+            position = 0
+            for full_block, yaml_content, start_pos, end_pos in yaml_blocks:
+                segments.append(content[position:start_pos])
                 try:
-                    # Determine best conversion format
-                    format_type = self.determine_conversion_format(yaml_content)
-                    
-                    if format_type == 'table':
-                        converted = self.convert_to_table_format(yaml_content)
-                    elif format_type == 'json':
-                        converted = self.convert_to_json_format(yaml_content)
+                    # Identical blocks reuse the earlier conversion instead of parsing again
+                    key = hashlib.sha256(yaml_content.encode('utf-8')).hexdigest()
+                    converted = self.conversion_memo.get(key)
+                    if converted is None:
+                        converted = self.convert_block(yaml_content)
+                        self.conversion_memo[key] = converted
+                        result['memo'][key] = converted
                     else:
-                        converted = self.convert_yaml_to_structured(yaml_content)
-                    
-                    # Replace the YAML block
-                    content = content[:start_pos] + converted + content[end_pos:]
-                    
-                    self.stats['yaml_blocks_converted'] += 1
-                    
+                        result['memo_hits'] += 1
+                    segments.append(converted)
+                    result['converted_blocks'] += 1
                 except Exception as e:
                     logger.error(f"Error converting YAML block in {file_path}: {e}")
-                    self.stats['conversion_errors'] += 1
-                    continue
+                    result['conversion_errors'] += 1
+                    segments.append(full_block)
+                position = end_pos
+            segments.append(content[position:])
+            converted_content = ''.join(segments)
             
             # Write back the converted content
-            if content != original_content:
-                with open(file_path, 'w', encoding='utf-8') as f:
-                    f.write(content)
-                
-                self.conversions.append({
-                    'file': str(file_path),
-                    'yaml_blocks': len(yaml_blocks),
-                    'converted_blocks': len(yaml_blocks) - (self.stats['conversion_errors'] - len(yaml_blocks)),
-                    'timestamp': datetime.now().isoformat()
-                })
-            
-            self.stats['files_processed'] += 1
-            self.stats['yaml_blocks_found'] += len(yaml_blocks)
-            
-            return True
+            if converted_content != content:
+                write_atomically(file_path, converted_content)
+                result['changed'] = True
             
+            stat = file_path.stat()
+            result['mtime_ns'] = stat.st_mtime_ns
+            result['size'] = stat.st_size
         except Exception as e:
             logger.error(f"Error processing {file_path}: {e}")
-            return False
+            result['error'] = str(e)
+        
+        result['seconds'] = time.time() - start_time
+        result['timestamp'] = datetime.now().isoformat()
+        return result
+    
+    def process_file(self, file_path: Path) -> bool:
+        """Process a single file and convert all YAML blocks"""
+        result = self.convert_file(file_path)
+        self._record_result(result)
+        return 'error' not in result
+    
+    def _record_result(self, result: Dict[str, Any]) -> None:
+        """Fold one file's outcome into the run statistics"""
+        if 'error' in result:
+            return
+        self.stats['files_processed'] += 1
+        self.stats['yaml_blocks_found'] += result['yaml_blocks']
+        self.stats['yaml_blocks_converted'] += result['converted_blocks']
+        self.stats['conversion_errors'] += result['conversion_errors']
+        self.stats['memo_hits'] += result['memo_hits']
+        self.conversion_memo.update(result['memo'])
+        if result['yaml_blocks']:
+            self.conversions.append({
+                'file': result['file'],
+                'yaml_blocks': result['yaml_blocks'],
+                'converted_blocks': result['converted_blocks'],
+                'changed': result['changed'],
+                'seconds': result['seconds'],
+                'timestamp': result['timestamp']
+            })
     
-    def process_all_files(self) -> None:
-        """Process all files with YAML blocks"""
+    def _load_journal(self) -> Dict[str, Dict[str, Any]]:
+        """Files finished by an interrupted run, with the memo it built"""
+        completed = {}
+        try:
+            with open(self.journal_path, 'r', encoding='utf-8') as f:
+                header = json.loads(f.readline() or '{}')
+                if header.get('version') != JOURNAL_VERSION or header.get('root') != str(self.root_dir.resolve()):
+                    logger.warning(f"Ignoring journal from another run: {self.journal_path}")
+                    return {}
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        # The run stopped mid-write; the file is simply redone
+                        continue
+                    completed[entry['file']] = entry
+                    self.conversion_memo.update(entry.get('memo', {}))
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable journal {self.journal_path}: {e}")
+            return {}
+        return completed
+    
+    def _open_journal(self, append: bool):
+        """Journal handle; a fresh journal starts with its header line"""
+        self.journal_path.parent.mkdir(parents=True, exist_ok=True)
+        if append and self.journal_path.exists():
+            return open(self.journal_path, 'a', encoding='utf-8')
+        journal = open(self.journal_path, 'w', encoding='utf-8')
+        journal.write(json.dumps({'version': JOURNAL_VERSION, 'root': str(self.root_dir.resolve())}) + '\n')
+        journal.flush()
+        return journal
+    
+    def process_all_files(self, workers: Optional[int] = None, resume: bool = True) -> None:
+        """Process all files with YAML blocks across a process pool
+        
+        Every finished file is journaled, so an interrupted run picks up
+        where it stopped; the journal is removed once the run completes.
+        """
+        start_time = time.time()
         yaml_files = self.find_yaml_files()
+        completed = self._load_journal() if resume else {}
         
-        logger.info(f"Found {len(yaml_files)} files with YAML blocks")
+        # Files converted before the interruption no longer contain YAML blocks
+        listed = {str(file_path) for file_path in yaml_files}
+        candidates = yaml_files + [Path(path) for path in completed if path not in listed]
         
-        for file_path in yaml_files:
-            self.process_file(file_path)
+        pending = []
+        for file_path in candidates:
+            entry = completed.get(str(file_path))
+            try:
+                stat = file_path.stat()
+            except OSError:
+                continue
+            # Files untouched since they were journaled keep their recorded outcome
+            if entry and entry.get('mtime_ns') == stat.st_mtime_ns and entry.get('size') == stat.st_size:
+                self._record_result(entry)
+                self.stats['files_resumed'] += 1
+            elif str(file_path) in listed:
+                pending.append(file_path)
+        
+        logger.info(f"Found {len(yaml_files)} files with YAML blocks, "
+                    f"{self.stats['files_resumed']} already done by an earlier run")
+        
+        workers = min(workers or cpu_count(), max(len(pending), 1))
+        with self._open_journal(append=bool(completed)) as journal:
+            if workers <= 1:
+                results = (self.convert_file(file_path) for file_path in pending)
+                self._collect_results(results, journal)
+            else:
+                with Pool(processes=workers, initializer=_init_worker,
+                          initargs=(str(self.root_dir), self.conversion_memo)) as pool:
+                    self._collect_results(pool.imap_unordered(_convert_in_worker, pending), journal)
+        
+        self.journal_path.unlink()
+        self.run_seconds = time.time() - start_time
+    
+    def _collect_results(self, results, journal) -> None:
+        """Record results as they arrive, journaling each finished file"""
+        for result in results:
+            self._record_result(result)
+            if 'error' not in result:
+                journal.write(json.dumps(result) + '\n')
+                journal.flush()
     
     def generate_report(self) -> str:
         """Generate conversion report"""
@@ -320,7 +445,23 @@ class YAMLConverter:
 """
         
         for conversion in self.conversions:
-            report += f"- **{conversion['file']}**: {conversion['converted_blocks']}/{conversion['yaml_blocks']} blocks converted\n"
+            report += (f"- **{conversion['file']}**: {conversion['converted_blocks']}/{conversion['yaml_blocks']} "
+                       f"blocks converted ({conversion['seconds']:.3f}s)\n")
+        
+        conversion_seconds = sum(conversion['seconds'] for conversion in self.conversions)
+        report += f"""
+## Timing
+
+- **Run Wall Clock**: {self.run_seconds:.2f}s
+- **Per-File Conversion Total**: {conversion_seconds:.2f}s
+- **Files Resumed From Journal**: {self.stats['files_resumed']}
+- **Blocks Reused From Memo**: {self.stats['memo_hits']}
+
+**Slowest Files**:
+"""
+        slowest = sorted(self.conversions, key=lambda conversion: conversion['seconds'], reverse=True)
+        for conversion in slowest[:SLOWEST_FILES_REPORTED]:
+            report += f"- {conversion['seconds']:.3f}s - {conversion['file']}\n"
         
         report += f"""
 
@@ -339,6 +480,29 @@ Total files with YAML blocks: {len(self.conversions)}
         
         return report
 
+def write_atomically(file_path: Path, text: str) -> None:
+    """Replace a file's content without ever leaving it half written"""
+    fd, tmp_path = tempfile.mkstemp(prefix='.yaml-elimination-', suffix='.tmp', dir=file_path.parent)
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            f.write(text)
+        shutil.copymode(file_path, tmp_path)
+        os.replace(tmp_path, file_path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+# Worker-side converter; each pool process builds one at start-up
+_worker_converter = None
+
+def _init_worker(root_dir: str, conversion_memo: Dict[str, str]) -> None:
+    global _worker_converter
+    _worker_converter = YAMLConverter(root_dir)
+    _worker_converter.conversion_memo = conversion_memo
+
+def _convert_in_worker(file_path: Path) -> Dict[str, Any]:
+    return _worker_converter.convert_file(file_path)
+
 def main():
     parser = argparse.ArgumentParser(description='Enhanced YAML Elimination Tool')
     parser.add_argument('--root-dir', 
@@ -348,6 +512,10 @@ def main():
                        help='Show what would be converted without making changes')
     parser.add_argument('--report-only', action='store_true',
                        help='Generate report only without conversion')
+    parser.add_argument('--workers', type=int,
+                       help='Worker processes for conversion (default: CPU count)')
+    parser.add_argument('--restart', action='store_true',
+                       help='Ignore the journal of an interrupted run and start over')
     
     args = parser.parse_args()
     
@@ -372,7 +540,7 @@ def main():
         return
     
     # Process all files
-    converter.process_all_files()
+    converter.process_all_files(workers=args.workers, resume=not args.restart)
     
     # Generate and save report
     report = converter.generate_report()
@@ -384,7 +552,8 @@ def main():
     
     print(f"YAML elimination complete. Report saved to: {report_path}")
     print(f"Processed {converter.stats['files_processed']} files")
-    print(f"Converted {converter.stats['yaml_blocks_converted']}/{converter.stats['yaml_blocks_found']} YAML blocks")
+    print(f"Converted {converter.stats['yaml_blocks_converted']}/{converter.stats['yaml_blocks_found']} YAML blocks "
+          f"in {converter.run_seconds:.2f}s")
 
 if __name__ == '__main__':
     main()
\ No newline at end of file
@@ -6,8 +6,13 @@ Complete the last 29 YAML blocks to achieve 100% completion
 
 import os
 import re
+import sys
 from pathlib import Path
 
+# Add utilities directory to path
+sys.path.append(str(Path(__file__).parent.parent / "utilities"))
+from code_fences import iter_yaml_blocks
+
 def escape_yaml_in_bash_commands(content):
     """Convert YAML references in bash commands to escaped versions"""
     # Pattern to find grep patterns looking for ```yaml
@@ -24,11 +29,8 @@ def escape_yaml_in_bash_commands(content):
 
 def convert_yaml_blocks_to_structured(content):
     """Convert remaining YAML blocks to structured format"""
-    # Pattern to match YAML blocks
-    yaml_pattern = r'```ya?ml\n(.*?)\n```'
-    
-    def replace_yaml_block(match):
-        yaml_content = match.group(1).strip()
+    def replace_yaml_block(yaml_content):
+        yaml_content = yaml_content.strip()
         
         # For simple configuration blocks
         if ':' in yaml_content and not yaml_content.startswith('-'):
@@ -60,8 +62,9 @@ def convert_yaml_blocks_to_structured(content):
         # For other content, convert to code block with annotation
         return f"**Configuration**:\n```\n{yaml_content}\n```"
     
-    # Replace YAML blocks
-    content = re.sub(yaml_pattern, replace_yaml_block, content, flags=re.DOTALL)
+    # Replace YAML blocks, last first so earlier offsets stay valid
+    for _, yaml_content, start_pos, end_pos in reversed(list(iter_yaml_blocks(content))):
+        content = content[:start_pos] + replace_yaml_block(yaml_content) + content[end_pos:]
     
     return content
 
@@ -6,7 +6,7 @@ Focus on main system files, excluding projects and backups
 """
 
 import os
-import re
+import sys
 import json
 import yaml
 from typing import List, Dict, Any, Tuple
@@ -14,6 +14,10 @@ from pathlib import Path
 from datetime import datetime
 import logging
 
+# Add utilities directory to path
+sys.path.append(str(Path(__file__).parent.parent / "utilities"))
+from code_fences import iter_yaml_blocks
+
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
@@ -28,17 +32,7 @@ def should_skip_file(file_path: str) -> bool:
 
 def extract_yaml_blocks(content: str) -> List[Tuple[str, str, int, int]]:
     """Extract YAML blocks with positions for replacement"""
-    blocks = []
-    pattern = r'```ya?ml\n(.*?)\n```'
-    
-    for match in re.finditer(pattern, content, re.DOTALL):
-        yaml_content = match.group(1)
-        start_pos = match.start()
-        end_pos = match.end()
-        full_block = match.group(0)
-        blocks.append((full_block, yaml_content, start_pos, end_pos))
-    
-    return blocks
+    return list(iter_yaml_blocks(content))
 
 def convert_yaml_to_structured(yaml_content: str) -> str:
     """Convert YAML content to structured markdown format"""
@@ -26,6 +26,18 @@ from typing import Dict, List, Any, Optional, Tuple
 import re
 import hashlib
 
+# Add enforcement directory to path for the shared log tailer
+sys.path.append(str(Path(__file__).parent.parent / "enforcement"))
+from log_tailer import LogTailer
+
+# Terms marking a log line as a failed execution
+FAILURE_TERMS = ['error', 'failed', 'exception']
+# Pattern registry categories whose log matches become issues
+LOG_ISSUE_CATEGORIES = [
+    ("script_failure_patterns", "script_failure", "Script failure detected in logs"),
+    ("performance_degradation_patterns", "performance_degradation", "Performance degradation detected in logs")
+]
+
 class SelfMaintenanceSystem:
     """
     Core self-maintenance system that provides autonomous system care
@@ -40,6 +52,7 @@ class SelfMaintenanceSystem:
         self.issue_detector = None
         self.auto_resolver = None
         self.predictive_analyzer = None
+        self.log_tailer = None
         
         # Maintenance state
         self.maintenance_state = {
@@ -561,20 +574,12 @@ class SelfMaintenanceSystem:
             # Check for recent failures
             results_dir = self.base_path / "results"
             if results_dir.exists():
-                log_files = list(results_dir.glob("**/*.log"))
-                recent_log_files = [f for f in log_files if (datetime.now() - datetime.fromtimestamp(f.stat().st_mtime)).total_seconds() < 3600]  # Last hour
-                
-                failure_count = 0
-                for log_file in recent_log_files:
-                    try:
-                        with open(log_file, 'r') as f:
-                            content = f.read()
-                            
-                        if any(error_term in content.lower() for error_term in ['error', 'failed', 'exception']):
-                            failure_count += 1
-                            
-                    except Exception:
-                        continue
+                # Logs with failing lines appended in the last hour
+                recent_counts = self.poll_logs()
+                failure_count = sum(
+                    1 for counts in recent_counts.values()
+                    if any(key.startswith("failure_terms:") for key in counts)
+                )
                 
                 script_status["recent_failures"] = failure_count
                 
@@ -1093,6 +1098,32 @@ exit 0
             self.logger.error(f"Failed to detect system issues: {e}")
             return []
     
+    def get_log_tailer(self) -> LogTailer:
+        """Shared tailer over the results logs, created on first use"""
+        if self.log_tailer is None:
+            registry = (self.issue_detector or {}).get("pattern_registry") or self.load_detection_patterns()
+            patterns = [(f"failure_terms:{term}", re.compile(re.escape(term), re.IGNORECASE))
+                        for term in FAILURE_TERMS]
+            for category, _, _ in LOG_ISSUE_CATEGORIES:
+                patterns.extend((f"{category}:{pattern}", re.compile(pattern, re.IGNORECASE))
+                                for pattern in registry.get(category, []))
+            self.log_tailer = LogTailer(
+                [self.base_path / "results"],
+                patterns,
+                state_path=self.base_path / "results" / "automation" / "log-tail-state.json"
+            )
+        return self.log_tailer
+    
+    def poll_logs(self) -> Dict[str, Dict[str, int]]:
+        """Read newly appended log lines; failing lines per log and pattern in the last hour"""
+        try:
+            tailer = self.get_log_tailer()
+            tailer.poll()
+            return tailer.failure_counts()
+        except Exception as e:
+            self.logger.error(f"Failed to poll logs: {e}")
+            return {}
+    
     def analyze_log_patterns(self) -> List[Dict[str, Any]]:
         """Analyze log files for issue patterns"""
         issues = []
@@ -1102,42 +1133,22 @@ exit 0
             if not results_dir.exists():
                 return issues
             
-            log_files = list(results_dir.glob("**/*.log"))
-            recent_logs = [f for f in log_files if (datetime.now() - datetime.fromtimestamp(f.stat().st_mtime)).total_seconds() < 3600]  # Last hour
-            
             patterns = self.issue_detector.get("pattern_registry", {})
+            recent_counts = self.poll_logs()
             
-            for log_file in recent_logs:
-                try:
-                    with open(log_file, 'r') as f:
-                        content = f.read()
-                    
-                    # Check for script failure patterns
-                    for pattern in patterns.get("script_failure_patterns", []):
-                        if re.search(pattern, content, re.IGNORECASE):
-                            issues.append({
-                                "type": "script_failure",
-                                "severity": "medium",
-                                "source": str(log_file),
-                                "pattern": pattern,
-                                "description": "Script failure detected in logs"
-                            })
-                            break  # One issue per log file
-                    
-                    # Check for performance degradation patterns
-                    for pattern in patterns.get("performance_degradation_patterns", []):
-                        if re.search(pattern, content, re.IGNORECASE):
+            for log_file, counts in recent_counts.items():
+                # One issue per log file and category, naming the first pattern found
+                for category, issue_type, description in LOG_ISSUE_CATEGORIES:
+                    for pattern in patterns.get(category, []):
+                        if f"{category}:{pattern}" in counts:
                             issues.append({
-                                "type": "performance_degradation",
+                                "type": issue_type,
                                 "severity": "medium",
-                                "source": str(log_file),
+                                "source": log_file,
                                 "pattern": pattern,
-                                "description": "Performance degradation detected in logs"
+                                "description": description
                             })
                             break
-                    
-                except Exception:
-                    continue
             
             return issues
             
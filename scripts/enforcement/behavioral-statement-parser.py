@@ -17,6 +17,10 @@ from typing import Dict, List, Optional, Any, Tuple
 from dataclasses import dataclass, asdict
 from pathlib import Path
 
+# Add enforcement directory to path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+from claude_md_cache import ClaudeMdParseCache, Section, section_id
+
 # Configuration
 PROJECT_ROOT = Path(__file__).parent.parent.parent
 CLAUDE_MD_PATH = PROJECT_ROOT / "CLAUDE.md"
@@ -80,6 +84,7 @@ class BehavioralStatementParser:
         self.db_path = str(DB_PATH)
         Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
         self.init_database()
+        self.parse_cache = ClaudeMdParseCache(claude_md_path, self.db_path, 'behavioral_statements')
         
         # Behavioral statement patterns
         self.statement_patterns = {
@@ -165,21 +170,39 @@ class BehavioralStatementParser:
             ''')
     
     def parse_claude_md(self) -> List[BehavioralStatement]:
-        """Parse CLAUDE.md for behavioral statements"""
+        """Parse CLAUDE.md for behavioral statements, re-scanning only changed sections"""
         if not os.path.exists(self.claude_md_path):
             logger.error(f"CLAUDE.md not found at {self.claude_md_path}")
             return []
         
         logger.info("Parsing CLAUDE.md for behavioral statements...")
         
-        with open(self.claude_md_path, 'r', encoding='utf-8') as f:
-            content = f.read()
+        delta = self.parse_cache.parse(self._parse_section_statements)
+        with sqlite3.connect(self.db_path) as conn:
+            self.parse_cache.commit(conn, delta)
         
-        lines = content.split('\n')
+        # Cached line numbers are section-relative; statement ids stay sequential
         statements = []
         statement_counter = 1
+        for section, items in delta.by_section:
+            for item in items:
+                fields = {key: value for key, value in item.items() if key not in ('id', 'line_offset')}
+                statements.append(BehavioralStatement(
+                    statement_id=f"STMT_{statement_counter:03d}_{item['statement_type']}",
+                    line_number=section.start_line + item['line_offset'],
+                    **fields
+                ))
+                statement_counter += 1
+        
+        logger.info(f"Found {len(statements)} behavioral statements")
+        return statements
+    
+    def _parse_section_statements(self, section: Section) -> List[Dict[str, Any]]:
+        """Parse behavioral statements from one CLAUDE.md section"""
+        items = []
+        section_ref = section_id(section)
         
-        for line_num, line in enumerate(lines, 1):
+        for line_offset, line in enumerate(section.text.split('\n')):
             for statement_type, pattern in self.statement_patterns.items():
                 matches = re.finditer(pattern, line, re.IGNORECASE)
                 
@@ -190,33 +213,21 @@ class BehavioralStatementParser:
                     principle_match = re.search(r'Principle #(\d+)', statement_text)
                     principle_number = principle_match.group(1) if principle_match else None
                     
-                    # Parse the statement
-                    parsed_action = self._parse_action(statement_text)
-                    enforcement_level = self._determine_enforcement_level(statement_type, statement_text)
-                    trigger_conditions = self._extract_trigger_conditions(statement_text)
-                    blocking_actions = self._extract_blocking_actions(statement_text, statement_type)
-                    auto_remediation = self._determine_auto_remediation(statement_text)
-                    context = self._determine_context(statement_text)
-                    
-                    statement = BehavioralStatement(
-                        statement_id=f"STMT_{statement_counter:03d}_{statement_type}",
-                        statement_type=statement_type,
-                        principle_number=principle_number,
-                        raw_text=statement_text,
-                        parsed_action=parsed_action,
-                        enforcement_level=enforcement_level,
-                        trigger_conditions=trigger_conditions,
-                        blocking_actions=blocking_actions,
-                        auto_remediation=auto_remediation,
-                        line_number=line_num,
-                        context=context
-                    )
-                    
-                    statements.append(statement)
-                    statement_counter += 1
-        
-        logger.info(f"Found {len(statements)} behavioral statements")
-        return statements
+                    items.append({
+                        'id': f"{section_ref}_{len(items) + 1:03d}",
+                        'line_offset': line_offset,
+                        'statement_type': statement_type,
+                        'principle_number': principle_number,
+                        'raw_text': statement_text,
+                        'parsed_action': self._parse_action(statement_text),
+                        'enforcement_level': self._determine_enforcement_level(statement_type, statement_text),
+                        'trigger_conditions': self._extract_trigger_conditions(statement_text),
+                        'blocking_actions': self._extract_blocking_actions(statement_text, statement_type),
+                        'auto_remediation': self._determine_auto_remediation(statement_text),
+                        'context': self._determine_context(statement_text)
+                    })
+        
+        return items
     
     def _parse_action(self, statement_text: str) -> str:
         """Parse action from statement text"""
@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+"""
+CLAUDE.md Parse Cache - Context Engineering
+Section-fingerprinted, incremental parsing of CLAUDE.md for the enforcement parsers
+
+CACHE MODEL:
+- CLAUDE.md is split at markdown headings into sections, each hashed
+- Parsed items are cached per section in the consumer's own database
+- Only sections whose hash changed (or that are new) are re-parsed
+- A parse yields a delta (added/modified/removed items) keyed by item id
+- The consumer applies its delta and the cache update in one transaction
+- The first parse into an empty cache is flagged, since the consumer may
+  hold results from before the cache (e.g. older id schemes) to retire
+- The section split itself is shared in-process by file signature
+"""
+
+import hashlib
+import json
+import os
+import re
+import sqlite3
+import threading
+import logging
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+HEADING_PATTERN = re.compile(r'^#{1,6}\s')
+
+Item = Dict[str, Any]  # JSON-serializable parse result with a unique id field
+
+
+@dataclass
+class Section:
+    """One heading-delimited slice of CLAUDE.md"""
+    key: str          # Heading text plus occurrence index, stable across moves
+    start_line: int   # 1-based line number of the section's first line
+    text: str
+    digest: str
+
+
+@dataclass
+class ParseDelta:
+    """Current items plus what changed since the cached parse"""
+    items: List[Item]
+    added: List[Item] = field(default_factory=list)
+    modified: List[Item] = field(default_factory=list)
+    removed: List[str] = field(default_factory=list)
+    sections_total: int = 0
+    sections_reparsed: int = 0
+    by_section: List[Tuple[Section, List[Item]]] = field(default_factory=list, repr=False)
+    reparsed: List[Tuple[str, str, List[Item]]] = field(default_factory=list, repr=False)
+    stale_sections: List[str] = field(default_factory=list, repr=False)
+    signature: Optional[Tuple[int, int]] = None
+    initial: bool = False  # No cached parse yet; stored results may predate the cache
+
+    @property
+    def changed(self) -> bool:
+        return bool(self.added or self.modified or self.removed)
+
+
+def section_id(section: Section) -> str:
+    """Short stable identifier derived from the section key"""
+    return hashlib.sha1(section.key.encode('utf-8')).hexdigest()[:8]
+
+
+def split_sections(content: str) -> List[Section]:
+    """Split markdown into sections at ATX headings"""
+    sections = []
+    occurrences: Dict[str, int] = {}
+    current_heading = ''
+    current_start = 1
+    current_lines: List[str] = []
+
+    def close_section():
+        occurrence = occurrences.get(current_heading, 0)
+        occurrences[current_heading] = occurrence + 1
+        text = '\n'.join(current_lines)
+        sections.append(Section(
+            key=f"{current_heading}#{occurrence}",
+            start_line=current_start,
+            text=text,
+            digest=hashlib.sha1(text.encode('utf-8')).hexdigest()
+        ))
+
+    # Split on '\n' only, matching how the parsers number lines
+    for line_number, line in enumerate(content.split('\n'), 1):
+        if HEADING_PATTERN.match(line) and (current_lines or current_heading):
+            close_section()
+            current_lines = []
+            current_start = line_number
+        if HEADING_PATTERN.match(line):
+            current_heading = line.strip()
+        current_lines.append(line)
+
+    if current_lines:
+        close_section()
+    return sections
+
+
+_split_cache: Dict[str, Tuple[Tuple[int, int], List[Section]]] = {}
+_split_lock = threading.Lock()
+
+
+def load_sections(claude_md_path: str) -> Optional[Tuple[Tuple[int, int], List[Section]]]:
+    """(file signature, sections), shared by every parser in the process"""
+    try:
+        stat = os.stat(claude_md_path)
+    except OSError:
+        return None
+    signature = (stat.st_mtime_ns, stat.st_size)
+
+    with _split_lock:
+        cached = _split_cache.get(claude_md_path)
+        if cached and cached[0] == signature:
+            return cached
+
+    with open(claude_md_path, 'r', encoding='utf-8') as f:
+        sections = split_sections(f.read())
+
+    with _split_lock:
+        _split_cache[claude_md_path] = (signature, sections)
+    return signature, sections
+
+
+class ClaudeMdParseCache:
+    """Per-section parse cache for one consumer, stored in its database"""
+
+    def __init__(self, claude_md_path: str, db_path: str, namespace: str, id_field: str = 'id'):
+        self.claude_md_path = claude_md_path
+        self.db_path = db_path
+        self.namespace = namespace
+        self.id_field = id_field
+        self.signature: Optional[Tuple[int, int]] = None
+        self._cached: Optional[Dict[str, Tuple[str, List[Item]]]] = None
+        self.init_database()
+
+    def init_database(self):
+        """Initialize the section cache table"""
+        with sqlite3.connect(self.db_path) as conn:
+            conn.execute('''
+                CREATE TABLE IF NOT EXISTS claude_md_sections (
+                    namespace TEXT NOT NULL,
+                    section_key TEXT NOT NULL,
+                    digest TEXT NOT NULL,
+                    items TEXT NOT NULL,
+                    PRIMARY KEY (namespace, section_key)
+                )
+            ''')
+
+    def is_current(self) -> bool:
+        """True when CLAUDE.md is unchanged since the last committed parse"""
+        try:
+            stat = os.stat(self.claude_md_path)
+        except OSError:
+            return False
+        return self.signature == (stat.st_mtime_ns, stat.st_size)
+
+    def parse(self, parse_section: Callable[[Section], List[Item]]) -> ParseDelta:
+        """Parse changed sections and diff the result against the cache"""
+        loaded = load_sections(self.claude_md_path)
+        if loaded is None:
+            logger.error(f"CLAUDE.md not found at {self.claude_md_path}")
+            return ParseDelta(items=[])
+        signature, sections = loaded
+
+        if self._cached is None:
+            self._cached = self._load_cached()
+        cached = self._cached
+        previous = {item[self.id_field]: item for _, items in cached.values() for item in items}
+
+        delta = ParseDelta(items=[], sections_total=len(sections), signature=signature, initial=not cached)
+        for section in sections:
+            entry = cached.get(section.key)
+            if entry and entry[0] == section.digest:
+                items = entry[1]
+            else:
+                items = parse_section(section)
+                delta.sections_reparsed += 1
+                delta.reparsed.append((section.key, section.digest, items))
+            delta.by_section.append((section, items))
+            delta.items.extend(items)
+
+        current_keys = {section.key for section in sections}
+        delta.stale_sections = [key for key in cached if key not in current_keys]
+
+        current = {item[self.id_field]: item for item in delta.items}
+        for item_id, item in current.items():
+            if item_id not in previous:
+                delta.added.append(item)
+            elif previous[item_id] != item:
+                delta.modified.append(item)
+        delta.removed = [item_id for item_id in previous if item_id not in current]
+
+        logger.info(f"CLAUDE.md [{self.namespace}]: {delta.sections_reparsed}/{delta.sections_total} sections "
+                    f"re-parsed, +{len(delta.added)} ~{len(delta.modified)} -{len(delta.removed)}")
+        return delta
+
+    def commit(self, conn: sqlite3.Connection, delta: ParseDelta):
+        """Store re-parsed sections using the caller's open transaction"""
+        conn.executemany(
+            'DELETE FROM claude_md_sections WHERE namespace = ? AND section_key = ?',
+            [(self.namespace, key) for key in delta.stale_sections]
+        )
+        conn.executemany(
+            'INSERT OR REPLACE INTO claude_md_sections (namespace, section_key, digest, items) '
+            'VALUES (?, ?, ?, ?)',
+            [(self.namespace, key, digest, json.dumps(items)) for key, digest, items in delta.reparsed]
+        )
+
+        # Mirror the committed state in memory
+        for key in delta.stale_sections:
+            self._cached.pop(key, None)
+        for key, digest, items in delta.reparsed:
+            self._cached[key] = (digest, items)
+        self.signature = delta.signature
+
+    def _load_cached(self) -> Dict[str, Tuple[str, List[Item]]]:
+        with sqlite3.connect(self.db_path) as conn:
+            rows = conn.execute(
+                'SELECT section_key, digest, items FROM claude_md_sections WHERE namespace = ?',
+                (self.namespace,)
+            ).fetchall()
+        return {key: (digest, json.loads(items)) for key, digest, items in rows}
@@ -9,22 +9,32 @@ import json
 import re
 import sys
 import os
+import math
+import heapq
+import pickle
 import sqlite3
 import time
 import threading
 import logging
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any, Tuple, Set
+from typing import Dict, List, Optional, Any, Tuple, Set, Iterable
+from collections import Counter
 from dataclasses import dataclass, asdict
 from pathlib import Path
 import subprocess
 
+# Add enforcement directory to path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+from write_behind import get_write_queue
+
 # Configuration
 PROJECT_ROOT = Path(__file__).parent.parent.parent
 COMMANDS_PATH = PROJECT_ROOT / "docs/commands"
 CLAUDE_COMMANDS_PATH = PROJECT_ROOT / ".claude/commands"
 DB_PATH = PROJECT_ROOT / "scripts/results/compliance/metrics/orchestration_enforcer.db"
 ORCHESTRATION_LOG = PROJECT_ROOT / "scripts/results/compliance/orchestration-enforcer.log"
+INVENTORY_SNAPSHOT_PATH = PROJECT_ROOT / "scripts/results/compliance/metrics/command_inventory.pickle"
+INVENTORY_SNAPSHOT_VERSION = 1
 
 # Thresholds
 COMMAND_UTILIZATION_THRESHOLD = 0.70  # 70% minimum
@@ -32,6 +42,57 @@ COMPLEXITY_THRESHOLD = 0.7
 MULTI_DOMAIN_THRESHOLD = 2
 MAX_SINGLE_COMMAND_COMPLEXITY = 0.5
 
+# Relevance ranking
+RELEVANT_COMMANDS_TOP_K = 10
+TERM_STEM_LENGTH = 6        # Tokens are truncated so verify/verification share a term
+NAME_TERM_BOOST = 3         # Command name tokens count as this many occurrences
+DOMAIN_MATCH_WEIGHT = 1.0   # Scaled by domain rarity: near-universal domains add ~0
+MAX_POSTINGS_PER_TERM = 32  # Impact-ordered postings are pruned to the strongest entries
+MIN_TERM_IDF = 0.1          # Terms/domains in ~90% of commands carry no ranking signal
+RANKING_CACHE_SIZE = 1024
+CORE_COMMAND_PRIOR = 0.5    # Meta commands stay relevant for every objective
+BM25_K1 = 1.2
+BM25_B = 0.75
+STOP_WORDS = {
+    'the', 'and', 'for', 'with', 'that', 'this', 'from', 'are', 'was', 'will',
+    'not', 'all', 'can', 'has', 'have', 'use', 'any', 'each', 'into', 'when'
+}
+TOKEN_PATTERN = re.compile(r'[a-z0-9]+')
+
+# Command categories an objective's domains make available; together they
+# form the utilization denominator (top-k ranking only orders suggestions)
+DOMAIN_CATEGORIES = {
+    'orchestration': 'orchestration',
+    'workflow': 'orchestration',
+    'verification': 'verification',
+    'validation': 'verification',
+    'analysis': 'intelligence',
+    'research': 'intelligence',
+    'development': 'executable',
+    'implementation': 'executable'
+}
+BEHAVIORAL_KEYWORDS = ['complex', 'comprehensive', 'systematic']
+
+# Objective analysis indicators
+OBJECTIVE_COMPLEXITY_INDICATORS = [
+    'comprehensive', 'systematic', 'complex', 'elaborate',
+    'multi-step', 'various', 'multiple', 'several',
+    'coordination', 'integration', 'orchestration',
+    'workflow', 'pipeline', 'end-to-end'
+]
+OBJECTIVE_DOMAIN_INDICATORS = {
+    'verification': ['verify', 'validate', 'test', 'check', 'compliance'],
+    'orchestration': ['orchestrate', 'coordinate', 'workflow', 'pipeline'],
+    'documentation': ['document', 'write', 'create docs', 'readme'],
+    'analysis': ['analyze', 'research', 'investigate', 'review'],
+    'development': ['develop', 'implement', 'create', 'build', 'code'],
+    'planning': ['plan', 'strategy', 'design', 'architecture'],
+    'intelligence': ['think', 'decide', 'cognitive', 'intelligent'],
+    'automation': ['automate', 'script', 'deploy', 'trigger'],
+    'quality': ['quality', 'standards', 'principles'],
+    'performance': ['optimize', 'performance', 'efficiency']
+}
+
 # Logging configuration
 logging.basicConfig(
     level=logging.INFO,
@@ -97,29 +158,207 @@ class OrchestrationViolation:
             'blocked': self.blocked
         }
 
+def extract_terms(text: str) -> List[str]:
+    """Lowercased, stemmed index terms with short tokens and stop words removed"""
+    return [
+        token[:TERM_STEM_LENGTH]
+        for token in TOKEN_PATTERN.findall(text.lower())
+        if len(token) >= 3 and token not in STOP_WORDS
+    ]
+
+def _iter_bits(bits: int) -> Iterable[int]:
+    """Yield the positions of set bits, lowest first"""
+    while bits:
+        lowest = bits & -bits
+        yield lowest.bit_length() - 1
+        bits ^= lowest
+
+class CommandIndex:
+    """Inverted index over command terms, domains and categories
+    
+    Terms map to impact-ordered (command id, BM25 weight) postings; domains
+    and categories map to bitsets of command ids. Ranking an objective walks
+    only the postings of its own terms, then tests domain and category bits
+    for the resulting candidates.
+    """
+    
+    def __init__(self, command_metadata: Dict[str, Dict[str, Any]],
+                 commands_by_category: Dict[str, List[str]]):
+        self.commands: List[str] = sorted(command_metadata)
+        self.postings: Dict[str, List[Tuple[int, float]]] = {}
+        self.domain_bits: Dict[str, int] = {}
+        self.domain_weights: Dict[str, float] = {}
+        self.category_bits: Dict[str, int] = {}
+        
+        ids = {name: command_id for command_id, name in enumerate(self.commands)}
+        lengths = [sum(command_metadata[name].get('terms', {}).values()) for name in self.commands]
+        average_length = (sum(lengths) / len(lengths)) if lengths and sum(lengths) else 1.0
+        document_frequency = Counter(
+            term for name in self.commands for term in command_metadata[name].get('terms', {})
+        )
+        total = len(self.commands)
+        
+        for command_id, name in enumerate(self.commands):
+            metadata = command_metadata[name]
+            length_norm = 1 - BM25_B + BM25_B * lengths[command_id] / average_length
+            for term, frequency in metadata.get('terms', {}).items():
+                idf = self._idf(total, document_frequency[term])
+                if idf < MIN_TERM_IDF:
+                    continue
+                weight = idf * frequency * (BM25_K1 + 1) / (frequency + BM25_K1 * length_norm)
+                self.postings.setdefault(term, []).append((command_id, weight))
+            for domain in metadata.get('domains', ()):
+                self.domain_bits[domain] = self.domain_bits.get(domain, 0) | (1 << command_id)
+        
+        for term, postings in self.postings.items():
+            postings.sort(key=lambda posting: -posting[1])
+            del postings[MAX_POSTINGS_PER_TERM:]
+        
+        for domain, bits in self.domain_bits.items():
+            idf = self._idf(total, bin(bits).count('1'))
+            if idf >= MIN_TERM_IDF:
+                self.domain_weights[domain] = DOMAIN_MATCH_WEIGHT * idf
+        
+        for category, names in commands_by_category.items():
+            for name in names:
+                if name in ids:
+                    self.category_bits[category] = self.category_bits.get(category, 0) | (1 << ids[name])
+        
+        self._ranking_cache: Dict[Tuple, List[Tuple[str, float]]] = {}
+    
+    @staticmethod
+    def _idf(total: int, document_frequency: int) -> float:
+        return math.log(1 + (total - document_frequency + 0.5) / (document_frequency + 0.5))
+    
+    def rank(self, objective: str, domains: Set[str], top_k: int = RELEVANT_COMMANDS_TOP_K,
+             boost_categories: Iterable[str] = ()) -> List[Tuple[str, float]]:
+        """Top-k (command, score) pairs for an objective, best first"""
+        terms = frozenset(extract_terms(objective))
+        key = (terms, frozenset(domains), top_k, tuple(boost_categories))
+        cached = self._ranking_cache.get(key)
+        if cached is not None:
+            return list(cached)
+        
+        scores: Dict[int, float] = {}
+        for term in terms:
+            for command_id, weight in self.postings.get(term, ()):
+                scores[command_id] = scores.get(command_id, 0.0) + weight
+        
+        # Meta commands, plus any boosted categories, are always candidates
+        prior_bits = 0
+        for category in ('cores', *boost_categories):
+            prior_bits |= self.category_bits.get(category, 0)
+        for command_id in _iter_bits(prior_bits):
+            scores[command_id] = scores.get(command_id, 0.0) + CORE_COMMAND_PRIOR
+        
+        domain_masks = [(self.domain_bits[domain], self.domain_weights[domain])
+                        for domain in domains if domain in self.domain_weights]
+        if domain_masks:
+            for command_id in scores:
+                for bits, weight in domain_masks:
+                    if bits >> command_id & 1:
+                        scores[command_id] += weight
+        
+        best = heapq.nlargest(top_k, scores.items(), key=lambda item: (item[1], -item[0]))
+        ranked = [(self.commands[command_id], round(score, 4)) for command_id, score in best]
+        
+        if len(self._ranking_cache) >= RANKING_CACHE_SIZE:
+            self._ranking_cache.clear()
+        self._ranking_cache[key] = ranked
+        return list(ranked)
+    
+    def count_in_categories(self, categories: Iterable[str]) -> int:
+        """Number of distinct commands in any of the given categories"""
+        bits = 0
+        for category in categories:
+            bits |= self.category_bits.get(category, 0)
+        return bin(bits).count('1')
+    
+    def to_state(self) -> Dict[str, Any]:
+        """Plain-data form of the index for the inventory snapshot"""
+        return {
+            'commands': self.commands,
+            'postings': self.postings,
+            'domain_bits': self.domain_bits,
+            'domain_weights': self.domain_weights,
+            'category_bits': self.category_bits
+        }
+    
+    @classmethod
+    def from_state(cls, state: Dict[str, Any]) -> 'CommandIndex':
+        index = cls.__new__(cls)
+        index.__dict__.update(state)
+        index._ranking_cache = {}
+        return index
+
 class CommandInventory:
-    """Manages available command inventory and categorization"""
+    """Manages available command inventory and categorization
     
-    def __init__(self):
+    The inventory is persisted as a snapshot of per-file metadata keyed by
+    path with an (mtime, size) manifest, plus the relevance index. Startup
+    loads the snapshot and revalidates it in the background, re-analyzing
+    only files that were added or changed since it was written.
+    """
+    
+    def __init__(self, background_revalidation: bool = True):
         self.commands_by_category = {}
         self.command_metadata = {}
+        self.index: Optional[CommandIndex] = None
         self.total_commands = 0
-        self.load_command_inventory()
+        self.file_records: Dict[str, Tuple[int, int, Dict[str, Any]]] = {}  # path -> (mtime_ns, size, metadata)
+        self.revalidation_thread = None
+        self._lock = threading.Lock()
+        
+        start_time = time.perf_counter()
+        if self._load_snapshot():
+            if background_revalidation:
+                self.revalidation_thread = threading.Thread(target=self.load_command_inventory)
+                self.revalidation_thread.daemon = True
+                self.revalidation_thread.start()
+            else:
+                self.load_command_inventory()
+        else:
+            self.load_command_inventory()
+        self.startup_seconds = time.perf_counter() - start_time
+    
+    def wait_until_validated(self, timeout: Optional[float] = None):
+        """Block until background revalidation of the snapshot has finished"""
+        if self.revalidation_thread:
+            self.revalidation_thread.join(timeout)
     
     def load_command_inventory(self):
-        """Load and categorize all available commands"""
-        logger.info("Loading command inventory...")
-        
-        # Load from .claude/commands directory
-        claude_commands = self._scan_directory(CLAUDE_COMMANDS_PATH)
-        docs_commands = self._scan_directory(COMMANDS_PATH)
-        
-        # Merge command lists
-        all_commands = {**claude_commands, **docs_commands}
-        self.total_commands = len(all_commands)
-        
-        # Categorize commands
-        self.commands_by_category = {
+        """Load and categorize all available commands, re-analyzing changed files only"""
+        with self._lock:
+            logger.info("Loading command inventory...")
+            
+            # Load from .claude/commands directory, then docs/commands
+            records: Dict[str, Tuple[int, int, Dict[str, Any]]] = {}
+            reanalyzed = 0
+            for directory in (CLAUDE_COMMANDS_PATH, COMMANDS_PATH):
+                for path, (mtime_ns, size) in self._scan_directory(directory).items():
+                    previous = self.file_records.get(path)
+                    if previous and previous[0] == mtime_ns and previous[1] == size:
+                        records[path] = previous
+                        continue
+                    metadata = self._extract_command_metadata(Path(path))
+                    reanalyzed += 1
+                    if metadata:
+                        records[path] = (mtime_ns, size, metadata)
+            
+            if records.keys() == self.file_records.keys() and not reanalyzed and self.index is not None:
+                logger.info(f"Command inventory snapshot is current ({self.total_commands} commands)")
+                return
+            
+            self.file_records = records
+            self._build_views()
+            self._save_snapshot()
+            
+            logger.info(f"Loaded {self.total_commands} commands across {len(self.commands_by_category)} categories "
+                        f"({reanalyzed} files analyzed)")
+    
+    def _build_views(self):
+        """Derive categories, metadata and the relevance index from file records"""
+        commands_by_category = {
             'behavioral': [],
             'executable': [],
             'cores': [],
@@ -131,27 +370,68 @@ class CommandInventory:
             'meta': []
         }
         
-        for command_path, metadata in all_commands.items():
+        command_metadata = {}
+        for command_path, (_, _, metadata) in self.file_records.items():
             category = self._categorize_command(command_path, metadata)
-            self.commands_by_category[category].append(metadata['name'])
-            self.command_metadata[metadata['name']] = metadata
+            commands_by_category[category].append(metadata['name'])
+            command_metadata[metadata['name']] = metadata
         
-        logger.info(f"Loaded {self.total_commands} commands across {len(self.commands_by_category)} categories")
+        self.commands_by_category = commands_by_category
+        self.command_metadata = command_metadata
+        self.total_commands = len(self.file_records)
+        self.index = CommandIndex(command_metadata, commands_by_category)
+    
+    def _load_snapshot(self) -> bool:
+        """Load the persisted inventory snapshot, returning False if unusable"""
+        try:
+            with open(INVENTORY_SNAPSHOT_PATH, 'rb') as f:
+                snapshot = pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError, ValueError):
+            return False
+        if not isinstance(snapshot, dict) or snapshot.get('version') != INVENTORY_SNAPSHOT_VERSION:
+            return False
+        
+        self.file_records = snapshot['files']
+        self.commands_by_category = snapshot['commands_by_category']
+        self.command_metadata = {
+            metadata['name']: metadata for _, _, metadata in self.file_records.values()
+        }
+        self.total_commands = len(self.file_records)
+        self.index = CommandIndex.from_state(snapshot['index'])
+        return True
+    
+    def _save_snapshot(self):
+        """Persist file records, categories and index atomically"""
+        try:
+            INVENTORY_SNAPSHOT_PATH.parent.mkdir(parents=True, exist_ok=True)
+            temp_path = INVENTORY_SNAPSHOT_PATH.with_suffix('.tmp')
+            with open(temp_path, 'wb') as f:
+                pickle.dump({
+                    'version': INVENTORY_SNAPSHOT_VERSION,
+                    'files': self.file_records,
+                    'commands_by_category': self.commands_by_category,
+                    'index': self.index.to_state()
+                }, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temp_path, INVENTORY_SNAPSHOT_PATH)
+        except OSError as e:
+            logger.warning(f"Could not persist command inventory snapshot: {e}")
     
-    def _scan_directory(self, directory: Path) -> Dict[str, Dict[str, Any]]:
-        """Scan directory for command files"""
-        commands = {}
+    def _scan_directory(self, directory: Path) -> Dict[str, Tuple[int, int]]:
+        """Scan directory for command files, returning path -> (mtime_ns, size)"""
+        manifest = {}
         
         if not directory.exists():
-            return commands
+            return manifest
         
         for cmd_file in directory.rglob("*.md"):
-            if cmd_file.is_file():
-                metadata = self._extract_command_metadata(cmd_file)
-                if metadata:
-                    commands[str(cmd_file)] = metadata
+            try:
+                stat = cmd_file.stat()
+            except OSError:
+                continue
+            if not os.path.isdir(cmd_file):
+                manifest[str(cmd_file)] = (stat.st_mtime_ns, stat.st_size)
         
-        return commands
+        return manifest
     
     def _extract_command_metadata(self, cmd_file: Path) -> Optional[Dict[str, Any]]:
         """Extract metadata from command file"""
@@ -173,6 +453,11 @@ class CommandInventory:
             complexity = self._analyze_complexity(content)
             domains = self._extract_domains(content, str(relative_path))
             
+            # Term frequencies for the relevance index, name tokens boosted
+            terms = Counter(extract_terms(content))
+            for term in extract_terms(command_name):
+                terms[term] += NAME_TERM_BOOST
+            
             return {
                 'name': command_name,
                 'path': str(relative_path),
@@ -182,7 +467,8 @@ class CommandInventory:
                 'content_length': len(content),
                 'has_orchestration': 'orchestrat' in content.lower(),
                 'has_verification': 'verif' in content.lower() or 'valid' in content.lower(),
-                'is_meta_command': command_name in ['context-eng', 'decision', 'thinking']
+                'is_meta_command': command_name in ['context-eng', 'decision', 'thinking'],
+                'terms': dict(terms)
             }
             
         except Exception as e:
@@ -266,40 +552,45 @@ class CommandInventory:
         
         return domains if domains else {'general'}
     
-    def get_relevant_commands(self, objective: str, domains: Set[str]) -> List[str]:
-        """Get commands relevant to objective and domains"""
-        relevant_commands = []
+    def get_relevant_commands(self, objective: str, domains: Set[str],
+                              top_k: int = RELEVANT_COMMANDS_TOP_K) -> List[str]:
+        """Get the top-k commands relevant to objective and domains, best first"""
+        return [name for name, _ in self.rank_commands(objective, domains, top_k)]
+    
+    def rank_commands(self, objective: str, domains: Set[str],
+                      top_k: int = RELEVANT_COMMANDS_TOP_K) -> List[Tuple[str, float]]:
+        """Score commands against an objective using the inverted index"""
         objective_lower = objective.lower()
         
-        # Always include meta commands for complex objectives
-        meta_commands = self.commands_by_category.get('cores', [])
-        relevant_commands.extend(meta_commands)
+        # Behavioral commands are favoured for complex objectives
+        boost_categories = ()
+        if any(keyword in objective_lower for keyword in BEHAVIORAL_KEYWORDS):
+            boost_categories = ('behavioral',)
         
-        # Add domain-specific commands
-        for domain in domains:
-            if domain in ['orchestration', 'workflow']:
-                relevant_commands.extend(self.commands_by_category.get('orchestration', []))
-            elif domain in ['verification', 'validation']:
-                relevant_commands.extend(self.commands_by_category.get('verification', []))
-            elif domain in ['analysis', 'research']:
-                relevant_commands.extend(self.commands_by_category.get('intelligence', []))
-            elif domain in ['development', 'implementation']:
-                relevant_commands.extend(self.commands_by_category.get('executable', []))
-        
-        # Add behavioral commands for complex objectives
-        if any(keyword in objective_lower for keyword in ['complex', 'comprehensive', 'systematic']):
-            relevant_commands.extend(self.commands_by_category.get('behavioral', []))
-        
-        return list(set(relevant_commands))  # Remove duplicates
+        return self.index.rank(objective, domains, top_k, boost_categories)
+    
+    def count_available_commands(self, objective: str, domains: Set[str]) -> int:
+        """Count the commands available to an objective: meta commands, the
+        categories of its domains, and behavioral commands when it is complex"""
+        categories = {'cores'}
+        categories.update(DOMAIN_CATEGORIES[domain] for domain in domains if domain in DOMAIN_CATEGORIES)
+        if any(keyword in objective.lower() for keyword in BEHAVIORAL_KEYWORDS):
+            categories.add('behavioral')
+        return self.index.count_in_categories(categories)
 
 class OrchestrationDatabase:
     """Database manager for orchestration enforcement"""
     
     def __init__(self, db_path: str):
         self.db_path = db_path
+        self.writes = get_write_queue()
         Path(db_path).parent.mkdir(parents=True, exist_ok=True)
         self.init_database()
     
+    def flush(self):
+        """Wait for queued writes so reads see every recorded row"""
+        self.writes.flush()
+    
     def init_database(self):
         """Initialize database tables"""
         with sqlite3.connect(self.db_path) as conn:
@@ -351,41 +642,39 @@ class OrchestrationDatabase:
     
     def insert_usage_pattern(self, pattern: CommandUsagePattern):
         """Insert command usage pattern"""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.execute('''
-                INSERT INTO usage_patterns 
-                (session_id, objective_complexity, domains_involved, commands_used, 
-                 command_count, total_available_commands, utilization_rate, is_compliant)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-            ''', (
-                pattern.session_id,
-                pattern.objective_complexity,
-                json.dumps(list(pattern.domains_involved)),
-                json.dumps(pattern.commands_used),
-                pattern.command_count,
-                pattern.total_available_commands,
-                pattern.utilization_rate,
-                pattern.is_compliant
-            ))
+        self.writes.submit(self.db_path, '''
+            INSERT INTO usage_patterns 
+            (session_id, objective_complexity, domains_involved, commands_used, 
+             command_count, total_available_commands, utilization_rate, is_compliant)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+        ''', (
+            pattern.session_id,
+            pattern.objective_complexity,
+            json.dumps(list(pattern.domains_involved)),
+            json.dumps(pattern.commands_used),
+            pattern.command_count,
+            pattern.total_available_commands,
+            pattern.utilization_rate,
+            pattern.is_compliant
+        ))
     
     def insert_violation(self, violation: OrchestrationViolation):
         """Insert orchestration violation"""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.execute('''
-                INSERT INTO orchestration_violations 
-                (session_id, violation_type, objective, expected_commands, 
-                 actual_commands, utilization_gap, severity, blocked)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-            ''', (
-                violation.session_id,
-                violation.violation_type,
-                violation.objective,
-                json.dumps(violation.expected_commands),
-                json.dumps(violation.actual_commands),
-                violation.utilization_gap,
-                violation.severity,
-                violation.blocked
-            ))
+        self.writes.submit(self.db_path, '''
+            INSERT INTO orchestration_violations 
+            (session_id, violation_type, objective, expected_commands, 
+             actual_commands, utilization_gap, severity, blocked)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+        ''', (
+            violation.session_id,
+            violation.violation_type,
+            violation.objective,
+            json.dumps(violation.expected_commands),
+            json.dumps(violation.actual_commands),
+            violation.utilization_gap,
+            violation.severity,
+            violation.blocked
+        ))
 
 class CommandOrchestrationEnforcer:
     """Main enforcement engine for command orchestration"""
@@ -399,26 +688,6 @@ class CommandOrchestrationEnforcer:
     
     def analyze_objective(self, objective: str) -> Tuple[float, Set[str]]:
         """Analyze objective complexity and domains"""
-        complexity_indicators = [
-            'comprehensive', 'systematic', 'complex', 'elaborate',
-            'multi-step', 'various', 'multiple', 'several',
-            'coordination', 'integration', 'orchestration',
-            'workflow', 'pipeline', 'end-to-end'
-        ]
-        
-        domain_indicators = {
-            'verification': ['verify', 'validate', 'test', 'check', 'compliance'],
-            'orchestration': ['orchestrate', 'coordinate', 'workflow', 'pipeline'],
-            'documentation': ['document', 'write', 'create docs', 'readme'],
-            'analysis': ['analyze', 'research', 'investigate', 'review'],
-            'development': ['develop', 'implement', 'create', 'build', 'code'],
-            'planning': ['plan', 'strategy', 'design', 'architecture'],
-            'intelligence': ['think', 'decide', 'cognitive', 'intelligent'],
-            'automation': ['automate', 'script', 'deploy', 'trigger'],
-            'quality': ['quality', 'standards', 'principles'],
-            'performance': ['optimize', 'performance', 'efficiency']
-        }
-        
         objective_lower = objective.lower()
         
         # Calculate complexity
@@ -428,12 +697,12 @@ class CommandOrchestrationEnforcer:
         complexity += min(len(objective) / 500, 0.2)
         
         # Complexity from indicators
-        complexity_matches = sum(1 for indicator in complexity_indicators if indicator in objective_lower)
+        complexity_matches = sum(1 for indicator in OBJECTIVE_COMPLEXITY_INDICATORS if indicator in objective_lower)
         complexity += min(complexity_matches * 0.15, 0.6)
         
         # Complexity from multiple domains
         involved_domains = set()
-        for domain, indicators in domain_indicators.items():
+        for domain, indicators in OBJECTIVE_DOMAIN_INDICATORS.items():
             if any(indicator in objective_lower for indicator in indicators):
                 involved_domains.add(domain)
         
@@ -449,15 +718,16 @@ class CommandOrchestrationEnforcer:
         
         # Get relevant commands for this objective
         relevant_commands = self.inventory.get_relevant_commands(objective, domains)
+        available_commands = self.inventory.count_available_commands(objective, domains)
         
-        # Calculate utilization rate
-        utilization_rate = len(commands_used) / max(len(relevant_commands), 1)
+        # Calculate utilization rate against every command available to the objective
+        utilization_rate = len(commands_used) / max(available_commands, 1)
         
         # Determine if orchestration is required
         orchestration_required = (
             complexity >= COMPLEXITY_THRESHOLD or
             len(domains) >= MULTI_DOMAIN_THRESHOLD or
-            len(relevant_commands) > 3
+            available_commands > 3
         )
         
         # Check compliance
@@ -483,7 +753,7 @@ class CommandOrchestrationEnforcer:
             domains_involved=domains,
             commands_used=commands_used,
             command_count=len(commands_used),
-            total_available_commands=len(relevant_commands),
+            total_available_commands=available_commands,
             utilization_rate=utilization_rate,
             is_compliant=is_compliant
         )
@@ -511,7 +781,7 @@ class CommandOrchestrationEnforcer:
             
             logger.warning(f"Orchestration violation detected: {violation_type}")
             logger.warning(f"Utilization: {utilization_rate:.2%} (required: {COMMAND_UTILIZATION_THRESHOLD:.2%})")
-            logger.warning(f"Commands used: {len(commands_used)}, Relevant: {len(relevant_commands)}")
+            logger.warning(f"Commands used: {len(commands_used)}, Available: {available_commands}")
         
         return is_compliant, violation
     
@@ -585,6 +855,7 @@ class CommandOrchestrationEnforcer:
     
     def get_enforcement_stats(self) -> Dict[str, Any]:
         """Get enforcement statistics"""
+        self.db.flush()
         with sqlite3.connect(self.db.db_path) as conn:
             cursor = conn.cursor()
             
@@ -631,10 +902,35 @@ class CommandOrchestrationEnforcer:
                 ]
             }
 
+def benchmark_startup(iterations: int = 5) -> Dict[str, float]:
+    """Compare a cold full inventory scan with a snapshot warm start"""
+    cold_times = []
+    warm_times = []
+    for _ in range(iterations):
+        start_time = time.perf_counter()
+        cold = CommandInventory.__new__(CommandInventory)
+        cold.file_records = {}
+        cold.index = None
+        cold._lock = threading.Lock()
+        cold.load_command_inventory()
+        cold_times.append(time.perf_counter() - start_time)
+        
+        warm = CommandInventory(background_revalidation=True)
+        warm_times.append(warm.startup_seconds)
+        warm.wait_until_validated()
+    
+    cold_ms = sorted(cold_times)[len(cold_times) // 2] * 1000
+    warm_ms = sorted(warm_times)[len(warm_times) // 2] * 1000
+    return {
+        'cold_startup_ms': cold_ms,
+        'warm_startup_ms': warm_ms,
+        'speedup': cold_ms / warm_ms if warm_ms > 0 else 0.0
+    }
+
 def main():
     """Main function for CLI usage"""
     if len(sys.argv) < 2:
-        print("Usage: python command-orchestration-enforcer.py {start|stop|check|stats|inventory}")
+        print("Usage: python command-orchestration-enforcer.py {start|stop|check|stats|inventory|startup}")
         sys.exit(1)
     
     command = sys.argv[1]
@@ -693,6 +989,7 @@ def main():
             print(f"  {violation['type']}: {violation['count']} (avg gap: {violation['avg_gap']:.2%})")
     
     elif command == 'inventory':
+        enforcer.inventory.wait_until_validated()
         print("Command Inventory:")
         for category, commands in enforcer.inventory.commands_by_category.items():
             print(f"  {category.title()}: {len(commands)} commands")
@@ -701,6 +998,13 @@ def main():
             if len(commands) > 3:
                 print(f"    ... and {len(commands) - 3} more")
     
+    elif command == 'startup':
+        results = benchmark_startup()
+        print("Command Inventory Startup:")
+        print(f"Cold full scan: {results['cold_startup_ms']:.1f}ms")
+        print(f"Snapshot warm start: {results['warm_startup_ms']:.1f}ms")
+        print(f"Speedup: {results['speedup']:.1f}x")
+    
     else:
         print(f"Unknown command: {command}")
         sys.exit(1)
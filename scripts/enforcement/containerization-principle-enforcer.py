@@ -8,13 +8,21 @@ Integrates with Claude Code execution to ensure containerization compliance.
 
 import os
 import sys
+import glob
 import json
+import time
+import argparse
 import subprocess
 import re
 import yaml
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Tuple, Optional
-from dataclasses import dataclass
+from typing import Dict, Iterable, List, Tuple, Optional
+from dataclasses import dataclass, field
+
+WORKFLOW_SUFFIXES = ('.yml', '.yaml')
+MAX_PROJECT_WORKERS = 32  # Snapshots are I/O bound; threads mostly wait on the filesystem
 
 @dataclass
 class EnforcementResult:
@@ -26,6 +34,54 @@ class EnforcementResult:
     remediation: Optional[str] = None
     blocking: bool = False
 
+@dataclass
+class ProjectSnapshot:
+    """One-shot view of a project root for the principle checks
+    
+    The root (and .github/workflows, when present) is listed with a single
+    scandir each; files are read at most once, on first use.
+    """
+    root: Path
+    entries: Dict[str, bool] = field(default_factory=dict)  # Root entry name -> is file
+    has_workflows_dir: bool = False
+    workflows: List[str] = field(default_factory=list)      # Workflow file names, sorted
+    _contents: Dict[str, str] = field(default_factory=dict, repr=False)
+    
+    @classmethod
+    def capture(cls, root: Path) -> "ProjectSnapshot":
+        snapshot = cls(root=Path(root))
+        with os.scandir(snapshot.root) as listing:
+            for entry in listing:
+                snapshot.entries[entry.name] = entry.is_file()
+        if '.github' in snapshot.entries:
+            try:
+                with os.scandir(snapshot.root / ".github" / "workflows") as listing:
+                    snapshot.workflows = sorted(
+                        entry.name for entry in listing
+                        if entry.name.endswith(WORKFLOW_SUFFIXES) and entry.is_file()
+                    )
+                snapshot.has_workflows_dir = True
+            except (FileNotFoundError, NotADirectoryError):
+                pass
+        return snapshot
+    
+    def exists(self, name: str) -> bool:
+        return name in self.entries
+    
+    def read(self, relative_path: str) -> str:
+        """File content, read on first request and cached"""
+        if relative_path not in self._contents:
+            self._contents[relative_path] = (self.root / relative_path).read_text()
+        return self._contents[relative_path]
+    
+    def workflow_contents(self) -> Iterable[str]:
+        for name in self.workflows:
+            yield self.read(f".github/workflows/{name}")
+
+def _mapping(value) -> Dict:
+    """A compose section as a dict; missing or malformed sections count as empty"""
+    return value if isinstance(value, dict) else {}
+
 class ContainerizationEnforcer:
     """
     Enforcement engine for containerization principles #101-104
@@ -33,11 +89,14 @@ class ContainerizationEnforcer:
     
     def __init__(self, project_path: str = "."):
         self.project_path = Path(project_path)
+        self.snapshot: Optional[ProjectSnapshot] = None
         self.results: List[EnforcementResult] = []
         
     def enforce_all_principles(self) -> List[EnforcementResult]:
         """Execute all containerization principle enforcement"""
         self.results = []
+        # Every principle checks against the same snapshot of the project
+        self.snapshot = ProjectSnapshot.capture(self.project_path)
         
         # Principle #101: Container-First Development
         self.results.extend(self._enforce_principle_101())
@@ -58,8 +117,7 @@ class ContainerizationEnforcer:
         results = []
         
         # Check for Dockerfile presence
-        dockerfile_path = self.project_path / "Dockerfile"
-        if not dockerfile_path.exists():
+        if not self.snapshot.exists("Dockerfile"):
             results.append(EnforcementResult(
                 principle_id="101",
                 compliant=False,
@@ -70,7 +128,7 @@ class ContainerizationEnforcer:
             ))
         else:
             # Validate Dockerfile compliance
-            dockerfile_content = dockerfile_path.read_text()
+            dockerfile_content = self.snapshot.read("Dockerfile")
             
             # Check for multi-stage build
             if "FROM" not in dockerfile_content or dockerfile_content.count("FROM") < 2:
@@ -83,8 +141,7 @@ class ContainerizationEnforcer:
                 ))
         
         # Check for docker-compose.yml
-        compose_path = self.project_path / "docker-compose.yml"
-        if not compose_path.exists():
+        if not self.snapshot.exists("docker-compose.yml"):
             results.append(EnforcementResult(
                 principle_id="101",
                 compliant=False,
@@ -94,8 +151,7 @@ class ContainerizationEnforcer:
             ))
         
         # Check for .dockerignore
-        dockerignore_path = self.project_path / ".dockerignore"
-        if not dockerignore_path.exists():
+        if not self.snapshot.exists(".dockerignore"):
             results.append(EnforcementResult(
                 principle_id="101", 
                 compliant=False,
@@ -119,11 +175,10 @@ class ContainerizationEnforcer:
         """Principle #102: Multi-Architecture Container Support"""
         results = []
         
-        dockerfile_path = self.project_path / "Dockerfile"
-        if not dockerfile_path.exists():
+        if not self.snapshot.exists("Dockerfile"):
             return results  # Will be caught by #101
             
-        dockerfile_content = dockerfile_path.read_text()
+        dockerfile_content = self.snapshot.read("Dockerfile")
         
         # Check for platform-aware builds
         if "--platform=" not in dockerfile_content and "BUILDPLATFORM" not in dockerfile_content:
@@ -136,13 +191,10 @@ class ContainerizationEnforcer:
             ))
         
         # Check for BuildKit usage in CI/CD
-        github_workflows = self.project_path / ".github" / "workflows"
-        if github_workflows.exists():
-            workflow_files = list(github_workflows.glob("*.yml")) + list(github_workflows.glob("*.yaml"))
+        if self.snapshot.has_workflows_dir:
             multi_arch_found = False
             
-            for workflow_file in workflow_files:
-                content = workflow_file.read_text()
+            for content in self.snapshot.workflow_contents():
                 if "linux/amd64,linux/arm64" in content or "buildx" in content:
                     multi_arch_found = True
                     break
@@ -170,11 +222,10 @@ class ContainerizationEnforcer:
         """Principle #103: Container Security Hardening Protocol"""
         results = []
         
-        dockerfile_path = self.project_path / "Dockerfile"
-        if not dockerfile_path.exists():
+        if not self.snapshot.exists("Dockerfile"):
             return results  # Will be caught by #101
             
-        dockerfile_content = dockerfile_path.read_text()
+        dockerfile_content = self.snapshot.read("Dockerfile")
         
         # Check for non-root user
         if "USER " not in dockerfile_content or "USER root" in dockerfile_content:
@@ -215,13 +266,10 @@ class ContainerizationEnforcer:
                 ))
         
         # Check for security scanning in CI/CD
-        github_workflows = self.project_path / ".github" / "workflows"
-        if github_workflows.exists():
-            workflow_files = list(github_workflows.glob("*.yml")) + list(github_workflows.glob("*.yaml"))
+        if self.snapshot.has_workflows_dir:
             security_scan_found = False
             
-            for workflow_file in workflow_files:
-                content = workflow_file.read_text()
+            for content in self.snapshot.workflow_contents():
                 if any(tool in content.lower() for tool in ['docker scout', 'trivy', 'snyk']):
                     security_scan_found = True
                     break
@@ -249,11 +297,10 @@ class ContainerizationEnforcer:
         """Principle #104: Container Performance Optimization Standards"""
         results = []
         
-        dockerfile_path = self.project_path / "Dockerfile"
-        if not dockerfile_path.exists():
+        if not self.snapshot.exists("Dockerfile"):
             return results  # Will be caught by #101
             
-        dockerfile_content = dockerfile_path.read_text()
+        dockerfile_content = self.snapshot.read("Dockerfile")
         
         # Check for BuildKit cache mounts
         if "--mount=type=cache" not in dockerfile_content:
@@ -287,16 +334,19 @@ class ContainerizationEnforcer:
             ))
         
         # Check docker-compose for resource limits
-        compose_path = self.project_path / "docker-compose.yml"
-        if compose_path.exists():
+        if self.snapshot.exists("docker-compose.yml"):
             try:
-                compose_content = yaml.safe_load(compose_path.read_text())
-                services = compose_content.get('services', {})
-                
+                compose_content = yaml.safe_load(self.snapshot.read("docker-compose.yml"))
+            except yaml.YAMLError:
+                compose_content = None
+            # An empty file loads as None; anything but a mapping of services is unusable
+            services = compose_content.get('services', {}) if isinstance(compose_content, dict) else None
+            
+            if isinstance(services, dict):
                 for service_name, service_config in services.items():
-                    deploy = service_config.get('deploy', {})
-                    resources = deploy.get('resources', {})
-                    limits = resources.get('limits', {})
+                    deploy = _mapping(_mapping(service_config).get('deploy'))
+                    resources = _mapping(deploy.get('resources'))
+                    limits = _mapping(resources.get('limits'))
                     
                     if not limits.get('memory') or not limits.get('cpus'):
                         results.append(EnforcementResult(
@@ -306,7 +356,7 @@ class ContainerizationEnforcer:
                             message=f"⚠️ Service '{service_name}' missing resource limits",
                             remediation="Add memory and CPU limits in docker-compose.yml deploy.resources.limits"
                         ))
-            except yaml.YAMLError:
+            else:
                 results.append(EnforcementResult(
                     principle_id="104",
                     compliant=False,
@@ -354,18 +404,57 @@ class ContainerizationEnforcer:
             "compliant_principles": [r.principle_id for r in self.results if r.compliant]
         }
 
-def main():
-    """Main enforcement execution"""
-    if len(sys.argv) > 1:
-        project_path = sys.argv[1]
-    else:
-        project_path = "."
+def expand_project_roots(specs: Iterable[str]) -> List[Path]:
+    """Project directories named by paths or glob patterns, deduplicated, in order"""
+    roots = []
+    seen = set()
+    for spec in specs:
+        matches = sorted(glob.glob(spec)) if glob.has_magic(spec) else [spec]
+        for match in matches:
+            path = Path(match)
+            key = path.resolve()
+            if path.is_dir() and key not in seen:
+                seen.add(key)
+                roots.append(path)
+    return roots
+
+def _enforce_project(project_path: Path) -> Dict:
+    # One unreadable or malformed project must not abort the whole sweep
+    try:
+        enforcer = ContainerizationEnforcer(str(project_path))
+        enforcer.enforce_all_principles()
+        report = enforcer.generate_enforcement_report()
+    except Exception as e:
+        return {"project": str(project_path), "error": f"{type(e).__name__}: {e}"}
+    report["project"] = str(project_path)
+    return report
+
+def enforce_projects(project_paths: Iterable[Path], max_workers: Optional[int] = None) -> Dict:
+    """Audit many projects in one sweep; each is snapshotted and checked concurrently"""
+    start_time = time.time()
+    project_paths = list(project_paths)
+    workers = max_workers or min(MAX_PROJECT_WORKERS, (os.cpu_count() or 1) * 4)
     
-    enforcer = ContainerizationEnforcer(project_path)
-    results = enforcer.enforce_all_principles()
-    report = enforcer.generate_enforcement_report()
+    with ThreadPoolExecutor(max_workers=max(1, min(workers, len(project_paths) or 1))) as executor:
+        reports = list(executor.map(_enforce_project, project_paths))
+    
+    audited = [r for r in reports if "error" not in r]
+    blocked = [r["project"] for r in audited if r["enforcement_status"] == "BLOCKING"]
+    warning = [r["project"] for r in audited if r["enforcement_status"] == "WARNING"]
     
-    # P56 Transparency: Visual enforcement feedback
+    return {
+        "timestamp": datetime.now().isoformat(),
+        "projects_audited": len(audited),
+        "projects_failed": len(reports) - len(audited),
+        "blocked_projects": blocked,
+        "warning_projects": warning,
+        "compliant_projects": len(audited) - len(blocked) - len(warning),
+        "sweep_seconds": round(time.time() - start_time, 3),
+        "projects": reports
+    }
+
+def _print_project_report(report: Dict) -> None:
+    """P56 Transparency: Visual enforcement feedback for one project"""
     print("🔒 Containerization Principle Enforcement Report")
     print("=" * 60)
     print(f"📊 Compliance Score: {report['compliance_score']}")
@@ -385,6 +474,22 @@ def main():
     # Display compliant principles
     if report['compliant_principles']:
         print("✅ Compliant Principles:", ", ".join([f"#{p}" for p in report['compliant_principles']]))
+
+def main():
+    """Main enforcement execution"""
+    parser = argparse.ArgumentParser(description="Containerization principle enforcement (#101-104)")
+    parser.add_argument("projects", nargs="*", default=["."],
+                        help="Project roots or glob patterns (e.g. 'worktrees/*'); several enable multi-project mode")
+    parser.add_argument("--workers", type=int, help=f"Concurrent project audits (default: up to {MAX_PROJECT_WORKERS})")
+    args = parser.parse_args()
+    
+    if len(args.projects) > 1 or any(glob.has_magic(spec) for spec in args.projects):
+        sys.exit(_run_multi_project(args.projects, args.workers))
+    
+    enforcer = ContainerizationEnforcer(args.projects[0])
+    enforcer.enforce_all_principles()
+    report = enforcer.generate_enforcement_report()
+    _print_project_report(report)
     
     # Save report for dashboard integration
     report_path = Path("scripts/results/enforcement/containerization-enforcement-report.json")
@@ -395,12 +500,47 @@ def main():
     if report['blocking_violations'] > 0:
         print("\n🚨 EXECUTION BLOCKED: Resolve blocking violations before proceeding")
         sys.exit(1)
-    elif report['compliance_score'] < 90:
+    elif float(report['compliance_score'].rstrip('%')) < 90:
         print(f"\n⚠️ WARNING: Compliance score {report['compliance_score']} below 90% threshold")
         sys.exit(2)
     else:
         print("\n✅ All containerization principles compliant")
         sys.exit(0)
 
+def _run_multi_project(specs: List[str], workers: Optional[int]) -> int:
+    """Sweep every matching project; returns the exit code for the worst project"""
+    project_paths = expand_project_roots(specs)
+    if not project_paths:
+        print(f"❌ No project directories match: {' '.join(specs)}")
+        return 1
+    
+    summary = enforce_projects(project_paths, workers)
+    
+    print("🔒 Containerization Multi-Project Enforcement Report")
+    print("=" * 60)
+    print(f"📁 Projects Audited: {summary['projects_audited']} in {summary['sweep_seconds']:.2f}s")
+    print(f"🚨 Blocked: {len(summary['blocked_projects'])}")
+    print(f"⚠️  Warning: {len(summary['warning_projects'])}")
+    print(f"✅ Compliant: {summary['compliant_projects']}")
+    if summary['projects_failed']:
+        print(f"❌ Failed: {summary['projects_failed']}")
+    print()
+    for report in summary['projects']:
+        if "error" in report:
+            print(f"❌ {report['project']}: {report['error']}")
+        else:
+            print(f"{report['enforcement_status']:>10}  {report['compliance_score']:>6}  {report['project']}")
+    
+    # Save report for dashboard integration
+    report_path = Path("scripts/results/enforcement/containerization-multi-project-report.json")
+    report_path.parent.mkdir(parents=True, exist_ok=True)
+    report_path.write_text(json.dumps(summary, indent=2))
+    
+    if summary['blocked_projects'] or summary['projects_failed']:
+        return 1
+    if summary['warning_projects']:
+        return 2
+    return 0
+
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -7,6 +7,7 @@ Enforces ≥75% character reduction and ≤0.8 second comprehension time
 
 import json
 import re
+import hashlib
 import sys
 import os
 import sqlite3
@@ -14,11 +15,16 @@ import time
 import threading
 import logging
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any, Tuple
+from typing import Dict, List, Optional, Any, Tuple, Iterable, Set
 from dataclasses import dataclass, asdict
 from pathlib import Path
 import math
 
+# Add enforcement directory to path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+from write_behind import get_write_queue
+from pattern_set import PatternSet
+
 # Configuration
 PROJECT_ROOT = Path(__file__).parent.parent.parent
 DB_PATH = PROJECT_ROOT / "scripts/results/compliance/metrics/density_enforcer.db"
@@ -30,6 +36,18 @@ MAX_COMPREHENSION_TIME = 0.8     # 0.8 seconds maximum
 MIN_VALUE_PER_TOKEN = 0.6        # 60% minimum value per token
 VERBOSE_PATTERN_THRESHOLD = 3    # Maximum verbose patterns allowed
 
+# Streaming analysis
+STREAM_CHUNK_SIZE = 1024 * 1024  # Characters read per chunk
+STREAM_OVERLAP = 4096            # Lookahead kept for verbose matches spanning chunks
+MAX_TOKEN_LENGTH = 64 * 1024     # Longest whitespace-free run held back between chunks
+SKETCH_WIDTH_BITS = 22           # 4M counters per sketch row, the most a sketch is given
+MIN_SKETCH_WIDTH_BITS = 10       # 1K counters per sketch row for short texts
+HASH_MASK = (1 << 64) - 1
+
+# Tokenization
+SENTENCE_PATTERN = re.compile(r'[.!?]+')
+NON_WORD_PATTERN = re.compile(r'[^\w\s]')
+
 # Logging configuration
 logging.basicConfig(
     level=logging.INFO,
@@ -101,14 +119,322 @@ class DensityViolation:
             'blocked': self.blocked
         }
 
+@dataclass
+class TextProfile:
+    """Tokens and counts shared by every density metric, computed once per text"""
+    character_count: int
+    meaningful_characters: int
+    word_count: int
+    sentence_count: int
+    verbose_patterns_count: int
+    unique_words: int              # Distinct lowercased words
+    unique_meaningful_words: int   # Distinct lowercased alphabetic words longer than 2
+    repeated_phrases: int          # 3-word phrases seen before, original case
+    repeated_lower_phrases: int    # 3-word phrases seen before, lowercased
+
+class VerbosePatternMatcher:
+    """Weighted verbose pattern count from one combined regex scan
+    
+    The pattern set's alternation finds every position where any pattern
+    matches; each pattern is then anchored at those positions only,
+    reproducing the non-overlapping matches re.findall would return for it.
+    """
+    
+    def __init__(self, patterns: List[Tuple[str, str, float, str]]):
+        self.patterns = []
+        for pattern_type, regex, weight, description in patterns:
+            try:
+                self.patterns.append((re.compile(regex, re.IGNORECASE), weight))
+            except re.error as e:
+                logger.error(f"Invalid verbose pattern {pattern_type}: {e}")
+        self.pattern_set = PatternSet([(i, compiled) for i, (compiled, _) in enumerate(self.patterns)])
+    
+    def count(self, text_lower: str) -> int:
+        """Weighted number of verbose pattern matches"""
+        match_counts = [0] * len(self.patterns)
+        if self.pattern_set.combined is None:
+            separate = range(len(self.patterns))
+        else:
+            separate = self.scan(text_lower, match_counts, [0] * len(self.patterns))
+        
+        for i in separate:
+            match_counts[i] = len(self.patterns[i][0].findall(text_lower))
+        return self.weighted_count(match_counts)
+    
+    def scan(self, text_lower: str, match_counts: List[int], last_end: List[int],
+             begin: int = 0, end: Optional[int] = None, offset: int = 0) -> List[int]:
+        """Count matches starting in text_lower[begin:end] into match_counts
+        
+        last_end holds each pattern's previous match end in absolute
+        positions (buffer index + offset), so scanning can resume across
+        consecutive buffers. Returns the patterns that matched empty, whose
+        counts must come from findall instead.
+        """
+        # By default include an empty match at the very end of the text
+        end = len(text_lower) + 1 if end is None else end
+        if self.pattern_set.combined is None:
+            return self._scan_separately(text_lower, match_counts, last_end, begin, end, offset)
+        
+        separate = []
+        for start in self.pattern_set.candidates(text_lower, begin, end):
+            for i, (compiled, _) in enumerate(self.patterns):
+                if start + offset < last_end[i]:
+                    continue
+                match = compiled.match(text_lower, start)
+                if match:
+                    if match.end() == start:
+                        # Empty matches follow findall's own advance rules
+                        separate.append(i)
+                        last_end[i] = math.inf
+                        continue
+                    match_counts[i] += 1
+                    last_end[i] = match.end() + offset
+        return separate
+    
+    def _scan_separately(self, text_lower: str, match_counts: List[int], last_end: List[int],
+                         begin: int, end: int, offset: int) -> List[int]:
+        separate = []
+        for i, (compiled, _) in enumerate(self.patterns):
+            position = max(begin, last_end[i] - offset)
+            if position >= end:
+                continue
+            for match in compiled.finditer(text_lower, position):
+                if match.start() >= end:
+                    break
+                if match.end() == match.start():
+                    separate.append(i)
+                    last_end[i] = math.inf
+                    break
+                match_counts[i] += 1
+                last_end[i] = match.end() + offset
+        return separate
+    
+    def weighted_count(self, match_counts: List[int]) -> int:
+        count = 0
+        for (_, weight), matches in zip(self.patterns, match_counts):
+            count += matches * weight
+        return int(count)
+
+class CountMinSketch:
+    """Fixed-memory frequency estimates for 64-bit hashes
+    
+    Four rows of saturating byte cells, indexed by double hashing and
+    updated conservatively. Estimates never undercount; an unseen key
+    reads non-zero with probability about (1 - exp(-distinct_keys / width)) ** 4.
+    """
+    
+    MIX = 0x9E3779B97F4A7C15
+    
+    def __init__(self, width_bits: int = SKETCH_WIDTH_BITS):
+        self.width_bits = width_bits
+        self.mask = (1 << width_bits) - 1
+        self.cells = bytearray(4 << width_bits)
+        self.row_offsets = (1 << width_bits, 2 << width_bits, 3 << width_bits)
+    
+    @staticmethod
+    def width_bits_for(distinct_keys: int) -> int:
+        """Row width giving at least four cells per key, within the sketch limits"""
+        return max(MIN_SKETCH_WIDTH_BITS, min(SKETCH_WIDTH_BITS, (4 * distinct_keys - 1).bit_length()))
+    
+    def add(self, key_hash: int) -> int:
+        """Count one occurrence, returning the estimate from before it"""
+        mixed = (key_hash * self.MIX) & HASH_MASK
+        mask = self.mask
+        step = (mixed >> self.width_bits) | 1
+        first = mixed & mask
+        second = self.row_offsets[0] + ((first + step) & mask)
+        third = self.row_offsets[1] + ((first + 2 * step) & mask)
+        fourth = self.row_offsets[2] + ((first + 3 * step) & mask)
+        
+        cells = self.cells
+        estimate = min(cells[first], cells[second], cells[third], cells[fourth])
+        if estimate < 255:
+            for cell in (first, second, third, fourth):
+                if cells[cell] == estimate:
+                    cells[cell] = estimate + 1
+        return estimate
+
+class RollingNgramHash:
+    """Polynomial rolling hash over the last n token hashes"""
+    
+    BASE = 0x100000001B3
+    
+    def __init__(self, n: int = 3):
+        self.n = n
+        self.window = [0] * n  # Ring buffer of token hashes
+        self.head = 0
+        self.filled = 0
+        self.value = 0
+        self.leading_factor = pow(self.BASE, n - 1, 1 << 64)
+    
+    def push(self, token_hash: int) -> Optional[int]:
+        """Slide one token in; returns the n-gram hash once the window is full"""
+        head = self.head
+        if self.filled == self.n:
+            self.value -= self.window[head] * self.leading_factor
+        else:
+            self.filled += 1
+        self.value = (self.value * self.BASE + token_hash) & HASH_MASK
+        self.window[head] = token_hash
+        self.head = (head + 1) % self.n
+        return self.value if self.filled == self.n else None
+
+class StreamingDensityProfiler:
+    """TextProfile built from text chunks in bounded memory
+    
+    Chunks are cut at whitespace so every token is seen whole. Character,
+    word, sentence and vocabulary counts are exact, except that a run of
+    more than MAX_TOKEN_LENGTH characters without whitespace is split
+    rather than held back whole. Verbose patterns are
+    scanned over a sliding buffer holding STREAM_OVERLAP characters of
+    lookahead, so counts are exact unless a single match spans more than
+    that. Patterns that can match the empty string count only their
+    non-empty matches. Repeated 3-word phrases come from rolling hashes fed
+    into count-min sketches, and they can only be overcounted: with four
+    cells per distinct phrase the chance of a false repeat stays below
+    0.2%. Value per token and redundancy therefore read at most about 0.002
+    low/high respectively, which leaves compliance verdicts unchanged
+    except for texts sitting on a threshold.
+    
+    Sketches are sized from expected_length, an upper bound on the text's
+    characters: a text of n characters has at most (n + 1) // 2 words and
+    so as many phrases. Without it they take the 4M x 4 maximum (16 MiB
+    each), which keeps the bound up to one million distinct phrases; an
+    underestimate only loosens the bound. Memory is otherwise fixed, except
+    for the vocabulary: unique_words and unique_meaningful_words are exact
+    sets that grow with the number of distinct words.
+    """
+    
+    def __init__(self, verbose_matcher: VerbosePatternMatcher, expected_length: Optional[int] = None):
+        self.verbose_matcher = verbose_matcher
+        self.digest = hashlib.sha256()
+        self.pending = ''
+        
+        self.character_count = 0
+        self.meaningful_characters = 0
+        self.word_count = 0
+        self.sentence_count = 0
+        self.unique_words: Set[str] = set()
+        self.unique_meaningful_words: Set[str] = set()
+        
+        self.phrase_hash = RollingNgramHash(3)
+        self.lower_phrase_hash = RollingNgramHash(3)
+        width_bits = (SKETCH_WIDTH_BITS if expected_length is None
+                      else CountMinSketch.width_bits_for((expected_length + 1) // 2))
+        self.phrase_sketch = CountMinSketch(width_bits)
+        self.lower_phrase_sketch = CountMinSketch(width_bits)
+        self.repeated_phrases = 0
+        self.repeated_lower_phrases = 0
+        
+        # Verbose scan buffer; buffer[0] sits at absolute position buffer_offset
+        self.buffer = ''
+        self.buffer_offset = 0
+        self.scanned_to = 0
+        self.match_counts = [0] * len(verbose_matcher.patterns)
+        self.last_end = [0] * len(verbose_matcher.patterns)
+    
+    def feed(self, chunk: str):
+        """Add the next piece of text"""
+        self.digest.update(chunk.encode('utf-8', 'surrogatepass'))
+        
+        # Hold back the trailing partial token until the next chunk. The held
+        # back text never contains whitespace, so only the new chunk is searched
+        cut = len(chunk)
+        while cut > 0 and not chunk[cut - 1].isspace():
+            cut -= 1
+        if cut:
+            text = self.pending + chunk
+            cut += len(self.pending)
+        elif len(self.pending) + len(chunk) > MAX_TOKEN_LENGTH:
+            # No whitespace in sight: flush instead of growing without bound
+            text = self.pending + chunk
+            cut = len(text)
+        else:
+            self.pending += chunk
+            return
+        self.pending = text[cut:]
+        if cut:
+            self._process(text[:cut], final=False)
+    
+    def finish(self) -> TextProfile:
+        """Process the remaining text and return the profile"""
+        self._process(self.pending, final=True)
+        self.pending = ''
+        
+        return TextProfile(
+            character_count=self.character_count,
+            meaningful_characters=self.meaningful_characters,
+            word_count=self.word_count,
+            sentence_count=self.sentence_count,
+            verbose_patterns_count=self.verbose_matcher.weighted_count(self.match_counts),
+            unique_words=len(self.unique_words),
+            unique_meaningful_words=len(self.unique_meaningful_words),
+            repeated_phrases=self.repeated_phrases,
+            repeated_lower_phrases=self.repeated_lower_phrases
+        )
+    
+    def hexdigest(self) -> str:
+        return self.digest.hexdigest()
+    
+    def _process(self, segment: str, final: bool):
+        segment_lower = segment.lower()
+        words = segment.split()
+        lower_words = segment_lower.split()
+        
+        self.character_count += len(segment)
+        self.meaningful_characters += len(segment) - len(NON_WORD_PATTERN.findall(segment))
+        self.sentence_count += len(SENTENCE_PATTERN.findall(segment))
+        self.word_count += len(words)
+        self.unique_words.update(lower_words)
+        self.unique_meaningful_words.update(
+            lower_word for word, lower_word in zip(words, lower_words)
+            if len(word) > 2 and word.isalpha()
+        )
+        
+        for word, lower_word in zip(words, lower_words):
+            word_hash = hash(word) & HASH_MASK
+            phrase = self.phrase_hash.push(word_hash)
+            lower_phrase = self.lower_phrase_hash.push(
+                word_hash if lower_word == word else hash(lower_word) & HASH_MASK)
+            if phrase is not None:
+                if self.phrase_sketch.add(phrase):
+                    self.repeated_phrases += 1
+                if self.lower_phrase_sketch.add(lower_phrase):
+                    self.repeated_lower_phrases += 1
+        
+        self._scan_verbose(segment_lower, final)
+    
+    def _scan_verbose(self, segment_lower: str, final: bool):
+        self.buffer += segment_lower
+        begin = self.scanned_to - self.buffer_offset
+        end = len(self.buffer) + 1 if final else len(self.buffer) - STREAM_OVERLAP
+        if end <= begin:
+            return
+        
+        self.verbose_matcher.scan(self.buffer, self.match_counts, self.last_end,
+                                  begin, end, self.buffer_offset)
+        self.scanned_to = self.buffer_offset + min(end, len(self.buffer))
+        
+        # Keep a little scanned context so word boundaries resolve, and never
+        # position 0 again so '^' only matches at the true start
+        keep_from = max(self.scanned_to - self.buffer_offset - 64, 1 if self.buffer_offset == 0 else 0)
+        if keep_from > 0:
+            self.buffer = self.buffer[keep_from:]
+            self.buffer_offset += keep_from
+
 class DensityDatabase:
     """Database manager for density enforcement"""
     
     def __init__(self, db_path: str):
         self.db_path = db_path
+        self.writes = get_write_queue()
         Path(db_path).parent.mkdir(parents=True, exist_ok=True)
         self.init_database()
     
+    def flush(self):
+        """Wait for queued writes so reads see every recorded row"""
+        self.writes.flush()
+    
     def init_database(self):
         """Initialize database tables"""
         with sqlite3.connect(self.db_path) as conn:
@@ -182,44 +508,42 @@ class DensityDatabase:
     
     def insert_analysis(self, analysis: DensityAnalysis):
         """Insert density analysis"""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.execute('''
-                INSERT OR REPLACE INTO density_analyses 
-                (text_id, original_text, character_count, word_count, sentence_count,
-                 character_efficiency, estimated_comprehension_time, value_per_token,
-                 verbose_patterns_count, redundancy_score, is_compliant, violations)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ''', (
-                analysis.text_id,
-                analysis.original_text,
-                analysis.character_count,
-                analysis.word_count,
-                analysis.sentence_count,
-                analysis.character_efficiency,
-                analysis.estimated_comprehension_time,
-                analysis.value_per_token,
-                analysis.verbose_patterns_count,
-                analysis.redundancy_score,
-                analysis.is_compliant,
-                json.dumps(analysis.violations)
-            ))
+        self.writes.submit(self.db_path, '''
+            INSERT OR REPLACE INTO density_analyses 
+            (text_id, original_text, character_count, word_count, sentence_count,
+             character_efficiency, estimated_comprehension_time, value_per_token,
+             verbose_patterns_count, redundancy_score, is_compliant, violations)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        ''', (
+            analysis.text_id,
+            analysis.original_text,
+            analysis.character_count,
+            analysis.word_count,
+            analysis.sentence_count,
+            analysis.character_efficiency,
+            analysis.estimated_comprehension_time,
+            analysis.value_per_token,
+            analysis.verbose_patterns_count,
+            analysis.redundancy_score,
+            analysis.is_compliant,
+            json.dumps(analysis.violations)
+        ))
     
     def insert_violation(self, violation: DensityViolation):
         """Insert density violation"""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.execute('''
-                INSERT INTO density_violations 
-                (text_id, violation_type, metric_value, threshold_value, severity, suggested_improvement, blocked)
-                VALUES (?, ?, ?, ?, ?, ?, ?)
-            ''', (
-                violation.text_id,
-                violation.violation_type,
-                violation.metric_value,
-                violation.threshold_value,
-                violation.severity,
-                violation.suggested_improvement,
-                violation.blocked
-            ))
+        self.writes.submit(self.db_path, '''
+            INSERT INTO density_violations 
+            (text_id, violation_type, metric_value, threshold_value, severity, suggested_improvement, blocked)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+        ''', (
+            violation.text_id,
+            violation.violation_type,
+            violation.metric_value,
+            violation.threshold_value,
+            violation.severity,
+            violation.suggested_improvement,
+            violation.blocked
+        ))
     
     def get_verbose_patterns(self) -> List[Tuple[str, str, float, str]]:
         """Get active verbose patterns"""
@@ -242,33 +566,77 @@ class DensityOptimizationEnforcer:
         self.blocking_enabled = True
         
         # Load verbose patterns
+        self.load_verbose_patterns()
+    
+    def load_verbose_patterns(self):
+        """Load active verbose patterns and compile their combined matcher"""
         self.verbose_patterns = self.db.get_verbose_patterns()
+        self.verbose_matcher = VerbosePatternMatcher(self.verbose_patterns)
         logger.info(f"Loaded {len(self.verbose_patterns)} verbose patterns")
     
     def analyze_text_density(self, text: str, text_id: Optional[str] = None) -> DensityAnalysis:
         """Analyze text for density optimization compliance"""
+        analysis = self._measure_text_density(text, text_id)
+        
+        # Store analysis
+        self.db.insert_analysis(analysis)
+        
+        return analysis
+    
+    def analyze_text_stream(self, chunks: Iterable[str], text_id: Optional[str] = None,
+                            expected_length: Optional[int] = None) -> DensityAnalysis:
+        """Analyze text supplied in chunks without holding it in memory
+        
+        Only a SHA-256 digest of the text is kept as original_text. Metrics
+        follow StreamingDensityProfiler's tolerances; expected_length, an
+        upper bound on the characters to come, sizes its sketches.
+        """
+        profiler = StreamingDensityProfiler(self.verbose_matcher, expected_length)
+        for chunk in chunks:
+            profiler.feed(chunk)
+        profile = profiler.finish()
+        
+        analysis = self._build_analysis(profile, f"sha256:{profiler.hexdigest()}", text_id)
+        self.db.insert_analysis(analysis)
+        return analysis
+    
+    def analyze_file_density(self, file_path: str, text_id: Optional[str] = None) -> DensityAnalysis:
+        """Stream a file through density analysis"""
+        def read_chunks():
+            with open(file_path, 'r', encoding='utf-8') as f:
+                while True:
+                    chunk = f.read(STREAM_CHUNK_SIZE)
+                    if not chunk:
+                        return
+                    yield chunk
+        
+        # UTF-8 needs at least a byte per character, so the size bounds the length
+        return self.analyze_text_stream(read_chunks(), text_id or f"file_{Path(file_path).name}",
+                                        expected_length=os.path.getsize(file_path))
+    
+    def _measure_text_density(self, text: str, text_id: Optional[str] = None) -> DensityAnalysis:
+        """Compute density metrics without recording them"""
+        return self._build_analysis(self._profile_text(text), text, text_id)
+    
+    def _build_analysis(self, profile: TextProfile, original_text: str,
+                        text_id: Optional[str] = None) -> DensityAnalysis:
+        """Derive metrics and compliance from a text profile"""
         if text_id is None:
             text_id = f"text_{int(time.time() * 1000)}"
         
-        # Basic metrics
-        character_count = len(text)
-        word_count = len(text.split())
-        sentence_count = len(re.findall(r'[.!?]+', text))
-        
         # Calculate character efficiency
-        character_efficiency = self._calculate_character_efficiency(text)
+        character_efficiency = self._calculate_character_efficiency(profile)
         
         # Estimate comprehension time
-        comprehension_time = self._estimate_comprehension_time(text)
+        comprehension_time = self._estimate_comprehension_time(profile)
         
         # Calculate value per token
-        value_per_token = self._calculate_value_per_token(text)
-        
-        # Count verbose patterns
-        verbose_patterns_count = self._count_verbose_patterns(text)
+        value_per_token = self._calculate_value_per_token(profile)
         
         # Calculate redundancy score
-        redundancy_score = self._calculate_redundancy_score(text)
+        redundancy_score = self._calculate_redundancy_score(profile)
+        
+        verbose_patterns_count = profile.verbose_patterns_count
         
         # Determine compliance
         violations = []
@@ -287,13 +655,13 @@ class DensityOptimizationEnforcer:
         
         is_compliant = len(violations) == 0
         
-        analysis = DensityAnalysis(
+        return DensityAnalysis(
             text_id=text_id,
             timestamp=datetime.now(),
-            original_text=text,
-            character_count=character_count,
-            word_count=word_count,
-            sentence_count=sentence_count,
+            original_text=original_text,
+            character_count=profile.character_count,
+            word_count=profile.word_count,
+            sentence_count=profile.sentence_count,
             character_efficiency=character_efficiency,
             estimated_comprehension_time=comprehension_time,
             value_per_token=value_per_token,
@@ -302,38 +670,64 @@ class DensityOptimizationEnforcer:
             is_compliant=is_compliant,
             violations=violations
         )
+    
+    def _profile_text(self, text: str) -> TextProfile:
+        """Tokenize once and gather every count the metrics need"""
+        text_lower = text.lower()
+        words = text.split()
+        # Lowercasing never creates or removes whitespace, so tokens stay aligned
+        lower_words = text_lower.split()
         
-        # Store analysis
-        self.db.insert_analysis(analysis)
+        meaningful_words = {
+            lower_word for word, lower_word in zip(words, lower_words)
+            if len(word) > 2 and word.isalpha()
+        }
         
-        return analysis
+        # 3-word phrases as hashed tuples; tokens hold no whitespace, so this
+        # matches comparing the space-joined phrases
+        phrase_count = max(len(words) - 2, 0)
+        if phrase_count:
+            distinct_phrases = len(set(zip(words, words[1:], words[2:])))
+            if text_lower == text:
+                distinct_lower_phrases = distinct_phrases
+            else:
+                distinct_lower_phrases = len(set(zip(lower_words, lower_words[1:], lower_words[2:])))
+        else:
+            distinct_phrases = distinct_lower_phrases = 0
+        
+        return TextProfile(
+            character_count=len(text),
+            meaningful_characters=len(text) - len(NON_WORD_PATTERN.findall(text)),
+            word_count=len(words),
+            sentence_count=len(SENTENCE_PATTERN.findall(text)),
+            verbose_patterns_count=self.verbose_matcher.count(text_lower),
+            unique_words=len(set(lower_words)),
+            unique_meaningful_words=len(meaningful_words),
+            repeated_phrases=phrase_count - distinct_phrases,
+            repeated_lower_phrases=phrase_count - distinct_lower_phrases
+        )
     
-    def _calculate_character_efficiency(self, text: str) -> float:
+    def _calculate_character_efficiency(self, profile: TextProfile) -> float:
         """Calculate character efficiency (inverse of verbosity)"""
-        # Count meaningful characters vs total characters
-        meaningful_chars = len(re.sub(r'[^\w\s]', '', text))
-        
         # Calculate information density
-        unique_words = len(set(text.lower().split()))
-        total_words = len(text.split())
-        word_diversity = unique_words / max(total_words, 1)
+        word_diversity = profile.unique_words / max(profile.word_count, 1)
         
         # Base efficiency from character usage
-        base_efficiency = meaningful_chars / max(len(text), 1)
+        base_efficiency = profile.meaningful_characters / max(profile.character_count, 1)
         
         # Adjust for word diversity
         efficiency = base_efficiency * (0.5 + 0.5 * word_diversity)
         
         # Penalize for verbose patterns
-        verbose_penalty = min(self._count_verbose_patterns(text) * 0.05, 0.3)
+        verbose_penalty = min(profile.verbose_patterns_count * 0.05, 0.3)
         efficiency = max(0, efficiency - verbose_penalty)
         
         return min(efficiency, 1.0)
     
-    def _estimate_comprehension_time(self, text: str) -> float:
+    def _estimate_comprehension_time(self, profile: TextProfile) -> float:
         """Estimate comprehension time based on text complexity"""
-        word_count = len(text.split())
-        sentence_count = max(len(re.findall(r'[.!?]+', text)), 1)
+        word_count = profile.word_count
+        sentence_count = max(profile.sentence_count, 1)
         
         # Base reading time (assuming 200 words per minute)
         base_time = word_count / 200 * 60  # seconds
@@ -350,85 +744,69 @@ class DensityOptimizationEnforcer:
             complexity_multiplier += 0.1
         
         # Adjust for verbose patterns
-        verbose_multiplier = 1.0 + (self._count_verbose_patterns(text) * 0.1)
+        verbose_multiplier = 1.0 + (profile.verbose_patterns_count * 0.1)
         
         return base_time * complexity_multiplier * verbose_multiplier
     
-    def _calculate_value_per_token(self, text: str) -> float:
+    def _calculate_value_per_token(self, profile: TextProfile) -> float:
         """Calculate information value per token"""
-        words = text.split()
-        if not words:
+        if not profile.word_count:
             return 0.0
         
-        # Count unique meaningful words
-        meaningful_words = [word.lower() for word in words if len(word) > 2 and word.isalpha()]
-        unique_meaningful = len(set(meaningful_words))
-        
-        # Calculate value ratio
-        value_ratio = unique_meaningful / len(words)
+        # Calculate value ratio from unique meaningful words
+        value_ratio = profile.unique_meaningful_words / profile.word_count
         
         # Adjust for information density
         # Penalize repetitive structures
-        repetition_penalty = self._calculate_repetition_penalty(text)
+        repetition_penalty = self._calculate_repetition_penalty(profile)
         value_ratio = max(0, value_ratio - repetition_penalty)
         
         return min(value_ratio, 1.0)
     
     def _count_verbose_patterns(self, text: str) -> int:
         """Count verbose patterns in text"""
-        count = 0
-        text_lower = text.lower()
-        
-        for pattern_type, regex, weight, description in self.verbose_patterns:
-            matches = re.findall(regex, text_lower, re.IGNORECASE)
-            count += len(matches) * weight
-        
-        return int(count)
+        return self.verbose_matcher.count(text.lower())
     
-    def _calculate_redundancy_score(self, text: str) -> float:
+    def _calculate_redundancy_score(self, profile: TextProfile) -> float:
         """Calculate redundancy score (0.0 = no redundancy, 1.0 = high redundancy)"""
-        words = text.lower().split()
-        if len(words) <= 1:
+        word_count = profile.word_count
+        if word_count <= 1:
             return 0.0
         
-        # Calculate word repetition
-        word_counts = {}
-        for word in words:
-            word_counts[word] = word_counts.get(word, 0) + 1
-        
         # Calculate redundancy based on repeated words
-        total_repetitions = sum(max(0, count - 1) for count in word_counts.values())
-        redundancy = total_repetitions / len(words)
+        total_repetitions = word_count - profile.unique_words
+        redundancy = total_repetitions / word_count
         
         # Add phrase repetition penalty
-        phrases = [' '.join(words[i:i+3]) for i in range(len(words)-2)]
-        phrase_counts = {}
-        for phrase in phrases:
-            phrase_counts[phrase] = phrase_counts.get(phrase, 0) + 1
-        
-        phrase_repetitions = sum(max(0, count - 1) for count in phrase_counts.values())
-        phrase_redundancy = phrase_repetitions / max(len(phrases), 1)
+        phrase_count = max(word_count - 2, 0)
+        phrase_redundancy = profile.repeated_lower_phrases / max(phrase_count, 1)
         
         return min(redundancy + phrase_redundancy * 0.5, 1.0)
     
-    def _calculate_repetition_penalty(self, text: str) -> float:
+    def _calculate_repetition_penalty(self, profile: TextProfile) -> float:
         """Calculate penalty for repetitive structures"""
-        words = text.split()
-        if len(words) <= 3:
+        if profile.word_count <= 3:
             return 0.0
         
-        # Check for repeated phrases
-        phrase_length = 3
-        phrases = [' '.join(words[i:i+phrase_length]) for i in range(len(words)-phrase_length+1)]
-        
-        repetitions = 0
-        seen_phrases = set()
-        for phrase in phrases:
-            if phrase in seen_phrases:
-                repetitions += 1
-            seen_phrases.add(phrase)
+        # Check for repeated 3-word phrases
+        phrase_count = profile.word_count - 2
+        return min(profile.repeated_phrases / phrase_count, 0.3)
+    
+    def measure_throughput(self, text: str, iterations: int = 3) -> Dict[str, float]:
+        """Density analysis throughput on a document, in MB/s"""
+        size_mb = len(text.encode('utf-8')) / (1024 * 1024)
+        timings = []
+        for _ in range(iterations):
+            start_time = time.perf_counter()
+            self._measure_text_density(text)
+            timings.append(time.perf_counter() - start_time)
         
-        return min(repetitions / len(phrases), 0.3)
+        best = min(timings)
+        return {
+            'size_mb': size_mb,
+            'seconds': best,
+            'mb_per_second': size_mb / best if best > 0 else 0.0
+        }
     
     def check_density_compliance(self, text: str, text_id: Optional[str] = None) -> Tuple[bool, List[DensityViolation]]:
         """Check if text complies with density requirements"""
@@ -557,7 +935,7 @@ class DensityOptimizationEnforcer:
             try:
                 # Refresh patterns every 30 minutes
                 time.sleep(1800)
-                self.verbose_patterns = self.db.get_verbose_patterns()
+                self.load_verbose_patterns()
                 
             except Exception as e:
                 logger.error(f"Error in monitoring loop: {e}")
@@ -565,6 +943,7 @@ class DensityOptimizationEnforcer:
     
     def get_density_stats(self) -> Dict[str, Any]:
         """Get density enforcement statistics"""
+        self.db.flush()
         with sqlite3.connect(self.db.db_path) as conn:
             cursor = conn.cursor()
             
@@ -614,7 +993,7 @@ class DensityOptimizationEnforcer:
 def main():
     """Main function for CLI usage"""
     if len(sys.argv) < 2:
-        print("Usage: python density-optimization-enforcer.py {start|stop|check|stats|analyze}")
+        print("Usage: python density-optimization-enforcer.py {start|stop|check|stats|analyze|benchmark}")
         sys.exit(1)
     
     command = sys.argv[1]
@@ -690,6 +1069,20 @@ def main():
         for violation in stats['violations_by_type']:
             print(f"  {violation['type']}: {violation['count']} (avg: {violation['avg_metric']:.3f})")
     
+    elif command == 'benchmark':
+        if len(sys.argv) < 3:
+            print("Usage: python density-optimization-enforcer.py benchmark <file>")
+            sys.exit(1)
+        
+        with open(sys.argv[2], 'r', encoding='utf-8') as f:
+            text = f.read()
+        results = enforcer.measure_throughput(text)
+        
+        print("Density Analysis Throughput:")
+        print(f"Document: {sys.argv[2]} ({results['size_mb']:.2f} MB)")
+        print(f"Analysis Time: {results['seconds']:.3f}s")
+        print(f"Throughput: {results['mb_per_second']:.2f} MB/s")
+    
     else:
         print(f"Unknown command: {command}")
         sys.exit(1)
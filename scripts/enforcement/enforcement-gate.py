@@ -0,0 +1,386 @@
+#!/usr/bin/env python3
+"""
+Enforcement Gate - Context Engineering
+Long-lived enforcement daemon serving low-latency compliance checks
+Keeps UnifiedEnforcementCoordinator warm behind a local Unix socket
+
+GATE MODEL:
+- Engines are loaded, CLAUDE.md parsed and the command inventory built once
+- Checks arrive as newline-delimited JSON over a Unix domain socket
+- Per-check latency is tracked and reported against a p99 target
+- CLAUDE.md and the command trees are polled; only the changed part reloads
+- Clients fall back to an in-process check when no gate is running
+"""
+
+import json
+import sys
+import os
+import time
+import socket
+import socketserver
+import threading
+import logging
+from collections import deque
+from typing import Dict, List, Optional, Any, Tuple
+from pathlib import Path
+
+# Configuration
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+CLAUDE_MD_PATH = PROJECT_ROOT / "CLAUDE.md"
+COMMAND_TREES = [PROJECT_ROOT / ".claude/commands", PROJECT_ROOT / "docs/commands"]
+GATE_SOCKET = PROJECT_ROOT / "scripts/results/compliance/enforcement-gate.sock"
+GATE_LOG = PROJECT_ROOT / "scripts/results/compliance/enforcement-gate.log"
+
+# Service targets
+P99_LATENCY_TARGET_MS = 50.0
+LATENCY_WINDOW = 2000          # Most recent checks kept for percentiles
+RELOAD_POLL_INTERVAL = 2.0     # Seconds between change polls
+CLIENT_TIMEOUT = 10.0
+
+# Logging configuration
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+    handlers=[
+        logging.FileHandler(GATE_LOG),
+        logging.StreamHandler()
+    ]
+)
+logger = logging.getLogger(__name__)
+
+
+def load_unified_system():
+    """Load unified-enforcement-system.py, which in turn loads the engines"""
+    import importlib.util
+    script_path = Path(__file__).parent / "unified-enforcement-system.py"
+    spec = importlib.util.spec_from_file_location("unified_enforcement_system", script_path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def tree_signature(root: Path) -> Tuple[int, int]:
+    """(file count, newest mtime in ns) for all markdown files under root"""
+    count = 0
+    newest = 0
+    if not root.exists():
+        return count, newest
+    # Directory mtimes catch deletions and renames, so every scanned
+    # directory is folded in alongside the files
+    newest = root.stat().st_mtime_ns
+    stack = [str(root)]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                        newest = max(newest, entry.stat(follow_symlinks=False).st_mtime_ns)
+                    elif entry.name.endswith('.md'):
+                        count += 1
+                        newest = max(newest, entry.stat().st_mtime_ns)
+        except OSError:
+            continue
+    return count, newest
+
+
+def file_signature(path: Path) -> Tuple[int, int]:
+    """(size, mtime in ns) for a single file, zeros when missing"""
+    try:
+        stat = path.stat()
+        return stat.st_size, stat.st_mtime_ns
+    except OSError:
+        return 0, 0
+
+
+class LatencyTracker:
+    """Rolling window of check latencies with percentile reporting"""
+
+    def __init__(self, window: int = LATENCY_WINDOW):
+        self.samples = deque(maxlen=window)
+        self.total_checks = 0
+        self._lock = threading.Lock()
+
+    def record(self, latency_ms: float):
+        with self._lock:
+            self.samples.append(latency_ms)
+            self.total_checks += 1
+
+    def summary(self) -> Dict[str, Any]:
+        with self._lock:
+            ordered = sorted(self.samples)
+            total = self.total_checks
+        if not ordered:
+            return {'total_checks': total, 'window': 0, 'p50_ms': 0.0, 'p99_ms': 0.0,
+                    'max_ms': 0.0, 'p99_target_ms': P99_LATENCY_TARGET_MS, 'within_target': True}
+
+        def percentile(p: float) -> float:
+            return ordered[min(len(ordered) - 1, int(round(p * (len(ordered) - 1))))]
+
+        p99 = percentile(0.99)
+        return {
+            'total_checks': total,
+            'window': len(ordered),
+            'p50_ms': round(percentile(0.50), 3),
+            'p99_ms': round(p99, 3),
+            'max_ms': round(ordered[-1], 3),
+            'p99_target_ms': P99_LATENCY_TARGET_MS,
+            'within_target': p99 <= P99_LATENCY_TARGET_MS
+        }
+
+
+class EnforcementGate:
+    """Warm coordinator plus change watcher behind the socket server"""
+
+    def __init__(self):
+        start_time = time.perf_counter()
+        self.unified = load_unified_system()
+        self.coordinator = self.unified.UnifiedEnforcementCoordinator()
+        self.warmup_seconds = time.perf_counter() - start_time
+
+        self.latency = LatencyTracker()
+        self.reloads = {'rules': 0, 'inventory': 0}
+        self.started_at = time.time()
+        self.running = False
+        self.watch_thread = None
+        self._claude_md_signature = file_signature(CLAUDE_MD_PATH)
+        self._tree_signatures = [tree_signature(root) for root in COMMAND_TREES]
+
+        logger.info(f"Enforcement gate warmed up in {self.warmup_seconds:.2f}s")
+
+    def check(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """Run one comprehensive enforcement check on the warm coordinator"""
+        start_time = time.perf_counter()
+        result = self.coordinator.comprehensive_enforcement_check(
+            request.get('context', ''),
+            request.get('operation', ''),
+            request.get('objective'),
+            request.get('commands_used')
+        )
+        self.latency.record((time.perf_counter() - start_time) * 1000)
+        return result
+
+    def status(self) -> Dict[str, Any]:
+        """Gate health, reload counts and latency percentiles"""
+        return {
+            'uptime_seconds': round(time.time() - self.started_at, 1),
+            'warmup_seconds': round(self.warmup_seconds, 3),
+            'active_rules': len(self.coordinator.principle_engine.active_rules),
+            'total_commands': self.coordinator.orchestration_enforcer.inventory.total_commands,
+            'reloads': dict(self.reloads),
+            'latency': self.latency.summary()
+        }
+
+    def reload_if_changed(self, force: bool = False) -> Dict[str, bool]:
+        """Reload rules and/or inventory when their sources changed"""
+        reloaded = {'rules': False, 'inventory': False}
+
+        claude_md_signature = file_signature(CLAUDE_MD_PATH)
+        if force or claude_md_signature != self._claude_md_signature:
+            self._claude_md_signature = claude_md_signature
+            # refresh_rules swaps compiled_rules in one assignment, so
+            # concurrent checks see either the old or the new rule set
+            self.coordinator.principle_engine.refresh_rules()
+            self.reloads['rules'] += 1
+            reloaded['rules'] = True
+
+        tree_signatures = [tree_signature(root) for root in COMMAND_TREES]
+        if force or tree_signatures != self._tree_signatures:
+            self._tree_signatures = tree_signatures
+            # The inventory re-analyzes only changed files and swaps its
+            # views in once complete
+            self.coordinator.orchestration_enforcer.inventory.load_command_inventory()
+            self.reloads['inventory'] += 1
+            reloaded['inventory'] = True
+
+        if reloaded['rules'] or reloaded['inventory']:
+            logger.info(f"Hot reload: rules={reloaded['rules']} inventory={reloaded['inventory']}")
+        return reloaded
+
+    def start_watching(self):
+        """Start polling CLAUDE.md and the command trees for changes"""
+        self.running = True
+        self.watch_thread = threading.Thread(target=self._watch_loop)
+        self.watch_thread.daemon = True
+        self.watch_thread.start()
+
+    def stop_watching(self):
+        self.running = False
+        if self.watch_thread:
+            self.watch_thread.join()
+
+    def _watch_loop(self):
+        while self.running:
+            time.sleep(RELOAD_POLL_INTERVAL)
+            try:
+                self.reload_if_changed()
+            except Exception as e:
+                logger.error(f"Error reloading enforcement sources: {e}")
+
+
+class GateRequestHandler(socketserver.StreamRequestHandler):
+    """Answers newline-delimited JSON requests on one connection"""
+
+    def handle(self):
+        gate: EnforcementGate = self.server.gate
+        for raw_line in self.rfile:
+            if not raw_line.strip():
+                continue
+            try:
+                request = json.loads(raw_line)
+                action = request.get('action', 'check')
+                if action == 'check':
+                    response = {'ok': True, 'result': gate.check(request)}
+                elif action == 'status':
+                    response = {'ok': True, 'result': gate.status()}
+                elif action == 'reload':
+                    response = {'ok': True, 'result': gate.reload_if_changed(force=request.get('force', False))}
+                elif action == 'shutdown':
+                    response = {'ok': True, 'result': 'shutting down'}
+                    threading.Thread(target=self.server.shutdown, daemon=True).start()
+                else:
+                    response = {'ok': False, 'error': f"Unknown action: {action}"}
+            except Exception as e:
+                logger.error(f"Gate request failed: {e}")
+                response = {'ok': False, 'error': str(e)}
+
+            self.wfile.write(json.dumps(response, default=str).encode('utf-8') + b'\n')
+            self.wfile.flush()
+
+
+class GateServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+    def __init__(self, socket_path: Path, gate: EnforcementGate):
+        self.gate = gate
+        super().__init__(str(socket_path), GateRequestHandler)
+
+
+def serve(socket_path: Path = GATE_SOCKET):
+    """Run the gate until interrupted or asked to shut down"""
+    socket_path.parent.mkdir(parents=True, exist_ok=True)
+    if socket_path.exists():
+        if gate_request({'action': 'status'}, socket_path) is not None:
+            logger.error(f"Enforcement gate already running on {socket_path}")
+            sys.exit(1)
+        socket_path.unlink()  # Stale socket from a previous run
+
+    gate = EnforcementGate()
+    gate.start_watching()
+    server = GateServer(socket_path, gate)
+    logger.info(f"🚦 Enforcement gate listening on {socket_path}")
+
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        gate.stop_watching()
+        if socket_path.exists():
+            socket_path.unlink()
+        logger.info(f"Enforcement gate stopped: {gate.status()['latency']}")
+
+
+def gate_request(request: Dict[str, Any], socket_path: Path = GATE_SOCKET) -> Optional[Dict[str, Any]]:
+    """Send one request to a running gate; None when no gate is reachable"""
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+            client.settimeout(CLIENT_TIMEOUT)
+            client.connect(str(socket_path))
+            client.sendall(json.dumps(request).encode('utf-8') + b'\n')
+            with client.makefile('rb') as reader:
+                line = reader.readline()
+    except OSError:
+        return None
+    if not line:
+        return None
+    response = json.loads(line)
+    if not response.get('ok'):
+        raise RuntimeError(response.get('error', 'enforcement gate error'))
+    return response['result']
+
+
+def check(context: str, operation: str, objective: Optional[str] = None,
+          commands_used: Optional[List[str]] = None) -> Dict[str, Any]:
+    """Check through the gate, falling back to a cold in-process coordinator"""
+    request = {
+        'action': 'check',
+        'context': context,
+        'operation': operation,
+        'objective': objective,
+        'commands_used': commands_used
+    }
+    result = gate_request(request)
+    if result is not None:
+        return result
+
+    logger.warning("Enforcement gate not running, checking in-process")
+    coordinator = load_unified_system().UnifiedEnforcementCoordinator()
+    return coordinator.comprehensive_enforcement_check(context, operation, objective, commands_used)
+
+
+def main():
+    """Main function for CLI usage"""
+    if len(sys.argv) < 2:
+        print("Usage: python enforcement-gate.py {serve|check|status|reload|stop}")
+        sys.exit(1)
+
+    command = sys.argv[1]
+
+    if command == 'serve':
+        serve()
+
+    elif command == 'check':
+        if len(sys.argv) < 4:
+            print("Usage: python enforcement-gate.py check <context> <operation> [objective] [commands]")
+            sys.exit(1)
+
+        start_time = time.perf_counter()
+        results = check(
+            sys.argv[2],
+            sys.argv[3],
+            sys.argv[4] if len(sys.argv) > 4 else None,
+            sys.argv[5].split(',') if len(sys.argv) > 5 and sys.argv[5] else None
+        )
+        elapsed_ms = (time.perf_counter() - start_time) * 1000
+        decision = results['enforcement_results']['unified_decision']
+
+        print(f"Decision: {decision['final_decision']} ({elapsed_ms:.1f} ms round trip)")
+        for reason in decision['blocking_reasons']:
+            print(f"  • {reason}")
+        if decision['final_decision'] == 'BLOCK':
+            sys.exit(2)
+
+    elif command == 'status':
+        status = gate_request({'action': 'status'})
+        if status is None:
+            print("Enforcement gate not running")
+            sys.exit(1)
+        latency = status['latency']
+        print("🚦 ENFORCEMENT GATE STATUS")
+        print("=" * 40)
+        print(f"Uptime: {status['uptime_seconds']}s (warm-up {status['warmup_seconds']}s)")
+        print(f"Active Rules: {status['active_rules']}")
+        print(f"Total Commands: {status['total_commands']}")
+        print(f"Reloads: {status['reloads']}")
+        print(f"Checks: {latency['total_checks']}")
+        print(f"Latency p50: {latency['p50_ms']:.2f} ms, p99: {latency['p99_ms']:.2f} ms "
+              f"(target {latency['p99_target_ms']:.0f} ms, "
+              f"{'met' if latency['within_target'] else 'MISSED'})")
+
+    elif command == 'reload':
+        result = gate_request({'action': 'reload', 'force': True})
+        print("Enforcement gate not running" if result is None else f"Reloaded: {result}")
+
+    elif command == 'stop':
+        result = gate_request({'action': 'shutdown'})
+        print("Enforcement gate not running" if result is None else "Enforcement gate stopping")
+
+    else:
+        print(f"Unknown command: {command}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -11,20 +11,30 @@ import sys
 import os
 import sqlite3
 import time
+import uuid
 import threading
 import logging
 import subprocess
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any, Tuple
+from typing import Dict, List, Optional, Any, Tuple, Iterable, Iterator
 from dataclasses import dataclass, asdict
 from pathlib import Path
 from enum import Enum
 
+# Add enforcement directory to path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+from write_behind import get_write_queue
+from pattern_set import PatternSet
+from log_tailer import LogTailer
+
 # Configuration
 PROJECT_ROOT = Path(__file__).parent.parent.parent
 DB_PATH = PROJECT_ROOT / "scripts/results/compliance/metrics/error_protocol.db"
 ERROR_LOG = PROJECT_ROOT / "scripts/results/compliance/error-protocol.log"
 PROTOCOL_STATUS_FILE = PROJECT_ROOT / "scripts/results/compliance/ERROR_PROTOCOL_ACTIVE.flag"
+LOG_ROOT = PROJECT_ROOT / "scripts/results"
+LOG_TAIL_STATE = PROJECT_ROOT / "scripts/results/compliance/metrics/error_log_tail.json"
+LOG_POLL_INTERVAL = 5  # Seconds between log polls while monitoring
 
 # Error severity levels
 class ErrorSeverity(Enum):
@@ -45,6 +55,17 @@ PROTOCOL_STEPS = [
     "8. DOCUMENTACIÓN SOLUCIÓN"
 ]
 
+# Detail extraction patterns, in priority order
+STACK_TRACE_PATTERNS = [
+    re.compile(r'Traceback \(most recent call last\):.+?(?=\n\S|\n$)', re.DOTALL | re.MULTILINE),
+    re.compile(r'File ".*?", line \d+.*?(?=\n\S|\n$)', re.DOTALL | re.MULTILINE),
+    re.compile(r'at .*?\(.*?\).*?(?=\n\S|\n$)', re.DOTALL | re.MULTILINE)
+]
+LINE_NUMBER_PATTERN = re.compile(r'line (\d+)')
+
+# Streaming detection
+STREAM_CONTEXT_CHARS = 16384  # Preceding output kept for stack trace extraction
+
 # Logging configuration
 logging.basicConfig(
     level=logging.INFO,
@@ -114,14 +135,130 @@ class ProtocolExecution:
             'resolution_description': self.resolution_description
         }
 
+@dataclass
+class ErrorMatch:
+    """One error pattern occurrence located in text"""
+    pattern_name: str
+    severity: str
+    requires_protocol: bool
+    start: int
+    end: int
+    message: str
+
+@dataclass
+class ErrorScan:
+    """Every matching error pattern plus the details found alongside"""
+    matches: List[ErrorMatch]  # In pattern priority order
+    stack_trace: Optional[str]
+    line_number: Optional[int]
+
+class ErrorPatternMatcher:
+    """Every error pattern located in one combined pass over the text"""
+    
+    def __init__(self, error_patterns: List[Tuple[str, str, str, bool, str]]):
+        self.error_patterns = []  # (pattern_name, severity, requires_protocol)
+        entries = []
+        for pattern_name, regex, severity, requires_protocol, description in error_patterns:
+            try:
+                compiled = re.compile(regex, re.IGNORECASE | re.MULTILINE)
+            except re.error as e:
+                logger.error(f"Invalid error pattern {pattern_name}: {e}")
+                continue
+            entries.append((len(self.error_patterns), compiled))
+            self.error_patterns.append((pattern_name, severity, requires_protocol))
+        
+        self.pattern_set = PatternSet(entries)
+    
+    def scan(self, text: str, offset: int = 0) -> ErrorScan:
+        """Locate every matching pattern; positions are shifted by offset"""
+        found = self.pattern_set.search_all(text)
+        
+        matches = []
+        for index, (pattern_name, severity, requires_protocol) in enumerate(self.error_patterns):
+            match = found.get(index)
+            if match:
+                matches.append(ErrorMatch(
+                    pattern_name=pattern_name,
+                    severity=severity,
+                    requires_protocol=requires_protocol,
+                    start=match.start() + offset,
+                    end=match.end() + offset,
+                    message=match.group(0)
+                ))
+        
+        # Details only matter once an error is found; their literal
+        # prefixes keep these searches cheap
+        stack_trace, line_number = self.extract_details(text) if matches else (None, None)
+        return ErrorScan(matches=matches, stack_trace=stack_trace, line_number=line_number)
+    
+    def extract_details(self, text: str) -> Tuple[Optional[str], Optional[int]]:
+        """First stack trace by pattern priority, and the first line number"""
+        stack_trace = None
+        for pattern in STACK_TRACE_PATTERNS:
+            match = pattern.search(text)
+            if match:
+                stack_trace = match.group(0).strip()
+                break
+        
+        line_match = LINE_NUMBER_PATTERN.search(text)
+        line_number = int(line_match.group(1)) if line_match else None
+        return stack_trace, line_number
+
+class ErrorStreamWatcher:
+    """Incremental error detection over tool output
+    
+    Output is matched one block of completed lines at a time, so every
+    character is scanned once no matter how much output accumulates; only
+    a match spanning the line break between two blocks is missed. Stack
+    traces are looked up in the last STREAM_CONTEXT_CHARS of output when a
+    block contains an error.
+    """
+    
+    def __init__(self, matcher: ErrorPatternMatcher):
+        self.matcher = matcher
+        self.pending = ''   # Trailing partial line
+        self.context = ''   # Recent output for stack traces
+        self.offset = 0     # Absolute position of the next block
+    
+    def feed(self, chunk: str) -> ErrorScan:
+        """Scan newly completed lines of output"""
+        text = self.pending + chunk
+        cut = text.rfind('\n') + 1
+        self.pending = text[cut:]
+        return self._scan_block(text[:cut])
+    
+    def close(self) -> ErrorScan:
+        """Scan the final partial line"""
+        block, self.pending = self.pending, ''
+        return self._scan_block(block)
+    
+    def _scan_block(self, block: str) -> ErrorScan:
+        if not block:
+            return ErrorScan(matches=[], stack_trace=None, line_number=None)
+        
+        scan = self.matcher.scan(block, self.offset)
+        if scan.matches and scan.stack_trace is None:
+            # The trace may have started in earlier output
+            stack_trace, _ = self.matcher.extract_details(self.context + block)
+            scan.stack_trace = stack_trace
+        
+        self.offset += len(block)
+        self.context = (self.context + block)[-STREAM_CONTEXT_CHARS:]
+        return scan
+
 class ErrorProtocolDatabase:
     """Database manager for error protocol system"""
     
     def __init__(self, db_path: str):
         self.db_path = db_path
+        self.writes = get_write_queue()
         Path(db_path).parent.mkdir(parents=True, exist_ok=True)
         self.init_database()
     
+    def flush(self):
+        """Wait for queued writes so reads see every recorded row"""
+        self.writes.flush()
+    
     def init_database(self):
         """Initialize database tables"""
         with sqlite3.connect(self.db_path) as conn:
@@ -215,55 +352,52 @@ class ErrorProtocolDatabase:
     
     def insert_error(self, error: ErrorDetection):
         """Insert error detection"""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.execute('''
-                INSERT OR REPLACE INTO error_detections 
-                (error_id, error_type, error_message, severity, context, 
-                 stack_trace, file_location, line_number, requires_protocol)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ''', (
-                error.error_id,
-                error.error_type,
-                error.error_message,
-                error.severity.value,
-                error.context,
-                error.stack_trace,
-                error.file_location,
-                error.line_number,
-                error.requires_protocol
-            ))
+        self.writes.submit(self.db_path, '''
+            INSERT OR REPLACE INTO error_detections 
+            (error_id, error_type, error_message, severity, context, 
+             stack_trace, file_location, line_number, requires_protocol)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+        ''', (
+            error.error_id,
+            error.error_type,
+            error.error_message,
+            error.severity.value,
+            error.context,
+            error.stack_trace,
+            error.file_location,
+            error.line_number,
+            error.requires_protocol
+        ))
     
     def insert_protocol(self, protocol: ProtocolExecution):
         """Insert protocol execution"""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.execute('''
-                INSERT OR REPLACE INTO protocol_executions 
-                (protocol_id, error_id, start_time, end_time, current_step,
-                 steps_completed, step_results, protocol_status, 
-                 resolution_found, resolution_description)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ''', (
-                protocol.protocol_id,
-                protocol.error_id,
-                protocol.start_time,
-                protocol.end_time,
-                protocol.current_step,
-                json.dumps(protocol.steps_completed),
-                json.dumps(protocol.step_results),
-                protocol.protocol_status,
-                protocol.resolution_found,
-                protocol.resolution_description
-            ))
+        self.writes.submit(self.db_path, '''
+            INSERT OR REPLACE INTO protocol_executions 
+            (protocol_id, error_id, start_time, end_time, current_step,
+             steps_completed, step_results, protocol_status, 
+             resolution_found, resolution_description)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        ''', (
+            protocol.protocol_id,
+            protocol.error_id,
+            protocol.start_time,
+            protocol.end_time,
+            protocol.current_step,
+            json.dumps(protocol.steps_completed),
+            json.dumps(protocol.step_results),
+            protocol.protocol_status,
+            protocol.resolution_found,
+            protocol.resolution_description
+        ))
     
     def log_protocol_step(self, protocol_id: str, step_number: int, step_name: str, 
                          result: str, success: bool, notes: str = ""):
         """Log protocol step execution"""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.execute('''
-                INSERT INTO protocol_steps_log 
-                (protocol_id, step_number, step_name, result, success, notes)
-                VALUES (?, ?, ?, ?, ?, ?)
-            ''', (protocol_id, step_number, step_name, result, success, notes))
+        self.writes.submit(self.db_path, '''
+            INSERT INTO protocol_steps_log 
+            (protocol_id, step_number, step_name, result, success, notes)
+            VALUES (?, ?, ?, ?, ?, ?)
+        ''', (protocol_id, step_number, step_name, result, success, notes))
     
     def get_error_patterns(self) -> List[Tuple[str, str, str, bool, str]]:
         """Get active error patterns"""
@@ -287,64 +421,107 @@ class ErrorProtocolActivator:
         
         # Load error patterns
         self.error_patterns = self.db.get_error_patterns()
+        self.matcher = ErrorPatternMatcher(self.error_patterns)
         logger.info(f"Loaded {len(self.error_patterns)} error patterns")
+        
+        # Our own log repeats every detection, so it is never tailed
+        self.log_tailer = LogTailer(
+            [LOG_ROOT],
+            [(pattern_name, compiled) for (pattern_name, _, _), compiled
+             in zip(self.matcher.error_patterns, self.matcher.pattern_set.compiled)],
+            state_path=LOG_TAIL_STATE,
+            exclude=[ERROR_LOG]
+        )
     
     def detect_error(self, text: str, context: str = "", file_location: str = None) -> Optional[ErrorDetection]:
         """Detect errors in text using pattern matching"""
+        scan = self.matcher.scan(text)
+        if not scan.matches:
+            return None
+        return self._record_detection(scan, context, file_location)
+    
+    def detect_errors(self, text: str) -> List[ErrorMatch]:
+        """Every matching error pattern with its first position, in priority order"""
+        return self.matcher.scan(text).matches
+    
+    def watch_output(self, chunks: Iterable[str], context: str = "",
+                     file_location: str = None) -> Iterator[ErrorDetection]:
+        """Detect errors in tool output as it arrives, one detection per erroring block"""
+        watcher = ErrorStreamWatcher(self.matcher)
+        for chunk in chunks:
+            scan = watcher.feed(chunk)
+            if scan.matches:
+                yield self._record_detection(scan, context, file_location)
         
-        for pattern_name, regex, severity, requires_protocol, description in self.error_patterns:
-            match = re.search(regex, text, re.IGNORECASE | re.MULTILINE)
-            
-            if match:
-                error_id = f"ERROR_{int(time.time() * 1000)}"
-                
-                # Extract additional details
-                stack_trace = self._extract_stack_trace(text)
-                line_number = self._extract_line_number(text)
-                
-                error = ErrorDetection(
-                    error_id=error_id,
-                    timestamp=datetime.now(),
-                    error_type=pattern_name,
-                    error_message=match.group(0),
-                    severity=ErrorSeverity(severity),
-                    context=context,
-                    stack_trace=stack_trace,
-                    file_location=file_location,
-                    line_number=line_number,
-                    requires_protocol=requires_protocol and severity in ['CRITICAL', 'HIGH']
-                )
-                
-                # Store error
-                self.db.insert_error(error)
-                logger.warning(f"Error detected: {error.error_type} - {error.error_message}")
-                
-                return error
-        
-        return None
+        scan = watcher.close()
+        if scan.matches:
+            yield self._record_detection(scan, context, file_location)
     
-    def _extract_stack_trace(self, text: str) -> Optional[str]:
-        """Extract stack trace from error text"""
-        # Look for common stack trace patterns
-        stack_patterns = [
-            r'Traceback \(most recent call last\):.+?(?=\n\S|\n$)',
-            r'File ".*?", line \d+.*?(?=\n\S|\n$)',
-            r'at .*?\(.*?\).*?(?=\n\S|\n$)'
-        ]
+    def watch_logs(self) -> List[ErrorDetection]:
+        """Detect errors in lines appended to the framework logs since the last poll"""
+        detections = []
+        for update in self.log_tailer.poll():
+            if not update.failures:
+                continue
+            scan = self.matcher.scan(update.text)
+            if scan.matches:
+                detections.append(self._record_detection(scan, f"log: {update.path}", update.path))
+        return detections
+    
+    def start_monitoring(self, interval: float = LOG_POLL_INTERVAL):
+        """Poll the framework logs in the background"""
+        if self.running:
+            return
+        self.running = True
+        self.monitoring_thread = threading.Thread(target=self._monitoring_loop, args=(interval,), daemon=True)
+        self.monitoring_thread.start()
+        logger.info(f"Log monitoring started ({interval}s interval)")
+    
+    def stop_monitoring(self):
+        """Stop the background log polling"""
+        self.running = False
+        if self.monitoring_thread:
+            self.monitoring_thread.join(timeout=LOG_POLL_INTERVAL * 2)
+            self.monitoring_thread = None
+        logger.info("Log monitoring stopped")
+    
+    def _monitoring_loop(self, interval: float):
+        """Activate the protocol for log errors that require it, one protocol at a time"""
+        while self.running:
+            try:
+                for error in self.watch_logs():
+                    protocol_active = any(p.protocol_status == "ACTIVE" for p in self.active_protocols.values())
+                    if error.requires_protocol and not protocol_active:
+                        self.activate_protocol(error)
+            except Exception as e:
+                logger.error(f"Log monitoring error: {e}")
+            time.sleep(interval)
+    
+    def _record_detection(self, scan: ErrorScan, context: str, file_location: Optional[str]) -> ErrorDetection:
+        """Store the highest-priority match of a scan as an error detection"""
+        match = scan.matches[0]
+        # Streamed and polled detections arrive within the same millisecond, so
+        # the timestamp only orders ids and a random suffix keeps them unique
+        error_id = f"ERROR_{int(time.time() * 1000)}_{uuid.uuid4().hex[:12]}"
         
-        for pattern in stack_patterns:
-            match = re.search(pattern, text, re.DOTALL | re.MULTILINE)
-            if match:
-                return match.group(0).strip()
+        error = ErrorDetection(
+            error_id=error_id,
+            timestamp=datetime.now(),
+            error_type=match.pattern_name,
+            error_message=match.message,
+            severity=ErrorSeverity(match.severity),
+            context=context,
+            stack_trace=scan.stack_trace,
+            file_location=file_location,
+            line_number=scan.line_number,
+            requires_protocol=match.requires_protocol and match.severity in ['CRITICAL', 'HIGH']
+        )
         
-        return None
-    
-    def _extract_line_number(self, text: str) -> Optional[int]:
-        """Extract line number from error text"""
-        line_match = re.search(r'line (\d+)', text)
-        if line_match:
-            return int(line_match.group(1))
-        return None
+        # Store error
+        self.db.insert_error(error)
+        logger.warning(f"Error detected: {error.error_type} - {error.error_message}")
+        
+        return error
     
     def activate_protocol(self, error: ErrorDetection) -> ProtocolExecution:
         """Activate 8-step error resolution protocol"""
@@ -684,6 +861,7 @@ class ErrorProtocolActivator:
     
     def _get_error_for_protocol(self, protocol_id: str) -> Optional[ErrorDetection]:
         """Get error associated with protocol"""
+        self.db.flush()
         with sqlite3.connect(self.db.db_path) as conn:
             cursor = conn.cursor()
             cursor.execute('''
@@ -724,6 +902,7 @@ class ErrorProtocolActivator:
     
     def get_protocol_stats(self) -> Dict[str, Any]:
         """Get error protocol statistics"""
+        self.db.flush()
         with sqlite3.connect(self.db.db_path) as conn:
             cursor = conn.cursor()
             
@@ -763,7 +942,7 @@ class ErrorProtocolActivator:
 def main():
     """Main function for CLI usage"""
     if len(sys.argv) < 2:
-        print("Usage: python error-protocol-activator.py {check|complete|status|stats}")
+        print("Usage: python error-protocol-activator.py {check|watch|monitor|complete|status|stats}")
         sys.exit(1)
     
     command = sys.argv[1]
@@ -787,6 +966,27 @@ def main():
         if protocol_activated:
             print("🚨 ERROR PROTOCOL ACTIVATED - Manual intervention required for steps 5-8")
     
+    elif command == 'watch':
+        context = sys.argv[2] if len(sys.argv) > 2 else "stdin"
+        protocol = None
+        
+        # Line-buffered so errors surface while the producing command runs
+        for error in activator.watch_output(iter(sys.stdin.readline, ''), context):
+            print(f"{error.severity.value} {error.error_type}: {error.error_message}")
+            if error.requires_protocol and protocol is None:
+                protocol = activator.activate_protocol(error)
+                print(f"🚨 ERROR PROTOCOL ACTIVATED: {protocol.protocol_id}")
+    
+    elif command == 'monitor':
+        interval = float(sys.argv[2]) if len(sys.argv) > 2 else LOG_POLL_INTERVAL
+        activator.start_monitoring(interval)
+        print(f"Monitoring logs under {LOG_ROOT} every {interval}s (Ctrl+C to stop)")
+        try:
+            while activator.running:
+                time.sleep(1)
+        except KeyboardInterrupt:
+            activator.stop_monitoring()
+    
     elif command == 'complete':
         if len(sys.argv) < 5:
             print("Usage: python error-protocol-activator.py complete <protocol_id> <step_number> <result> [success=true]")
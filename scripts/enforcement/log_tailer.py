@@ -0,0 +1,243 @@
+#!/usr/bin/env python3
+"""
+Log Tailer - Context Engineering
+Incremental failure detection over the framework's log files
+
+TAILING MODEL:
+- Every log file is tracked by its (device, inode) identity and a byte offset
+- A poll reads only the bytes appended since the last poll, up to the last
+  complete line, so the cost follows new log volume rather than log size
+- A new inode at a path means the log was rotated; a size below the saved
+  offset means it was truncated; either way reading restarts at byte 0
+- A tracked inode found under another path (rename rotation) keeps its offset
+- Appended lines run through one PatternSet; each file keeps counters of
+  failing lines per pattern, in total and within a recent time window
+- Offsets and counters persist as JSON so restarts resume where they stopped
+"""
+
+import os
+import json
+import time
+import logging
+import threading
+from dataclasses import dataclass, field, asdict
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+import re
+
+from pattern_set import PatternSet
+
+logger = logging.getLogger(__name__)
+
+TAIL_STATE_VERSION = 1
+FAILURE_WINDOW_SECONDS = 3600  # Recent failures, and how new an unseen log must be to read it whole
+MAX_READ_BYTES = 16 * 1024 * 1024  # Per file and poll; the rest follows on later polls
+
+
+@dataclass
+class TailState:
+    """Read position and failure counters for one log file"""
+    device: int
+    inode: int
+    offset: int = 0
+    bytes_read: int = 0
+    rotations: int = 0
+    failure_totals: Dict[str, int] = field(default_factory=dict)
+    recent_failures: List[Tuple[float, str, int]] = field(default_factory=list)  # (poll time, key, lines)
+
+
+@dataclass
+class LogUpdate:
+    """Complete lines appended to one log since the previous poll"""
+    path: str
+    start: int  # Byte offset of text within the file
+    text: str
+    failures: Dict[str, int]  # Failing lines per pattern key
+    rotated: bool
+
+
+class LogTailer:
+    """Follows a set of log files and counts failing lines as they are appended"""
+
+    def __init__(self, roots: Iterable[Path], patterns: List[Tuple[str, re.Pattern]],
+                 glob: str = "**/*.log", state_path: Optional[Path] = None,
+                 window_seconds: float = FAILURE_WINDOW_SECONDS, exclude: Iterable[Path] = ()):
+        self.roots = [Path(root) for root in roots]
+        self.glob = glob
+        self.exclude = {str(path) for path in exclude}
+        self.pattern_set = PatternSet(patterns)
+        self.state_path = Path(state_path) if state_path else None
+        self.window_seconds = window_seconds
+        self.files: Dict[str, TailState] = {}
+        self._lock = threading.Lock()
+        self._load_state()
+
+    def _load_state(self):
+        """Resume offsets and counters from the state file, if any"""
+        if self.state_path is None or not self.state_path.exists():
+            return
+        try:
+            with open(self.state_path, 'r') as f:
+                data = json.load(f)
+            if data.get('version') != TAIL_STATE_VERSION:
+                return
+            for path, state in data.get('files', {}).items():
+                state['recent_failures'] = [tuple(entry) for entry in state.get('recent_failures', [])]
+                self.files[path] = TailState(**state)
+        except (OSError, ValueError, TypeError) as e:
+            logger.warning(f"Ignoring unreadable log tail state {self.state_path}: {e}")
+            self.files = {}
+
+    def save_state(self):
+        """Write offsets and counters atomically"""
+        if self.state_path is None:
+            return
+        data = {
+            'version': TAIL_STATE_VERSION,
+            'files': {path: asdict(state) for path, state in self.files.items()}
+        }
+        try:
+            self.state_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.state_path.with_suffix(self.state_path.suffix + '.tmp')
+            with open(tmp_path, 'w') as f:
+                json.dump(data, f)
+            os.replace(tmp_path, self.state_path)
+        except OSError as e:
+            logger.warning(f"Could not save log tail state: {e}")
+
+    def _discover(self) -> Dict[str, os.stat_result]:
+        """Current log files and their stat results"""
+        current = {}
+        for root in self.roots:
+            if not root.exists():
+                continue
+            for path in root.glob(self.glob):
+                if str(path) in self.exclude:
+                    continue
+                try:
+                    stat = path.stat()
+                except OSError:
+                    continue
+                if path.is_file():
+                    current[str(path)] = stat
+        return current
+
+    def _reconcile(self, current: Dict[str, os.stat_result], now: float) -> Dict[str, bool]:
+        """Match files to tracked state; returns path -> restarted by rotation"""
+        tracked = {(state.device, state.inode): state for state in self.files.values()}
+        files = {}
+        rotated = {}
+        for path, stat in current.items():
+            # Popping by identity lets a renamed log keep its offset and counters
+            state = tracked.pop((stat.st_dev, stat.st_ino), None)
+            previous = self.files.get(path)
+            restarted = False
+            if state is None:
+                if previous is not None:
+                    start = 0
+                    restarted = True
+                    logger.info(f"Log rotated, reading from start: {path}")
+                else:
+                    # Logs untouched within the window only contribute new lines
+                    start = 0 if now - stat.st_mtime < self.window_seconds else stat.st_size
+                state = TailState(device=stat.st_dev, inode=stat.st_ino, offset=start,
+                                  rotations=previous.rotations + 1 if previous else 0)
+            elif stat.st_size < state.offset:
+                state.offset = 0
+                state.rotations += 1
+                restarted = True
+                logger.info(f"Log truncated, reading from start: {path}")
+            files[path] = state
+            rotated[path] = restarted
+        # State of logs that disappeared is dropped with them
+        self.files = files
+        return rotated
+
+    def _read_appended(self, path: str, state: TailState, size: int) -> Tuple[int, str]:
+        """Complete lines between the saved offset and the end of the file"""
+        if size <= state.offset:
+            return state.offset, ""
+        with open(path, 'rb') as f:
+            f.seek(state.offset)
+            data = f.read(min(size - state.offset, MAX_READ_BYTES))
+        cut = data.rfind(b'\n')
+        if cut < 0:
+            if len(data) < MAX_READ_BYTES:
+                return state.offset, ""  # Line still being written
+            cut = len(data) - 1
+        data = data[:cut + 1]
+        start = state.offset
+        state.offset += len(data)
+        state.bytes_read += len(data)
+        return start, data.decode('utf-8', errors='replace')
+
+    def count_failures(self, text: str) -> Dict[str, int]:
+        """Failing lines per pattern key; a line counts once per pattern"""
+        counts: Dict[str, int] = {}
+        combined = self.pattern_set.combined
+        position = 0
+        while position < len(text):
+            if combined is not None:
+                candidate = combined.search(text, position)
+                if candidate is None:
+                    break
+                start = candidate.start()
+            else:
+                start = position
+            line_start = text.rfind('\n', 0, start) + 1
+            line_end = text.find('\n', start)
+            line_end = len(text) if line_end < 0 else line_end
+            for key in self.pattern_set.search_all(text, line_start, line_end + 1):
+                counts[key] = counts.get(key, 0) + 1
+            position = line_end + 1
+        return counts
+
+    def poll(self) -> List[LogUpdate]:
+        """Read and classify everything appended since the previous poll"""
+        # Concurrent pollers would hand the same bytes out twice
+        with self._lock:
+            return self._poll()
+
+    def _poll(self) -> List[LogUpdate]:
+        now = time.time()
+        current = self._discover()
+        rotated = self._reconcile(current, now)
+
+        updates = []
+        cutoff = now - self.window_seconds
+        for path, state in self.files.items():
+            state.recent_failures = [entry for entry in state.recent_failures if entry[0] >= cutoff]
+            try:
+                start, text = self._read_appended(path, state, current[path].st_size)
+            except OSError as e:
+                logger.warning(f"Could not read log {path}: {e}")
+                continue
+            if not text:
+                continue
+            failures = self.count_failures(text)
+            for key, lines in failures.items():
+                state.failure_totals[key] = state.failure_totals.get(key, 0) + lines
+                state.recent_failures.append((now, key, lines))
+            updates.append(LogUpdate(path=path, start=start, text=text,
+                                     failures=failures, rotated=rotated[path]))
+
+        self.save_state()
+        return updates
+
+    def failure_counts(self, recent: bool = True) -> Dict[str, Dict[str, int]]:
+        """Failing lines per file and pattern key, within the window or in total"""
+        counts = {}
+        cutoff = time.time() - self.window_seconds
+        with self._lock:
+            files = dict(self.files)
+        for path, state in files.items():
+            if not recent:
+                per_key = dict(state.failure_totals)
+            else:
+                per_key = {}
+                for timestamp, key, lines in state.recent_failures:
+                    if timestamp >= cutoff:
+                        per_key[key] = per_key.get(key, 0) + lines
+            if per_key:
+                counts[path] = per_key
+        return counts
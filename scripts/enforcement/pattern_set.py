@@ -0,0 +1,206 @@
+#!/usr/bin/env python3
+"""
+Pattern Set - Context Engineering
+Single-pass matching of many DB-loaded regexes for the enforcement engines
+
+MATCHING MODEL:
+- Every pattern is compiled on its own and keeps its own flags
+- One combined alternation (flags scoped per branch, backreferences
+  renumbered) finds each position where any pattern can match
+- Patterns are only anchored at those positions, so per-pattern results
+  equal what re.search / re.findall return for that pattern alone
+- Patterns opening with a word boundary share a single boundary check
+- Sets that cannot be combined fall back to scanning pattern by pattern
+"""
+
+import re
+import logging
+from typing import Dict, Hashable, Iterator, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+MAX_CACHED_SUBSETS = 256
+
+# Flags that can be scoped to one branch, as (flag, inline letter)
+SCOPED_FLAGS = ((re.IGNORECASE, 'i'), (re.MULTILINE, 'm'), (re.DOTALL, 's'))
+
+
+def _rewrite(regex: str, group_offset: int) -> Tuple[str, bool]:
+    """Shift numeric backreferences by group_offset; also report top-level '|'"""
+    parts = []
+    depth = 0
+    in_class = False
+    top_level_alternation = False
+    i = 0
+    while i < len(regex):
+        char = regex[i]
+        if char == '\\' and i + 1 < len(regex):
+            octal = regex[i + 1:i + 4]
+            j = i + 1
+            while j < len(regex) and j < i + 3 and regex[j].isdigit():
+                j += 1
+            digits = regex[i + 1:j]
+            is_octal = len(octal) == 3 and all(c in '01234567' for c in octal)
+            if not in_class and digits and digits[0] != '0' and not is_octal:
+                group = int(digits) + group_offset
+                if group > 99:
+                    raise re.error(f"backreference \\{group} out of range")
+                parts.append(f'(?:\\{group})')
+                i = j
+                continue
+            parts.append(regex[i:i + 2])
+            i += 2
+            continue
+        if in_class:
+            in_class = char != ']'
+        elif char == '[':
+            in_class = True
+            # A ']' right after '[' or '[^' is a literal member
+            if regex[i + 1:i + 2] == '^':
+                parts.append(regex[i:i + 2])
+                i += 2
+                char = regex[i] if i < len(regex) else ''
+                if char == ']':
+                    parts.append(char)
+                    i += 1
+                continue
+            if regex[i + 1:i + 2] == ']':
+                parts.append('[]')
+                i += 2
+                continue
+        elif char == '(':
+            depth += 1
+        elif char == ')':
+            depth -= 1
+        elif char == '|' and depth == 0:
+            top_level_alternation = True
+        parts.append(char)
+        i += 1
+    return ''.join(parts), top_level_alternation
+
+
+def _scope(regex: str, flags: int) -> str:
+    """Wrap a branch so it matches with exactly the given flags"""
+    on = ''.join(letter for flag, letter in SCOPED_FLAGS if flags & flag)
+    off = ''.join(letter for flag, letter in SCOPED_FLAGS if not flags & flag)
+    if flags & re.ASCII:
+        on += 'a'
+    return f'(?{on}-{off}:{regex})'
+
+
+def combine_patterns(compiled_patterns: List[re.Pattern]) -> Optional[re.Pattern]:
+    """Alternation matching wherever any of the patterns matches"""
+    if not compiled_patterns:
+        return None
+    if any(c.flags & (re.VERBOSE | re.LOCALE) or isinstance(c.pattern, bytes) for c in compiled_patterns):
+        return None
+
+    # Shared flags go on the whole alternation; mixed flags are scoped per branch
+    shared_flags = compiled_patterns[0].flags
+    mixed_flags = any(c.flags != shared_flags for c in compiled_patterns)
+
+    boundary_branches = []
+    other_branches = []
+    group_offset = 0
+    try:
+        # Boundary-led patterns come first so group numbers follow the combined layout
+        shares_boundary = [
+            c.pattern.startswith(r'\b') and not _rewrite(c.pattern, 0)[1]
+            for c in compiled_patterns
+        ]
+        ordered = [c for c, shared in zip(compiled_patterns, shares_boundary) if shared] + \
+                  [c for c, shared in zip(compiled_patterns, shares_boundary) if not shared]
+        for compiled in ordered:
+            regex, _ = _rewrite(compiled.pattern, group_offset)
+            group_offset += compiled.groups
+            # With shared flags branches join unwrapped: alternation is
+            # associative, and sre tries a flat alternation noticeably faster
+            if len(boundary_branches) < sum(shares_boundary):
+                body = regex[2:]
+                boundary_branches.append(_scope(body, compiled.flags) if mixed_flags else body)
+            else:
+                other_branches.append(_scope(regex, compiled.flags) if mixed_flags else regex)
+
+        branches = other_branches
+        if boundary_branches:
+            branches = [r'\b(?:' + '|'.join(boundary_branches) + ')'] + other_branches
+        return re.compile('|'.join(branches), 0 if mixed_flags else shared_flags)
+    except (re.error, OverflowError) as e:
+        logger.warning(f"Patterns not combinable, matching separately: {e}")
+        return None
+
+
+class PatternSet:
+    """Compiled patterns plus the combined alternation that locates them"""
+
+    def __init__(self, patterns: List[Tuple[Hashable, re.Pattern]]):
+        self.keys = [key for key, _ in patterns]
+        self.compiled = [compiled for _, compiled in patterns]
+        self.combined = combine_patterns(self.compiled)
+        self._subsets: Dict[Tuple[int, ...], Optional[re.Pattern]] = {}
+
+    def __len__(self) -> int:
+        return len(self.compiled)
+
+    def candidates(self, text: str, begin: int = 0, end: Optional[int] = None) -> Iterator[int]:
+        """Positions in [begin, end) where at least one pattern matches
+
+        end defaults to one past the text, which includes an empty match at
+        its very end. Requires a combined alternation.
+        """
+        end = len(text) + 1 if end is None else end
+        position = begin
+        while position < end:
+            candidate = self.combined.search(text, position)
+            if candidate is None or candidate.start() >= end:
+                return
+            yield candidate.start()
+            position = candidate.start() + 1
+
+    def _subset(self, indices: Tuple[int, ...]) -> Optional[re.Pattern]:
+        """Combined alternation over some of the patterns, cached"""
+        if indices not in self._subsets:
+            if len(self._subsets) >= MAX_CACHED_SUBSETS:
+                self._subsets.clear()
+            self._subsets[indices] = combine_patterns([self.compiled[i] for i in indices])
+        return self._subsets[indices]
+
+    def search_all(self, text: str, begin: int = 0, end: Optional[int] = None) -> Dict[Hashable, re.Match]:
+        """Leftmost match of every pattern starting in [begin, end), in one pass"""
+        found: Dict[Hashable, re.Match] = {}
+        if self.combined is None:
+            for key, compiled in zip(self.keys, self.compiled):
+                match = compiled.search(text, begin)
+                if match and (end is None or match.start() < end):
+                    found[key] = match
+            return found
+
+        # Patterns drop out of the alternation once found, so frequent
+        # matches stop producing candidates for the ones still missing
+        end = len(text) + 1 if end is None else end
+        remaining = tuple(range(len(self.compiled)))
+        combined = self.combined
+        position = begin
+        while remaining and position < end:
+            candidate = combined.search(text, position)
+            if candidate is None or candidate.start() >= end:
+                break
+            start = candidate.start()
+            still_remaining = []
+            for i in remaining:
+                match = self.compiled[i].match(text, start)
+                if match:
+                    found[self.keys[i]] = match
+                else:
+                    still_remaining.append(i)
+            if len(still_remaining) < len(remaining):
+                remaining = tuple(still_remaining)
+                combined = self._subset(remaining) if remaining else None
+                if combined is None and remaining:
+                    for i in remaining:
+                        match = self.compiled[i].search(text, start + 1)
+                        if match and match.start() < end:
+                            found[self.keys[i]] = match
+                    break
+            position = start + 1
+        return found
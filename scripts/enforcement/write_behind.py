@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+"""
+Write-Behind Queue - Context Engineering
+Batched, off-path SQLite persistence shared by the enforcement databases
+
+QUEUE MODEL:
+- Inserts are queued and return immediately; one writer thread persists them
+- The writer drains whatever is pending and commits it per database in one
+  transaction, keeping submission order within each database
+- The queue is bounded: producers block once MAX_PENDING_WRITES are waiting
+- flush() waits until everything submitted so far is committed
+- Pending writes are flushed at interpreter exit; close() waits for in-flight
+  submissions to enqueue before stopping the writer, so none are dropped
+"""
+
+import atexit
+import queue
+import sqlite3
+import threading
+import logging
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Queue limits
+MAX_PENDING_WRITES = 10000
+MAX_BATCH_SIZE = 500
+SQLITE_TIMEOUT = 30.0
+
+_STOP = object()
+
+Write = Tuple[str, str, Sequence[Any]]  # (db_path, sql, params)
+
+
+class WriteBehindQueue:
+    """Bounded queue of SQLite inserts persisted by a background writer"""
+
+    def __init__(self, max_pending: int = MAX_PENDING_WRITES, batch_size: int = MAX_BATCH_SIZE):
+        self.batch_size = batch_size
+        self._queue: queue.Queue = queue.Queue(maxsize=max_pending)
+        self._condition = threading.Condition()
+        self._submitted = 0
+        self._completed = 0
+        self._enqueuing = 0  # Accepted submissions whose put() has not returned yet
+        self._closed = False
+        self._connections: Dict[str, sqlite3.Connection] = {}
+        self.stats = {'written': 0, 'failed': 0, 'batches': 0, 'max_batch': 0}
+
+        self._writer = threading.Thread(target=self._writer_loop, name='write-behind')
+        self._writer.daemon = True
+        self._writer.start()
+
+    def submit(self, db_path: str, sql: str, params: Sequence[Any]):
+        """Queue one statement; blocks only while the queue is full"""
+        with self._condition:
+            closed = self._closed
+            if not closed:
+                self._submitted += 1
+                self._enqueuing += 1
+        if closed:
+            # Late writes after shutdown go straight to the database
+            self._write_batch([(db_path, sql, params)])
+            return
+        # The put may block on a full queue, so it runs outside the lock the writer needs
+        try:
+            self._queue.put((db_path, sql, params))
+        finally:
+            with self._condition:
+                self._enqueuing -= 1
+                self._condition.notify_all()
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Wait until every write submitted so far is committed"""
+        with self._condition:
+            target = self._submitted
+            return self._condition.wait_for(lambda: self._completed >= target, timeout)
+
+    def pending(self) -> int:
+        with self._condition:
+            return self._submitted - self._completed
+
+    def close(self):
+        """Flush pending writes and stop the writer thread"""
+        with self._condition:
+            if self._closed:
+                return
+            self._closed = True
+            # Submissions accepted before closing land ahead of the stop marker
+            self._condition.wait_for(lambda: self._enqueuing == 0)
+        self._queue.put(_STOP)
+        self._writer.join()
+
+        # Anything still queued behind the marker is written here rather than lost
+        leftover: List[Write] = []
+        while True:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is not _STOP:
+                leftover.append(item)
+        if leftover:
+            self._persist(leftover)
+        logger.debug(f"Write-behind queue closed: {self.stats}")
+
+    def _writer_loop(self):
+        while True:
+            item = self._queue.get()
+            stop = item is _STOP
+            batch: List[Write] = [] if stop else [item]
+            while not stop and len(batch) < self.batch_size:
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if item is _STOP:
+                    stop = True
+                else:
+                    batch.append(item)
+
+            if batch:
+                self._persist(batch)
+
+            if stop:
+                for conn in self._connections.values():
+                    conn.close()
+                self._connections.clear()
+                return
+
+    def _persist(self, batch: List[Write]):
+        """Write a batch and count it completed, even when it fails"""
+        try:
+            self._write_batch(batch)
+        except Exception as e:
+            logger.error(f"Write-behind batch failed: {e}")
+            self.stats['failed'] += len(batch)
+        with self._condition:
+            self._completed += len(batch)
+            self._condition.notify_all()
+
+    def _write_batch(self, batch: List[Write]):
+        """Commit a batch per database, retrying rows one by one on failure"""
+        by_database: Dict[str, List[Tuple[str, Sequence[Any]]]] = {}
+        for db_path, sql, params in batch:
+            by_database.setdefault(db_path, []).append((sql, params))
+
+        for db_path, statements in by_database.items():
+            conn = None
+            try:
+                conn = self._connection(db_path)
+                with conn:
+                    for sql, params in statements:
+                        conn.execute(sql, params)
+                self.stats['written'] += len(statements)
+            except sqlite3.Error as e:
+                logger.error(f"Batched write to {db_path} failed, retrying rows: {e}")
+                self._write_rows(db_path, statements)
+            finally:
+                if conn is not None and db_path not in self._connections:
+                    conn.close()
+
+        self.stats['batches'] += 1
+        self.stats['max_batch'] = max(self.stats['max_batch'], len(batch))
+
+    def _write_rows(self, db_path: str, statements: List[Tuple[str, Sequence[Any]]]):
+        for sql, params in statements:
+            try:
+                with sqlite3.connect(db_path, timeout=SQLITE_TIMEOUT) as conn:
+                    conn.execute(sql, params)
+                conn.close()
+                self.stats['written'] += 1
+            except sqlite3.Error as e:
+                logger.error(f"Dropped write to {db_path}: {e}")
+                self.stats['failed'] += 1
+
+    def _connection(self, db_path: str) -> sqlite3.Connection:
+        if threading.current_thread() is not self._writer:
+            return sqlite3.connect(db_path, timeout=SQLITE_TIMEOUT)
+        conn = self._connections.get(db_path)
+        if conn is None:
+            conn = self._connections[db_path] = sqlite3.connect(db_path, timeout=SQLITE_TIMEOUT)
+        return conn
+
+
+_shared_queue: Optional[WriteBehindQueue] = None
+_shared_lock = threading.Lock()
+
+
+def get_write_queue() -> WriteBehindQueue:
+    """Process-wide queue shared by every enforcement database"""
+    global _shared_queue
+    with _shared_lock:
+        if _shared_queue is None:
+            _shared_queue = WriteBehindQueue()
+            atexit.register(_shared_queue.close)
+        return _shared_queue
@@ -8,43 +8,56 @@ import os
 import json
 import time
 import psutil
+import threading
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 import argparse
 
+MAX_SCAN_WORKERS = 8  # Worktrees analyzed at once; each mostly waits on git and the filesystem
+ORIGIN_MAIN_REF = "refs/remotes/origin/main"
+REF_INFO_FORMAT = "%(refname)%00%(objectname)%00%(objectname:short)%00%(contents:subject)%00%(authordate:unix)"
+
 class ClaudeSessionMonitor:
     """Monitor and manage Claude Code sessions across git worktrees"""
     
-    def __init__(self, worktrees_dir: str = "../worktrees"):
+    def __init__(self, worktrees_dir: str = "../worktrees", max_workers: int = MAX_SCAN_WORKERS):
         self.worktrees_dir = Path(worktrees_dir)
         self.log_file = Path(__file__).parent / "session-monitor.log"
+        self.max_workers = max_workers
+        # Worktree path -> (ref state key, commit info); reused while HEAD, the index and refs are unchanged
+        self._ref_cache: Dict[str, Tuple[Tuple, Dict]] = {}
+        self._ref_cache_hits = 0
+        self._lock = threading.Lock()
         
     def log(self, message: str, level: str = "INFO"):
         """Log message with timestamp"""
         timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         log_entry = f"[{timestamp}] {level}: {message}"
-        print(log_entry)
         
-        with open(self.log_file, "a") as f:
-            f.write(log_entry + "\n")
+        with self._lock:
+            print(log_entry)
+            with open(self.log_file, "a") as f:
+                f.write(log_entry + "\n")
     
     def get_active_worktrees(self) -> List[Dict]:
         """Get list of active worktrees with metadata"""
-        worktrees = []
-        
         if not self.worktrees_dir.exists():
             self.log(f"Worktrees directory not found: {self.worktrees_dir}")
-            return worktrees
+            return []
+        
+        worktree_paths = [
+            worktree_path for worktree_path in self.worktrees_dir.iterdir()
+            if worktree_path.is_dir() and not worktree_path.name.startswith('.')
+        ]
         
-        for worktree_path in self.worktrees_dir.iterdir():
-            if worktree_path.is_dir() and not worktree_path.name.startswith('.'):
-                worktree_info = self._analyze_worktree(worktree_path)
-                if worktree_info:
-                    worktrees.append(worktree_info)
+        # Worktrees are independent, so they are analyzed on a bounded pool
+        with ThreadPoolExecutor(max_workers=max(1, min(self.max_workers, len(worktree_paths) or 1))) as executor:
+            analyzed = list(executor.map(self._analyze_worktree, worktree_paths))
         
-        return worktrees
+        return [worktree_info for worktree_info in analyzed if worktree_info]
     
     def _analyze_worktree(self, worktree_path: Path) -> Optional[Dict]:
         """Analyze individual worktree for status and metrics"""
@@ -81,52 +94,145 @@ class ClaudeSessionMonitor:
     def _get_git_info(self, worktree_path: Path) -> Dict:
         """Get git status and branch information"""
         try:
-            os.chdir(worktree_path)
-            
-            # Current branch
-            branch = subprocess.check_output(
-                ["git", "branch", "--show-current"], 
-                text=True
-            ).strip()
-            
-            # Uncommitted changes
-            status_output = subprocess.check_output(
-                ["git", "status", "--porcelain"], 
-                text=True
+            # Status always runs (working tree edits leave no trace in .git);
+            # it starts first so commit information is gathered meanwhile
+            status_process = subprocess.Popen(
+                ["git", "-C", str(worktree_path), "status", "--porcelain=v2", "--branch"],
+                stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True
             )
-            uncommitted_files = len(status_output.strip().split('\n')) if status_output.strip() else 0
-            
-            # Last commit
             try:
-                last_commit = subprocess.check_output(
-                    ["git", "log", "-1", "--format=%h %s (%ar)"], 
-                    text=True
-                ).strip()
-            except subprocess.CalledProcessError:
-                last_commit = "No commits"
+                commit_info = self._get_commit_info(worktree_path)
+            finally:
+                status_output, status_error = status_process.communicate()
+            if status_process.returncode != 0:
+                raise subprocess.CalledProcessError(status_process.returncode, "git status", stderr=status_error)
             
-            # Commits ahead of main
-            try:
-                ahead = subprocess.check_output(
-                    ["git", "rev-list", "--count", "HEAD", "^origin/main"], 
-                    text=True
-                ).strip()
-                commits_ahead = int(ahead) if ahead else 0
-            except subprocess.CalledProcessError:
-                commits_ahead = 0
+            branch = ""
+            uncommitted_files = 0
+            for line in status_output.splitlines():
+                if line.startswith("# branch.head "):
+                    head = line[len("# branch.head "):]
+                    branch = "" if head == "(detached)" else head
+                elif line and not line.startswith("#"):
+                    uncommitted_files += 1
+            
+            if commit_info["head"]:
+                short_oid, subject, author_time = commit_info["head"]
+                last_commit = f"{short_oid} {subject} ({self._format_relative_date(author_time)})"
+            else:
+                last_commit = "No commits"
             
             return {
                 "branch": branch,
                 "uncommitted_files": uncommitted_files,
                 "last_commit": last_commit,
-                "commits_ahead": commits_ahead,
+                "commits_ahead": commit_info["commits_ahead"],
                 "status": "clean" if uncommitted_files == 0 else "modified"
             }
             
         except Exception as e:
             return {"error": str(e)}
-        finally:
-            os.chdir(Path(__file__).parent)
+    
+    def _get_commit_info(self, worktree_path: Path) -> Dict:
+        """Last commit and commits ahead of origin/main, cached per ref state"""
+        git_dirs = self._resolve_git_dirs(worktree_path)
+        state_key = self._ref_state_key(*git_dirs) if git_dirs else None
+        
+        with self._lock:
+            cached = self._ref_cache.get(str(worktree_path))
+            if state_key is not None and cached and cached[0] == state_key:
+                self._ref_cache_hits += 1
+                return cached[1]
+        
+        head_ref = state_key[0][len("ref: "):] if state_key and state_key[0].startswith("ref: ") else None
+        commit_info = self._read_commit_info(worktree_path, head_ref)
+        
+        if state_key is not None:
+            with self._lock:
+                self._ref_cache[str(worktree_path)] = (state_key, commit_info)
+        return commit_info
+    
+    def _read_commit_info(self, worktree_path: Path, head_ref: Optional[str]) -> Dict:
+        """One for-each-ref over the checked-out branch and origin/main"""
+        git = ["git", "-C", str(worktree_path)]
+        patterns = [head_ref, ORIGIN_MAIN_REF] if head_ref else [ORIGIN_MAIN_REF]
+        output = subprocess.check_output(git + ["for-each-ref", f"--format={REF_INFO_FORMAT}"] + patterns, text=True)
+        
+        head = None
+        head_oid = None
+        origin_main_oid = None
+        for line in output.splitlines():
+            refname, oid, short_oid, subject, author_time = line.split("\0")
+            if refname == head_ref:
+                head_oid = oid
+                head = (short_oid, subject, int(author_time))
+            elif refname == ORIGIN_MAIN_REF:
+                origin_main_oid = oid
+        
+        # Detached HEAD has no branch ref to read; an unborn branch has no commits
+        if head is None:
+            try:
+                head_oid, short_oid, subject, author_time = subprocess.check_output(
+                    git + ["log", "-1", "--format=%H%x00%h%x00%s%x00%at"],
+                    text=True, stderr=subprocess.DEVNULL
+                ).strip().split("\0")
+                head = (short_oid, subject, int(author_time))
+            except subprocess.CalledProcessError:
+                pass
+        
+        # Commits ahead of main
+        commits_ahead = 0
+        if head_oid and origin_main_oid and head_oid != origin_main_oid:
+            try:
+                ahead = subprocess.check_output(
+                    git + ["rev-list", "--count", "HEAD", "^origin/main"],
+                    text=True, stderr=subprocess.DEVNULL
+                ).strip()
+                commits_ahead = int(ahead) if ahead else 0
+            except subprocess.CalledProcessError:
+                commits_ahead = 0
+        
+        return {"head": head, "commits_ahead": commits_ahead}
+    
+    def _resolve_git_dirs(self, worktree_path: Path) -> Optional[Tuple[Path, Path]]:
+        """(git dir, common dir) of a worktree; linked worktrees point at theirs from a .git file"""
+        dot_git = worktree_path / ".git"
+        try:
+            if dot_git.is_dir():
+                git_dir = dot_git
+            else:
+                content = dot_git.read_text().strip()
+                if not content.startswith("gitdir: "):
+                    return None
+                git_dir = (worktree_path / content[len("gitdir: "):]).resolve()
+            commondir_file = git_dir / "commondir"
+            if commondir_file.exists():
+                return git_dir, (git_dir / commondir_file.read_text().strip()).resolve()
+            return git_dir, git_dir
+        except OSError:
+            return None
+    
+    def _ref_state_key(self, git_dir: Path, common_dir: Path) -> Optional[Tuple]:
+        """HEAD plus the stat of the index and of every ref file commit info depends on"""
+        def stat_key(path: Path) -> Optional[Tuple[int, int]]:
+            try:
+                stat = path.stat()
+                return stat.st_mtime_ns, stat.st_size
+            except OSError:
+                return None
+        
+        try:
+            head = (git_dir / "HEAD").read_text().strip()
+        except OSError:
+            return None
+        branch_ref = stat_key(common_dir / head[len("ref: "):]) if head.startswith("ref: ") else None
+        return (
+            head,
+            stat_key(git_dir / "index"),
+            branch_ref,
+            stat_key(common_dir / ORIGIN_MAIN_REF),
+            stat_key(common_dir / "packed-refs")
+        )
     
     def _get_claude_session_info(self, worktree_path: Path) -> Dict:
         """Get Claude Code session information"""
@@ -269,6 +375,37 @@ class ClaudeSessionMonitor:
             minutes = int((uptime_seconds % 3600) / 60)
             return f"{hours}h {minutes}m"
     
+    def _format_relative_date(self, timestamp: int) -> str:
+        """Commit age worded like git's relative dates (%ar)"""
+        def plural(count: int, unit: str) -> str:
+            return f"{count} {unit}" if count == 1 else f"{count} {unit}s"
+        
+        diff = int(time.time()) - timestamp
+        if diff < 0:
+            return "in the future"
+        if diff < 90:
+            return f"{plural(diff, 'second')} ago"
+        diff = (diff + 30) // 60
+        if diff < 90:
+            return f"{plural(diff, 'minute')} ago"
+        diff = (diff + 30) // 60
+        if diff < 36:
+            return f"{plural(diff, 'hour')} ago"
+        diff = (diff + 12) // 24
+        if diff < 14:
+            return f"{plural(diff, 'day')} ago"
+        if diff < 70:
+            return f"{plural((diff + 3) // 7, 'week')} ago"
+        if diff < 365:
+            return f"{plural((diff + 15) // 30, 'month')} ago"
+        if diff < 1825:
+            total_months = (diff * 12 * 2 + 365) // (365 * 2)
+            years, months = divmod(total_months, 12)
+            if months:
+                return f"{plural(years, 'year')}, {plural(months, 'month')} ago"
+            return f"{plural(years, 'year')} ago"
+        return f"{plural((diff + 183) // 365, 'year')} ago"
+    
     def get_system_overview(self) -> Dict:
         """Get overall system resource usage"""
         # CPU and memory
@@ -308,7 +445,10 @@ class ClaudeSessionMonitor:
     
     def generate_dashboard(self) -> Dict:
         """Generate complete dashboard data"""
+        start_time = time.time()
+        cache_hits_before = self._ref_cache_hits
         worktrees = self.get_active_worktrees()
+        worktree_seconds = time.time() - start_time
         system = self.get_system_overview()
         
         # Summary statistics
@@ -323,7 +463,10 @@ class ClaudeSessionMonitor:
                 "active_claude_sessions": active_sessions,
                 "total_uncommitted_files": total_uncommitted,
                 "total_claude_memory_mb": total_memory_mb,
-                "generated_at": datetime.now().isoformat()
+                "generated_at": datetime.now().isoformat(),
+                "generation_seconds": time.time() - start_time,
+                "worktree_scan_seconds": worktree_seconds,
+                "git_cache_hits": self._ref_cache_hits - cache_hits_before
             },
             "system": system,
             "worktrees": worktrees,
@@ -384,7 +527,10 @@ class ClaudeSessionMonitor:
         print("\n" + "="*60)
         print("CLAUDE CODE WORKTREE DASHBOARD")
         print("="*60)
-        print(f"Generated: {dashboard['summary']['generated_at']}")
+        print(f"Generated: {dashboard['summary']['generated_at']} "
+              f"in {dashboard['summary']['generation_seconds']:.2f}s "
+              f"(worktrees {dashboard['summary']['worktree_scan_seconds']:.2f}s, "
+              f"{dashboard['summary']['git_cache_hits']} cached)")
         print()
         
         # Summary
@@ -454,10 +600,16 @@ def main():
         default=30,
         help="Update interval in seconds for watch mode (default: 30)"
     )
+    parser.add_argument(
+        "--workers", 
+        type=int, 
+        default=MAX_SCAN_WORKERS,
+        help=f"Worktrees analyzed concurrently (default: {MAX_SCAN_WORKERS})"
+    )
     
     args = parser.parse_args()
     
-    monitor = ClaudeSessionMonitor(args.worktrees_dir)
+    monitor = ClaudeSessionMonitor(args.worktrees_dir, args.workers)
     
     if args.watch:
         print("Starting watch mode... Press Ctrl+C to exit")
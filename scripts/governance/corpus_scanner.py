@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+"""
+Corpus Scanner - Context Engineering
+Single-pass file scanner shared by the governance monitors
+Implements Principle #108: Growth Governance Architecture
+
+SCANNING MODEL:
+- Walk the monitored paths once per cycle
+- Read each file once
+- Feed every registered detector from the same decoded content
+- Tokenize each file at most once, shared across detectors
+
+Adding a detector registers one more callable over already-loaded content
+instead of adding another full read of the corpus.
+"""
+
+import re
+import time
+import logging
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Set
+
+from file_counters import count_debt_markers, count_newline_lines
+
+logger = logging.getLogger(__name__)
+
+# Shared patterns, compiled once for every scan
+TECHNICAL_DEBT_PATTERN = re.compile(r'(?i)(TODO|FIXME|XXX|HACK|BUG)')
+YAML_BLOCK_PATTERN = re.compile(r'```ya?ml\s*\n.*?\n```', re.DOTALL)
+TYPED_BLOCK_PATTERN = re.compile(r'```\w+\s*\n.*?\n```', re.DOTALL)
+
+
+@dataclass
+class ScannedFile:
+    """A file loaded once and shared by every detector"""
+    path: Path
+    relative_path: str
+    raw: bytes
+    _text: Optional[str] = field(default=None, repr=False)
+    _words: Optional[List[str]] = field(default=None, repr=False)
+
+    @property
+    def text(self) -> str:
+        """Decoded content, computed on first use"""
+        if self._text is None:
+            self._text = self.raw.decode('utf-8', errors='replace')
+        return self._text
+
+    @property
+    def words(self) -> List[str]:
+        """Lowercased whitespace tokens, computed on first use"""
+        if self._words is None:
+            self._words = self.text.lower().split()
+        return self._words
+
+
+@dataclass
+class ScanResult:
+    """Per-file detector outputs from a single corpus pass"""
+    files: Dict[str, Dict[str, Any]]
+    file_count: int
+    bytes_read: int
+    scan_time: float
+
+    def values(self, detector_name: str) -> Dict[str, Any]:
+        """Return {relative_path: value} for one detector"""
+        return {
+            path: results[detector_name]
+            for path, results in self.files.items()
+            if detector_name in results
+        }
+
+
+# Detector registry: name -> callable(ScannedFile) -> value
+DETECTOR_REGISTRY: Dict[str, Callable[[ScannedFile], Any]] = {}
+
+
+def register_detector(name: str):
+    """Register a detector plugin under the given name"""
+    def decorator(func: Callable[[ScannedFile], Any]) -> Callable[[ScannedFile], Any]:
+        DETECTOR_REGISTRY[name] = func
+        return func
+    return decorator
+
+
+@register_detector('line_count')
+def detect_line_count(scanned: ScannedFile) -> int:
+    """Count lines the same way iterating the file would"""
+    return count_newline_lines(scanned.raw)
+
+
+@register_detector('technical_debt')
+def detect_technical_debt(scanned: ScannedFile) -> int:
+    """Count TODO/FIXME/XXX/HACK/BUG markers on the raw bytes"""
+    return count_debt_markers(scanned.raw)
+
+
+@register_detector('code_blocks')
+def detect_code_blocks(scanned: ScannedFile) -> Dict[str, int]:
+    """Count YAML blocks and language-tagged blocks"""
+    if b'```' not in scanned.raw:
+        return {'yaml': 0, 'typed': 0}
+    return {
+        'yaml': len(YAML_BLOCK_PATTERN.findall(scanned.text)),
+        'typed': len(TYPED_BLOCK_PATTERN.findall(scanned.text))
+    }
+
+
+@register_detector('word_set')
+def detect_word_set(scanned: ScannedFile) -> Set[str]:
+    """Unique lowercased words, used for duplication similarity"""
+    return set(scanned.words)
+
+
+class CorpusScanner:
+    """Walks monitored paths once and runs all detectors per file"""
+
+    def __init__(self, project_root: Path, monitored_paths: Iterable[str],
+                 file_pattern: str = '*.md',
+                 detectors: Optional[Dict[str, Callable[[ScannedFile], Any]]] = None):
+        self.project_root = Path(project_root)
+        self.monitored_paths = list(monitored_paths)
+        self.file_pattern = file_pattern
+        self.detectors = detectors if detectors is not None else DETECTOR_REGISTRY
+
+    def iter_files(self) -> Iterator[Path]:
+        """Yield each monitored file exactly once"""
+        seen: Set[Path] = set()
+        for path_pattern in self.monitored_paths:
+            target = self.project_root / path_pattern
+            if path_pattern.endswith('.md'):
+                candidates = [target] if target.is_file() else []
+            elif target.is_dir():
+                candidates = target.rglob(self.file_pattern)
+            else:
+                candidates = []
+
+            for file_path in candidates:
+                if file_path not in seen:
+                    seen.add(file_path)
+                    yield file_path
+
+    def read_file(self, file_path: Path) -> bytes:
+        """Read raw bytes in one call; detectors decode from this buffer"""
+        with open(file_path, 'rb') as f:
+            return f.read()
+
+    def scan(self) -> ScanResult:
+        """Run every registered detector over the corpus in one pass"""
+        start_time = time.time()
+        files: Dict[str, Dict[str, Any]] = {}
+        bytes_read = 0
+
+        for file_path in self.iter_files():
+            try:
+                raw = self.read_file(file_path)
+            except Exception as e:
+                logger.error(f"Failed to read {file_path}: {e}")
+                continue
+
+            bytes_read += len(raw)
+            relative_path = str(file_path.relative_to(self.project_root))
+            scanned = ScannedFile(path=file_path, relative_path=relative_path, raw=raw)
+
+            results = {}
+            for name, detector in self.detectors.items():
+                try:
+                    results[name] = detector(scanned)
+                except Exception as e:
+                    logger.error(f"Detector {name} failed on {relative_path}: {e}")
+            files[relative_path] = results
+
+        scan_time = time.time() - start_time
+        logger.info(f"Corpus scan completed: {len(files)} files, {bytes_read} bytes in {scan_time:.2f}s")
+
+        return ScanResult(
+            files=files,
+            file_count=len(files),
+            bytes_read=bytes_read,
+            scan_time=scan_time
+        )
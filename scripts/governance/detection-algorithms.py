@@ -20,6 +20,7 @@ DETECTION CAPABILITIES:
 """
 
 import os
+import sys
 import re
 import json
 import sqlite3
@@ -33,6 +34,9 @@ import logging
 from collections import defaultdict, Counter
 import hashlib
 import difflib
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
 from scipy import stats
 from sklearn.cluster import DBSCAN
 from sklearn.preprocessing import StandardScaler
@@ -41,6 +45,10 @@ from sklearn.ensemble import IsolationForest
 import warnings
 warnings.filterwarnings('ignore')
 
+# Add governance directory to path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+from growth_index import GrowthIndex
+
 # Configuration
 PROJECT_ROOT = Path(__file__).parent.parent.parent
 DETECTION_LOG = PROJECT_ROOT / 'scripts/results/governance/detection.log'
@@ -53,6 +61,7 @@ DETECTION_THRESHOLDS = {
     'growth_rate_warning': 0.15,  # 15% growth rate warning
     'growth_acceleration_warning': 0.25,  # 25% acceleration warning
     'duplication_similarity_min': 0.15,  # 15% minimum similarity for detection
+    'duplication_cluster_density_min': 0.0,  # Minimum edge density per cluster (0 disables cohesion splitting)
     'debt_accumulation_rate': 0.20,  # 20% debt accumulation rate
     'performance_degradation_rate': 0.10,  # 10% performance degradation
     'anomaly_threshold': 0.05,  # 5% anomaly threshold
@@ -60,6 +69,19 @@ DETECTION_THRESHOLDS = {
     'prediction_confidence': 0.80  # 80% prediction confidence
 }
 
+# Detection scheduling (per-detector time budgets in seconds)
+DETECTION_MAX_WORKERS = 6
+DETECTION_TIME_BUDGETS = {
+    'detect_growth_patterns': 60,
+    'detect_duplication_clusters': 240,
+    'detect_technical_debt_accumulation': 60,
+    'detect_performance_degradation': 60,
+    'detect_anomalies': 120,
+    'analyze_correlations': 60
+}
+DEFAULT_DETECTION_TIME_BUDGET = 120
+DETECTION_CANCEL_GRACE = 10  # Seconds a cancelled detector gets to reach its next checkpoint
+
 # Logging configuration
 os.makedirs(DETECTION_LOG.parent, exist_ok=True)
 logging.basicConfig(
@@ -108,6 +130,41 @@ class DuplicationCluster:
     average_similarity: float
     consolidation_potential: float
 
+class UnionFind:
+    """Disjoint-set forest with path halving and union by size"""
+    
+    def __init__(self, items: List[str]):
+        self.parent = {item: item for item in items}
+        self.size = {item: 1 for item in items}
+    
+    def find(self, item: str) -> str:
+        parent = self.parent
+        while parent[item] != item:
+            parent[item] = parent[parent[item]]
+            item = parent[item]
+        return item
+    
+    def union(self, a: str, b: str) -> str:
+        root_a, root_b = self.find(a), self.find(b)
+        if root_a == root_b:
+            return root_a
+        # Deterministic tie-break keeps cluster roots stable across runs
+        if (self.size[root_a], root_b) < (self.size[root_b], root_a):
+            root_a, root_b = root_b, root_a
+        self.parent[root_b] = root_a
+        self.size[root_a] += self.size[root_b]
+        return root_a
+    
+    def components(self) -> Dict[str, List[str]]:
+        groups = defaultdict(list)
+        for item in self.parent:
+            groups[self.find(item)].append(item)
+        return groups
+
+class DetectionCancelled(Exception):
+    """Raised inside a detector once its time budget has been exceeded"""
+    pass
+
 class DetectionAlgorithms:
     """Advanced detection algorithms for governance violations"""
     
@@ -118,6 +175,8 @@ class DetectionAlgorithms:
         self.file_history = defaultdict(list)
         self.content_cache = {}
         self.pattern_cache = {}
+        self._local = threading.local()
+        self.growth_index = GrowthIndex(PROJECT_ROOT, self.db_path)
         
     def init_directories(self):
         """Initialize detection directories"""
@@ -186,6 +245,7 @@ class DetectionAlgorithms:
             file_histories = self._get_file_histories()
             
             for file_path, history in file_histories.items():
+                self._check_cancelled()
                 if len(history) < 3:  # Need at least 3 data points
                     continue
                     
@@ -227,6 +287,8 @@ class DetectionAlgorithms:
             logger.info(f"Growth pattern detection completed: {len(results)} patterns detected")
             return results
             
+        except DetectionCancelled:
+            raise
         except Exception as e:
             logger.error(f"Failed to detect growth patterns: {e}")
             return []
@@ -242,11 +304,11 @@ class DetectionAlgorithms:
             if len(file_contents) < 2:
                 return results
             
-            # Calculate similarity matrix
-            similarity_matrix = self._calculate_similarity_matrix(file_contents)
+            # Build sparse similarity graph (only edges above threshold)
+            similarity_edges = self._build_similarity_graph(file_contents)
             
             # Identify duplication clusters
-            clusters = self._identify_duplication_clusters(similarity_matrix)
+            clusters = self._identify_duplication_clusters(file_contents, similarity_edges)
             
             for cluster in clusters:
                 if cluster.average_similarity > DETECTION_THRESHOLDS['duplication_similarity_min']:
@@ -271,6 +333,8 @@ class DetectionAlgorithms:
             logger.info(f"Duplication detection completed: {len(results)} clusters detected")
             return results
             
+        except DetectionCancelled:
+            raise
         except Exception as e:
             logger.error(f"Failed to detect duplication clusters: {e}")
             return []
@@ -284,6 +348,7 @@ class DetectionAlgorithms:
             debt_history = self._get_debt_history()
             
             for file_path, history in debt_history.items():
+                self._check_cancelled()
                 if len(history) < 3:
                     continue
                     
@@ -324,6 +389,8 @@ class DetectionAlgorithms:
             logger.info(f"Technical debt detection completed: {len(results)} patterns detected")
             return results
             
+        except DetectionCancelled:
+            raise
         except Exception as e:
             logger.error(f"Failed to detect technical debt accumulation: {e}")
             return []
@@ -337,6 +404,7 @@ class DetectionAlgorithms:
             performance_history = self._get_performance_history()
             
             for metric_type, history in performance_history.items():
+                self._check_cancelled()
                 if len(history) < 3:
                     continue
                     
@@ -373,6 +441,8 @@ class DetectionAlgorithms:
             logger.info(f"Performance degradation detection completed: {len(results)} patterns detected")
             return results
             
+        except DetectionCancelled:
+            raise
         except Exception as e:
             logger.error(f"Failed to detect performance degradation: {e}")
             return []
@@ -397,17 +467,20 @@ class DetectionAlgorithms:
                 return results
             
             # Scale features
+            self._check_cancelled()
             scaler = StandardScaler()
             scaled_data = scaler.fit_transform(df[numeric_cols])
             
             # Detect anomalies using Isolation Forest
             isolation_forest = IsolationForest(contamination=DETECTION_THRESHOLDS['anomaly_threshold'])
             anomaly_labels = isolation_forest.fit_predict(scaled_data)
+            self._check_cancelled()
             
             # Identify anomalies
             anomaly_indices = np.where(anomaly_labels == -1)[0]
             
             for idx in anomaly_indices:
+                self._check_cancelled()
                 row = df.iloc[idx]
                 
                 result = DetectionResult(
@@ -430,6 +503,8 @@ class DetectionAlgorithms:
             logger.info(f"Anomaly detection completed: {len(results)} anomalies detected")
             return results
             
+        except DetectionCancelled:
+            raise
         except Exception as e:
             logger.error(f"Failed to detect anomalies: {e}")
             return []
@@ -448,10 +523,12 @@ class DetectionAlgorithms:
             # Calculate correlation matrix
             df = pd.DataFrame(violation_data)
             correlation_matrix = df.corr()
+            self._check_cancelled()
             
             # Identify strong correlations
             strong_correlations = []
             for i in range(len(correlation_matrix.columns)):
+                self._check_cancelled()
                 for j in range(i+1, len(correlation_matrix.columns)):
                     corr_value = correlation_matrix.iloc[i, j]
                     if abs(corr_value) > DETECTION_THRESHOLDS['correlation_threshold']:
@@ -463,6 +540,7 @@ class DetectionAlgorithms:
             
             # Create detection results for strong correlations
             for var1, var2, correlation in strong_correlations:
+                self._check_cancelled()
                 result = DetectionResult(
                     timestamp=datetime.now(),
                     detection_type='correlation',
@@ -483,6 +561,8 @@ class DetectionAlgorithms:
             logger.info(f"Correlation analysis completed: {len(results)} correlations detected")
             return results
             
+        except DetectionCancelled:
+            raise
         except Exception as e:
             logger.error(f"Failed to analyze correlations: {e}")
             return []
@@ -493,9 +573,7 @@ class DetectionAlgorithms:
         
         logger.info("Starting detection algorithms cycle")
         
-        all_results = []
-        
-        # Execute all detection algorithms
+        # Execute all detection algorithms concurrently
         detection_functions = [
             self.detect_growth_patterns,
             self.detect_duplication_clusters,
@@ -505,15 +583,10 @@ class DetectionAlgorithms:
             self.analyze_correlations
         ]
         
-        for detect_func in detection_functions:
-            try:
-                results = detect_func()
-                all_results.extend(results)
-            except Exception as e:
-                logger.error(f"Detection function {detect_func.__name__} failed: {e}")
-        
-        # Store results
-        self._store_detection_results(all_results)
+        # Results are stored as each detector completes
+        all_results, schedule = self._run_detectors_concurrently(
+            detection_functions, self._store_detection_results
+        )
         
         # Generate pattern analysis report
         cycle_time = (datetime.now() - start_time).total_seconds()
@@ -525,7 +598,10 @@ class DetectionAlgorithms:
             'detections_by_type': defaultdict(int),
             'detections_by_severity': defaultdict(int),
             'high_risk_detections': [],
-            'pattern_summary': self._generate_pattern_summary(all_results)
+            'pattern_summary': self._generate_pattern_summary(all_results),
+            'detector_timings': schedule['timings'],
+            'timed_out_detectors': schedule['timed_out'],
+            'failed_detectors': schedule['failed']
         }
         
         for result in all_results:
@@ -539,9 +615,92 @@ class DetectionAlgorithms:
         
         return report
     
+    def _run_detectors_concurrently(self, detection_functions, on_results) -> Tuple[List[DetectionResult], Dict[str, Any]]:
+        """Run detectors on a thread pool with per-detector time budgets
+        
+        Each completed detector's results are passed to on_results as soon as
+        they arrive. Detectors that exceed their budget are signalled to stop
+        and their results are discarded; the cycle waits up to
+        DETECTION_CANCEL_GRACE for them to stop before returning.
+        """
+        all_results = []
+        schedule = {'timings': {}, 'timed_out': [], 'failed': []}
+        cancelled = {}
+        
+        executor = ThreadPoolExecutor(max_workers=DETECTION_MAX_WORKERS, thread_name_prefix='detector')
+        try:
+            pending = {}
+            for detect_func in detection_functions:
+                name = detect_func.__name__
+                cancel_event = threading.Event()
+                budget = DETECTION_TIME_BUDGETS.get(name, DEFAULT_DETECTION_TIME_BUDGET)
+                future = executor.submit(self._run_detector, detect_func, cancel_event)
+                pending[future] = (name, cancel_event, time.monotonic() + budget)
+            
+            while pending:
+                next_deadline = min(deadline for _, _, deadline in pending.values())
+                done, _ = wait(pending.keys(), timeout=max(0.0, next_deadline - time.monotonic()),
+                               return_when=FIRST_COMPLETED)
+                
+                for future in done:
+                    name, _, _ = pending.pop(future)
+                    try:
+                        results, elapsed = future.result()
+                        schedule['timings'][name] = elapsed
+                        all_results.extend(results)
+                        on_results(results)
+                    except Exception as e:
+                        schedule['failed'].append(name)
+                        logger.error(f"Detection function {name} failed: {e}")
+                
+                # Cancel detectors that overran their budget
+                now = time.monotonic()
+                for future, (name, cancel_event, deadline) in list(pending.items()):
+                    if now >= deadline:
+                        cancel_event.set()
+                        future.cancel()
+                        del pending[future]
+                        cancelled[future] = name
+                        schedule['timed_out'].append(name)
+                        logger.warning(f"Detection function {name} exceeded its time budget and was cancelled")
+            
+            # Cancelled detectors stop at their next checkpoint; whatever they
+            # return or raise by then is discarded, never stored or reported
+            if cancelled:
+                _, still_running = wait(cancelled.keys(), timeout=DETECTION_CANCEL_GRACE)
+                for future in still_running:
+                    logger.warning(f"Detection function {cancelled[future]} did not stop within "
+                                   f"{DETECTION_CANCEL_GRACE}s of cancellation")
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+        
+        return all_results, schedule
+    
+    def _run_detector(self, detect_func, cancel_event: threading.Event) -> Tuple[List[DetectionResult], float]:
+        """Run a single detector with its cancellation event bound to the worker thread"""
+        self._local.cancel_event = cancel_event
+        start = time.monotonic()
+        try:
+            results = detect_func()
+        finally:
+            self._local.cancel_event = None
+        return results, time.monotonic() - start
+    
+    def _check_cancelled(self):
+        """Abort the current detector if its time budget has been exceeded"""
+        cancel_event = getattr(self._local, 'cancel_event', None)
+        if cancel_event is not None and cancel_event.is_set():
+            raise DetectionCancelled()
+    
     def _get_file_histories(self) -> Dict[str, List[Tuple[datetime, int]]]:
-        """Get file size histories"""
-        histories = {}
+        """Get file size histories
+        
+        Served from the git-backed growth index when available; falls back
+        to recorded file_metrics_history snapshots otherwise.
+        """
+        histories = self._get_indexed_histories('file_histories')
+        if histories:
+            return histories
         
         try:
             with sqlite3.connect(self.db_path) as conn:
@@ -628,93 +787,162 @@ class DetectionAlgorithms:
                         contents[str(path.relative_to(PROJECT_ROOT))] = f.read()
                 elif path.is_dir():
                     for file_path in path.rglob('*.md'):
+                        self._check_cancelled()
                         with open(file_path, 'r', encoding='utf-8') as f:
                             contents[str(file_path.relative_to(PROJECT_ROOT))] = f.read()
         
+        except DetectionCancelled:
+            raise
         except Exception as e:
             logger.error(f"Failed to get file contents: {e}")
         
         return contents
     
-    def _calculate_similarity_matrix(self, file_contents: Dict[str, str]) -> Dict[str, Dict[str, float]]:
-        """Calculate similarity matrix between files"""
-        similarity_matrix = {}
+    def _build_similarity_graph(self, file_contents: Dict[str, str]) -> Dict[Tuple[str, str], float]:
+        """Build sparse similarity graph keyed by sorted file pairs
         
-        files = list(file_contents.keys())
+        Pairs are pruned with difflib's cheap upper bounds before the full
+        ratio is computed, so only edges above the detection threshold are
+        materialized.
+        """
+        edges = {}
+        threshold = DETECTION_THRESHOLDS['duplication_similarity_min']
+        files = sorted(file_contents.keys())
         
         for i, file1 in enumerate(files):
-            similarity_matrix[file1] = {}
+            self._check_cancelled()
+            matcher = difflib.SequenceMatcher(None, autojunk=True)
+            matcher.set_seq2(file_contents[file1])
             
-            for j, file2 in enumerate(files):
-                if i == j:
-                    similarity_matrix[file1][file2] = 1.0
-                elif file2 in similarity_matrix and file1 in similarity_matrix[file2]:
-                    similarity_matrix[file1][file2] = similarity_matrix[file2][file1]
-                else:
-                    similarity = self._calculate_text_similarity(file_contents[file1], file_contents[file2])
-                    similarity_matrix[file1][file2] = similarity
-        
-        return similarity_matrix
-    
-    def _calculate_text_similarity(self, text1: str, text2: str) -> float:
-        """Calculate similarity between two texts"""
-        try:
-            # Use difflib for similarity calculation
-            matcher = difflib.SequenceMatcher(None, text1, text2)
-            return matcher.ratio()
-        except Exception as e:
-            logger.error(f"Failed to calculate text similarity: {e}")
-            return 0.0
+            for file2 in files[i + 1:]:
+                matcher.set_seq1(file_contents[file2])
+                if matcher.real_quick_ratio() <= threshold or matcher.quick_ratio() <= threshold:
+                    continue
+                
+                similarity = matcher.ratio()
+                if similarity > threshold:
+                    edges[(file1, file2)] = similarity
+        
+        return edges
     
-    def _identify_duplication_clusters(self, similarity_matrix: Dict[str, Dict[str, float]]) -> List[DuplicationCluster]:
-        """Identify duplication clusters from similarity matrix"""
+    def _identify_duplication_clusters(self, file_contents: Dict[str, str],
+                                       similarity_edges: Dict[Tuple[str, str], float]) -> List[DuplicationCluster]:
+        """Identify duplication clusters as connected components of the similarity graph
+        
+        Average similarity covers every pair of cluster members, as the
+        severity grading expects. Pairs missing from the graph are diffed here
+        in the graph's orientation, one matcher per row: k*(k-1)/2 - e ratio()
+        calls for k files and e edges, the cluster's full all-pairs cost for a
+        chain. The quick_ratio bounds only give a ceiling, which these pairs
+        already fell under, so they cannot replace the ratio.
+        """
         clusters = []
         
         try:
-            # Use simple clustering based on similarity threshold
-            files = list(similarity_matrix.keys())
-            visited = set()
+            components = self._connected_components(list(file_contents.keys()), similarity_edges)
+            
+            density_min = DETECTION_THRESHOLDS['duplication_cluster_density_min']
+            if density_min > 0:
+                components = [
+                    part
+                    for members, member_edges in components
+                    for part in self._split_incoherent_component(members, member_edges, density_min)
+                ]
             
-            for file1 in files:
-                if file1 in visited:
+            for cluster_files, cluster_edges in components:
+                self._check_cancelled()
+                if len(cluster_files) < 2:
                     continue
                 
-                cluster_files = [file1]
-                visited.add(file1)
+                # Reuse precomputed edge weights, computing only the missing pairs
+                neighbours = {f: {} for f in cluster_files}
+                similarities = []
+                for i, file1 in enumerate(cluster_files):
+                    self._check_cancelled()
+                    matcher = None
+                    for file2 in cluster_files[i + 1:]:
+                        similarity = cluster_edges.get((file1, file2))
+                        if similarity is None:
+                            # Same orientation as _build_similarity_graph, so a
+                            # pair scores the same whichever path computes it
+                            if matcher is None:
+                                matcher = difflib.SequenceMatcher(None, autojunk=True)
+                                matcher.set_seq2(file_contents[file1])
+                            matcher.set_seq1(file_contents[file2])
+                            similarity = matcher.ratio()
+                        neighbours[file1][file2] = similarity
+                        neighbours[file2][file1] = similarity
+                        similarities.append(similarity)
                 
-                for file2 in files:
-                    if file2 != file1 and file2 not in visited:
-                        if similarity_matrix[file1][file2] > DETECTION_THRESHOLDS['duplication_similarity_min']:
-                            cluster_files.append(file2)
-                            visited.add(file2)
+                avg_similarity = sum(similarities) / len(similarities)
                 
-                if len(cluster_files) > 1:
-                    # Calculate cluster metrics
-                    similarities = []
-                    for i in range(len(cluster_files)):
-                        for j in range(i+1, len(cluster_files)):
-                            similarities.append(similarity_matrix[cluster_files[i]][cluster_files[j]])
-                    
-                    avg_similarity = sum(similarities) / len(similarities) if similarities else 0
-                    
-                    cluster = DuplicationCluster(
-                        cluster_id=f"cluster_{len(clusters)}",
-                        files=cluster_files,
-                        similarity_matrix={f: similarity_matrix[f] for f in cluster_files},
-                        average_similarity=avg_similarity,
-                        consolidation_potential=avg_similarity * len(cluster_files)
-                    )
-                    
-                    clusters.append(cluster)
+                cluster = DuplicationCluster(
+                    cluster_id=f"cluster_{len(clusters)}",
+                    files=cluster_files,
+                    similarity_matrix=neighbours,
+                    average_similarity=avg_similarity,
+                    consolidation_potential=avg_similarity * len(cluster_files)
+                )
+                
+                clusters.append(cluster)
         
+        except DetectionCancelled:
+            raise
         except Exception as e:
             logger.error(f"Failed to identify duplication clusters: {e}")
         
         return clusters
     
+    def _connected_components(self, files: List[str],
+                              edges: Dict[Tuple[str, str], float]) -> List[Tuple[List[str], Dict[Tuple[str, str], float]]]:
+        """Group files into connected components with union-find
+        
+        Returns (sorted members, intra-component edges) per component, ordered
+        by first member, so output is independent of input ordering.
+        """
+        union_find = UnionFind(files)
+        for file1, file2 in edges:
+            union_find.union(file1, file2)
+        
+        component_edges = defaultdict(dict)
+        for pair, similarity in edges.items():
+            component_edges[union_find.find(pair[0])][pair] = similarity
+        
+        components = [
+            (sorted(members), component_edges.get(root, {}))
+            for root, members in union_find.components().items()
+        ]
+        components.sort(key=lambda component: component[0][0])
+        return components
+    
+    def _split_incoherent_component(self, members: List[str], edges: Dict[Tuple[str, str], float],
+                                    density_min: float) -> List[Tuple[List[str], Dict[Tuple[str, str], float]]]:
+        """Split loosely chained components by raising the edge threshold
+        
+        A component whose edge density (edges / possible pairs) is below
+        density_min is re-clustered using only edges at or above its median
+        weight, recursively, until every part is cohesive.
+        """
+        possible_pairs = len(members) * (len(members) - 1) / 2
+        if len(members) < 3 or len(edges) / possible_pairs >= density_min:
+            return [(members, edges)]
+        
+        weights = sorted(edges.values())
+        median = weights[len(weights) // 2]
+        strong_edges = {pair: w for pair, w in edges.items() if w >= median}
+        if len(strong_edges) == len(edges):
+            return [(members, edges)]
+        
+        parts = []
+        for part_members, part_edges in self._connected_components(members, strong_edges):
+            parts.extend(self._split_incoherent_component(part_members, part_edges, density_min))
+        return parts
+    
     def _get_debt_history(self) -> Dict[str, List[Tuple[datetime, int]]]:
         """Get technical debt history"""
-        histories = {}
+        histories = self._get_indexed_histories('debt_histories')
+        if histories:
+            return histories
         
         try:
             with sqlite3.connect(self.db_path) as conn:
@@ -739,6 +967,17 @@ class DetectionAlgorithms:
         
         return histories
     
+    def _get_indexed_histories(self, series_name: str) -> Dict[str, List[Tuple[datetime, int]]]:
+        """Catch the growth index up to HEAD and return the requested series"""
+        try:
+            if not self.growth_index.available:
+                return {}
+            self.growth_index.update()
+            return getattr(self.growth_index, series_name)()
+        except Exception as e:
+            logger.error(f"Failed to read growth index: {e}")
+            return {}
+    
     def _get_performance_history(self) -> Dict[str, List[Tuple[datetime, float]]]:
         """Get performance metrics history"""
         histories = {}
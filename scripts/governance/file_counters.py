@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+File Counters - Context Engineering
+Fast byte-level line and marker counting for file-size checks
+Implements Principle #108: Growth Governance Architecture
+
+COUNTING MODEL:
+- Counts line breaks on raw bytes (no UTF-8 decoding, no per-line iteration),
+  treating \n, \r\n and bare \r as text-mode iteration does
+- Maps large files with mmap; small files are read in one call
+- Optional early exit once a line threshold has been crossed
+- Debt markers (TODO/FIXME/XXX/HACK/BUG) are counted on a caller's buffer, so
+  the corpus scanner gets lines and markers from the one read it already did
+"""
+
+import mmap
+import logging
+from pathlib import Path
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+# Files at or above this size are mapped instead of read into a buffer
+MMAP_THRESHOLD_BYTES = 64 * 1024
+
+# Line breaks are counted in chunks of this size when early exit is requested
+SCAN_CHUNK_BYTES = 1024 * 1024
+
+# Equivalent to (?i)(TODO|FIXME|XXX|HACK|BUG): no marker can overlap another,
+# so per-marker bytes.count on lowercased data gives the same total
+DEBT_MARKERS = (b'todo', b'fixme', b'xxx', b'hack', b'bug')
+
+
+def count_newline_lines(data, size: Optional[int] = None) -> int:
+    """Line count as text iteration would report it, computed on bytes"""
+    size = len(data) if size is None else size
+    if size == 0:
+        return 0
+    breaks = _count_line_breaks(data) if isinstance(data, bytes) else _count_chunked(data, size, None)[0]
+    return _lines_from_breaks(data, size, breaks)
+
+
+def count_debt_markers(data) -> int:
+    """Count TODO/FIXME/XXX/HACK/BUG markers, case-insensitively"""
+    lowered = (data if isinstance(data, bytes) else data[:]).lower()
+    return sum(lowered.count(marker) for marker in DEBT_MARKERS)
+
+
+def count_lines(file_path: Path, stop_after: Optional[int] = None) -> int:
+    """Count lines in a file, optionally stopping once stop_after is exceeded
+
+    When the scan stops early the returned value is a lower bound that is
+    guaranteed to be greater than stop_after.
+    """
+    try:
+        with open(file_path, 'rb') as f:
+            size = f.seek(0, 2)
+            f.seek(0)
+            if size == 0:
+                return 0
+            if size < MMAP_THRESHOLD_BYTES:
+                return _count_buffer_lines(f.read(), size, stop_after)
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                return _count_buffer_lines(mapped, size, stop_after)
+    except Exception as e:
+        logger.error(f"Failed to count lines in {file_path}: {e}")
+        return 0
+
+
+def _count_buffer_lines(data, size: int, stop_after: Optional[int]) -> int:
+    if stop_after is None:
+        return count_newline_lines(data, size)
+    breaks, truncated = _count_chunked(data, size, stop_after)
+    return breaks if truncated else _lines_from_breaks(data, size, breaks)
+
+
+def _count_line_breaks(chunk: bytes) -> int:
+    """Line breaks as universal newlines reads them: \n, \r\n or a bare \r"""
+    breaks = chunk.count(b'\n')
+    carriage_returns = chunk.count(b'\r')
+    if carriage_returns:
+        breaks += carriage_returns - chunk.count(b'\r\n')
+    return breaks
+
+
+def _lines_from_breaks(data, size: int, breaks: int) -> int:
+    """A last line without a line break still counts as a line"""
+    return breaks if data[size - 1:size] in (b'\n', b'\r') else breaks + 1
+
+
+def _count_chunked(data, size: int, stop_after: Optional[int]):
+    """Count line breaks chunk by chunk, returning (count, stopped_early)"""
+    breaks = 0
+    for start in range(0, size, SCAN_CHUNK_BYTES):
+        end = start + SCAN_CHUNK_BYTES
+        chunk = data[start:end]
+        breaks += _count_line_breaks(chunk)
+        # A \r\n split across chunks was counted as two breaks
+        if chunk.endswith(b'\r') and data[end:end + 1] == b'\n':
+            breaks -= 1
+        if stop_after is not None and breaks > stop_after:
+            return breaks, True
+    return breaks, False
@@ -20,6 +20,7 @@ GOVERNANCE AREAS:
 """
 
 import os
+import sys
 import json
 import sqlite3
 import subprocess
@@ -36,6 +37,10 @@ import tempfile
 from collections import defaultdict
 import shutil
 
+# Add governance directory to path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+from corpus_scanner import CorpusScanner, ScanResult
+
 # Configuration
 PROJECT_ROOT = Path(__file__).parent.parent.parent
 GOVERNANCE_DB = PROJECT_ROOT / 'scripts/results/governance/governance.db'
@@ -127,6 +132,8 @@ class GovernanceEngine:
         self.metrics_cache = {}
         self.violation_history = []
         self.response_times = []
+        self.scanner = CorpusScanner(PROJECT_ROOT, MONITORED_PATHS)
+        self._scan_result: Optional[ScanResult] = None
         
     def init_directories(self):
         """Initialize governance directories"""
@@ -231,48 +238,24 @@ class GovernanceEngine:
         violations = []
         
         try:
-            for path_pattern in MONITORED_PATHS:
-                if path_pattern.endswith('.md'):
-                    # Single file
-                    file_path = PROJECT_ROOT / path_pattern
-                    if file_path.exists():
-                        line_count = self._count_lines(file_path)
-                        if line_count > GOVERNANCE_THRESHOLDS['file_size_max_lines']:
-                            violation = GovernanceViolation(
-                                timestamp=datetime.now(),
-                                violation_type='file_size',
-                                severity='high',
-                                file_path=str(file_path.relative_to(PROJECT_ROOT)),
-                                current_value=line_count,
-                                threshold_value=GOVERNANCE_THRESHOLDS['file_size_max_lines'],
-                                description=f"File exceeds {GOVERNANCE_THRESHOLDS['file_size_max_lines']} lines",
-                                automated_fix_available=True,
-                                estimated_fix_time=300,  # 5 minutes
-                                risk_level='high',
-                                impact_score=0.8
-                            )
-                            violations.append(violation)
-                else:
-                    # Directory pattern
-                    directory = PROJECT_ROOT / path_pattern
-                    if directory.exists():
-                        for file_path in directory.rglob('*.md'):
-                            line_count = self._count_lines(file_path)
-                            if line_count > GOVERNANCE_THRESHOLDS['file_size_max_lines']:
-                                violation = GovernanceViolation(
-                                    timestamp=datetime.now(),
-                                    violation_type='file_size',
-                                    severity='high',
-                                    file_path=str(file_path.relative_to(PROJECT_ROOT)),
-                                    current_value=line_count,
-                                    threshold_value=GOVERNANCE_THRESHOLDS['file_size_max_lines'],
-                                    description=f"File exceeds {GOVERNANCE_THRESHOLDS['file_size_max_lines']} lines",
-                                    automated_fix_available=True,
-                                    estimated_fix_time=300,  # 5 minutes
-                                    risk_level='high',
-                                    impact_score=0.8
-                                )
-                                violations.append(violation)
+            line_counts = self._get_corpus_scan().values('line_count')
+            
+            for file_path, line_count in line_counts.items():
+                if line_count > GOVERNANCE_THRESHOLDS['file_size_max_lines']:
+                    violation = GovernanceViolation(
+                        timestamp=datetime.now(),
+                        violation_type='file_size',
+                        severity='high',
+                        file_path=file_path,
+                        current_value=line_count,
+                        threshold_value=GOVERNANCE_THRESHOLDS['file_size_max_lines'],
+                        description=f"File exceeds {GOVERNANCE_THRESHOLDS['file_size_max_lines']} lines",
+                        automated_fix_available=True,
+                        estimated_fix_time=300,  # 5 minutes
+                        risk_level='high',
+                        impact_score=0.8
+                    )
+                    violations.append(violation)
             
             logger.info(f"File size monitoring completed: {len(violations)} violations found")
             return violations
@@ -286,25 +269,14 @@ class GovernanceEngine:
         violations = []
         
         try:
-            file_contents = {}
-            
-            # Collect all markdown files
-            for path_pattern in MONITORED_PATHS:
-                if path_pattern.endswith('.md'):
-                    file_path = PROJECT_ROOT / path_pattern
-                    if file_path.exists():
-                        file_contents[str(file_path.relative_to(PROJECT_ROOT))] = self._read_file_content(file_path)
-                else:
-                    directory = PROJECT_ROOT / path_pattern
-                    if directory.exists():
-                        for file_path in directory.rglob('*.md'):
-                            file_contents[str(file_path.relative_to(PROJECT_ROOT))] = self._read_file_content(file_path)
+            # Word sets come from the shared corpus scan
+            file_words = self._get_corpus_scan().values('word_set')
             
             # Compare files for duplication
-            file_pairs = [(f1, f2) for f1 in file_contents.keys() for f2 in file_contents.keys() if f1 < f2]
+            file_pairs = [(f1, f2) for f1 in file_words.keys() for f2 in file_words.keys() if f1 < f2]
             
             for file1, file2 in file_pairs:
-                similarity = self._calculate_similarity(file_contents[file1], file_contents[file2])
+                similarity = self._calculate_word_set_similarity(file_words[file1], file_words[file2])
                 if similarity > GOVERNANCE_THRESHOLDS['duplication_threshold']:
                     violation = GovernanceViolation(
                         timestamp=datetime.now(),
@@ -336,22 +308,10 @@ class GovernanceEngine:
             total_debt = 0
             debt_files = {}
             
-            for path_pattern in MONITORED_PATHS:
-                if path_pattern.endswith('.md'):
-                    file_path = PROJECT_ROOT / path_pattern
-                    if file_path.exists():
-                        debt_count = self._count_technical_debt(file_path)
-                        total_debt += debt_count
-                        if debt_count > 0:
-                            debt_files[str(file_path.relative_to(PROJECT_ROOT))] = debt_count
-                else:
-                    directory = PROJECT_ROOT / path_pattern
-                    if directory.exists():
-                        for file_path in directory.rglob('*.md'):
-                            debt_count = self._count_technical_debt(file_path)
-                            total_debt += debt_count
-                            if debt_count > 0:
-                                debt_files[str(file_path.relative_to(PROJECT_ROOT))] = debt_count
+            for file_path, debt_count in self._get_corpus_scan().values('technical_debt').items():
+                total_debt += debt_count
+                if debt_count > 0:
+                    debt_files[file_path] = debt_count
             
             if total_debt > GOVERNANCE_THRESHOLDS['technical_debt_max']:
                 violation = GovernanceViolation(
@@ -445,6 +405,9 @@ class GovernanceEngine:
         
         all_violations = []
         
+        # Read the corpus once and share it across all monitors
+        self._scan_result = self.scanner.scan()
+        
         # Execute all monitoring functions
         monitoring_functions = [
             self.monitor_file_sizes,
@@ -461,6 +424,13 @@ class GovernanceEngine:
             except Exception as e:
                 logger.error(f"Monitoring function {monitor_func.__name__} failed: {e}")
         
+        scan_stats = {
+            'files_scanned': self._scan_result.file_count,
+            'bytes_read': self._scan_result.bytes_read,
+            'scan_time': self._scan_result.scan_time
+        }
+        self._scan_result = None
+        
         # Store violations in database
         self._store_violations(all_violations)
         
@@ -481,7 +451,8 @@ class GovernanceEngine:
             'violations_by_type': defaultdict(int),
             'violations_by_severity': defaultdict(int),
             'system_health': self._calculate_system_health(all_violations),
-            'governance_effectiveness': self._calculate_governance_effectiveness()
+            'governance_effectiveness': self._calculate_governance_effectiveness(),
+            'corpus_scan': scan_stats
         }
         
         for violation in all_violations:
@@ -492,14 +463,11 @@ class GovernanceEngine:
         
         return report
     
-    def _count_lines(self, file_path: Path) -> int:
-        """Count lines in a file"""
-        try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                return sum(1 for _ in f)
-        except Exception as e:
-            logger.error(f"Failed to count lines in {file_path}: {e}")
-            return 0
+    def _get_corpus_scan(self) -> ScanResult:
+        """Return the current cycle's corpus scan, scanning if none is active"""
+        if self._scan_result is None:
+            return self.scanner.scan()
+        return self._scan_result
     
     def _read_file_content(self, file_path: Path) -> str:
         """Read file content safely"""
@@ -510,38 +478,13 @@ class GovernanceEngine:
             logger.error(f"Failed to read {file_path}: {e}")
             return ""
     
-    def _calculate_similarity(self, content1: str, content2: str) -> float:
-        """Calculate similarity between two strings"""
-        try:
-            # Simple similarity based on common substrings
-            if not content1 or not content2:
-                return 0.0
-            
-            # Use set of words for similarity
-            words1 = set(content1.lower().split())
-            words2 = set(content2.lower().split())
-            
-            if not words1 or not words2:
-                return 0.0
-            
-            intersection = words1.intersection(words2)
-            union = words1.union(words2)
-            
-            return len(intersection) / len(union)
-        except Exception as e:
-            logger.error(f"Failed to calculate similarity: {e}")
+    def _calculate_word_set_similarity(self, words1: Set[str], words2: Set[str]) -> float:
+        """Calculate Jaccard similarity between two word sets"""
+        if not words1 or not words2:
             return 0.0
-    
-    def _count_technical_debt(self, file_path: Path) -> int:
-        """Count TODO/FIXME items in a file"""
-        try:
-            content = self._read_file_content(file_path)
-            todo_pattern = r'(?i)(TODO|FIXME|XXX|HACK|BUG)'
-            matches = re.findall(todo_pattern, content)
-            return len(matches)
-        except Exception as e:
-            logger.error(f"Failed to count technical debt in {file_path}: {e}")
-            return 0
+        
+        intersection = len(words1 & words2)
+        return intersection / (len(words1) + len(words2) - intersection)
     
     def _calculate_cognitive_steps(self) -> float:
         """Calculate cognitive steps for navigation"""
@@ -572,20 +515,9 @@ class GovernanceEngine:
             yaml_blocks = 0
             p55_compliant = 0
             
-            for path_pattern in MONITORED_PATHS:
-                if path_pattern.endswith('.md'):
-                    file_path = PROJECT_ROOT / path_pattern
-                    if file_path.exists():
-                        content = self._read_file_content(file_path)
-                        yaml_blocks += len(re.findall(r'```ya?ml\s*\n.*?\n```', content, re.DOTALL))
-                        p55_compliant += len(re.findall(r'```\w+\s*\n.*?\n```', content, re.DOTALL))
-                else:
-                    directory = PROJECT_ROOT / path_pattern
-                    if directory.exists():
-                        for file_path in directory.rglob('*.md'):
-                            content = self._read_file_content(file_path)
-                            yaml_blocks += len(re.findall(r'```ya?ml\s*\n.*?\n```', content, re.DOTALL))
-                            p55_compliant += len(re.findall(r'```\w+\s*\n.*?\n```', content, re.DOTALL))
+            for block_counts in self._get_corpus_scan().values('code_blocks').values():
+                yaml_blocks += block_counts['yaml']
+                p55_compliant += block_counts['typed']
             
             if yaml_blocks + p55_compliant == 0:
                 return 1.0  # 100% compliant if no blocks
@@ -0,0 +1,268 @@
+#!/usr/bin/env python3
+"""
+Growth Index - Context Engineering
+Git-history backed per-file growth series for detection algorithms
+Implements Principle #108: Growth Governance Architecture
+
+INDEX MODEL:
+- Per-file series of (commit timestamp, line count, debt marker count)
+- Series stored as compact arrays (BLOBs) in the detection database
+- Populated from `git log --numstat -p -U0` along the first-parent chain
+- Incremental: only commits after the last indexed SHA are read
+- Full rebuild when the indexed SHA is no longer an ancestor of HEAD
+"""
+
+import codecs
+import sqlite3
+import subprocess
+import threading
+import logging
+from array import array
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from corpus_scanner import TECHNICAL_DEBT_PATTERN
+
+logger = logging.getLogger(__name__)
+
+# Files tracked by the index
+DEFAULT_PATHSPECS = ['*.md']
+
+COMMIT_MARKER = '\x00'
+
+
+def _diff_path(raw: str) -> str:
+    """Path from a numstat or ---/+++ line, without git's tab and C-quoting
+
+    git ends ---/+++ paths containing spaces with a tab, and quotes paths
+    holding control characters, quotes or backslashes even with
+    core.quotePath off.
+    """
+    path = raw.rstrip('\t')
+    if len(path) >= 2 and path[0] == path[-1] == '"':
+        path = codecs.escape_decode(path[1:-1].encode('utf-8'))[0].decode('utf-8', errors='replace')
+    return path
+
+
+class GrowthSeries:
+    """Compact time series for one file"""
+
+    __slots__ = ('timestamps', 'lines', 'debt')
+
+    def __init__(self, timestamps: Optional[array] = None, lines: Optional[array] = None,
+                 debt: Optional[array] = None):
+        self.timestamps = timestamps if timestamps is not None else array('d')
+        self.lines = lines if lines is not None else array('q')
+        self.debt = debt if debt is not None else array('q')
+
+    def __len__(self) -> int:
+        return len(self.timestamps)
+
+    def append(self, timestamp: float, line_delta: int, debt_delta: int):
+        """Append a point relative to the latest known counts"""
+        current_lines = self.lines[-1] if self.lines else 0
+        current_debt = self.debt[-1] if self.debt else 0
+        self.timestamps.append(timestamp)
+        self.lines.append(max(0, current_lines + line_delta))
+        self.debt.append(max(0, current_debt + debt_delta))
+
+    def line_history(self) -> List[Tuple[datetime, int]]:
+        return [(datetime.fromtimestamp(ts), n) for ts, n in zip(self.timestamps, self.lines)]
+
+    def debt_history(self) -> List[Tuple[datetime, int]]:
+        return [(datetime.fromtimestamp(ts), n) for ts, n in zip(self.timestamps, self.debt) if n > 0]
+
+    def to_row(self) -> Tuple[bytes, bytes, bytes]:
+        return self.timestamps.tobytes(), self.lines.tobytes(), self.debt.tobytes()
+
+    @classmethod
+    def from_row(cls, timestamps: bytes, lines: bytes, debt: bytes) -> 'GrowthSeries':
+        series = cls()
+        series.timestamps.frombytes(timestamps)
+        series.lines.frombytes(lines)
+        series.debt.frombytes(debt)
+        return series
+
+
+class GrowthIndex:
+    """Persistent, incrementally updated growth index built from git history"""
+
+    def __init__(self, repo_root: Path, db_path: Path, pathspecs: Optional[List[str]] = None):
+        self.repo_root = Path(repo_root)
+        self.db_path = db_path
+        self.pathspecs = pathspecs or DEFAULT_PATHSPECS
+        self.series: Dict[str, GrowthSeries] = {}
+        self.last_sha: Optional[str] = None
+        self._lock = threading.Lock()
+        self._loaded = False
+        self.available = self._git('rev-parse', '--is-inside-work-tree') is not None
+        if self.available:
+            self.init_database()
+
+    def init_database(self):
+        """Initialize growth index tables"""
+        with sqlite3.connect(self.db_path) as conn:
+            conn.execute('''
+                CREATE TABLE IF NOT EXISTS growth_index_series (
+                    file_path TEXT PRIMARY KEY,
+                    timestamps BLOB NOT NULL,
+                    line_counts BLOB NOT NULL,
+                    debt_counts BLOB NOT NULL
+                )
+            ''')
+            conn.execute('''
+                CREATE TABLE IF NOT EXISTS growth_index_state (
+                    key TEXT PRIMARY KEY,
+                    value TEXT NOT NULL
+                )
+            ''')
+            conn.commit()
+
+    def update(self) -> int:
+        """Bring the index up to HEAD, returning the number of commits indexed"""
+        if not self.available:
+            return 0
+
+        with self._lock:
+            if not self._loaded:
+                self._load()
+
+            head = self._git('rev-parse', 'HEAD')
+            if head is None:
+                return 0
+            head = head.strip()
+            if head == self.last_sha:
+                return 0
+
+            if self.last_sha and self._git('merge-base', '--is-ancestor', self.last_sha, head) is None:
+                logger.info("Indexed commit is no longer in history, rebuilding growth index")
+                self.series = {}
+                self.last_sha = None
+                self._clear()
+
+            revision_range = f"{self.last_sha}..{head}" if self.last_sha else head
+            changed, commit_count = self._index_commits(revision_range)
+
+            self.last_sha = head
+            self._save(changed)
+            logger.info(f"Growth index updated: {commit_count} commits, {len(changed)} files changed")
+            return commit_count
+
+    def file_histories(self) -> Dict[str, List[Tuple[datetime, int]]]:
+        """Line count series per file"""
+        return {path: series.line_history() for path, series in self.series.items()}
+
+    def debt_histories(self) -> Dict[str, List[Tuple[datetime, int]]]:
+        """Debt marker series per file (points with outstanding debt only)"""
+        histories = {}
+        for path, series in self.series.items():
+            history = series.debt_history()
+            if history:
+                histories[path] = history
+        return histories
+
+    def _index_commits(self, revision_range: str) -> Tuple[set, int]:
+        """Apply numstat and patch deltas for every commit in the range"""
+        output = self._git(
+            '-c', 'core.quotePath=false', 'log', '--reverse', '--first-parent', '-m',
+            '--format=%x00%H %ct', '--numstat', '-p', '-U0',
+            '--no-color', '--no-renames', '--no-ext-diff', revision_range, '--', *self.pathspecs
+        )
+        if output is None:
+            return set(), 0
+
+        changed = set()
+        commit_count = 0
+        for timestamp, line_deltas, debt_deltas in self._parse_log(output):
+            commit_count += 1
+            for path, line_delta in line_deltas.items():
+                series = self.series.get(path)
+                if series is None:
+                    series = self.series[path] = GrowthSeries()
+                series.append(timestamp, line_delta, debt_deltas.get(path, 0))
+                changed.add(path)
+
+        return changed, commit_count
+
+    def _parse_log(self, output: str) -> Iterator[Tuple[float, Dict[str, int], Dict[str, int]]]:
+        """Yield (timestamp, line deltas, debt deltas) per commit"""
+        for chunk in output.split(COMMIT_MARKER):
+            if not chunk.strip():
+                continue
+
+            lines = chunk.split('\n')
+            _, timestamp = lines[0].split(' ', 1)
+            line_deltas: Dict[str, int] = {}
+            debt_deltas: Dict[str, int] = {}
+            current_file = None
+            in_hunk = False
+
+            for line in lines[1:]:
+                if not in_hunk and '\t' in line and not line.startswith(('+', '-', 'diff ', '@@')):
+                    added, deleted, path = line.split('\t', 2)
+                    if added != '-':  # Binary files report '-'
+                        line_deltas[_diff_path(path)] = int(added) - int(deleted)
+                elif line.startswith('diff --git '):
+                    current_file = None
+                    in_hunk = False
+                elif not in_hunk and line.startswith(('--- ', '+++ ')):
+                    path = _diff_path(line[4:])
+                    if path[:2] in ('a/', 'b/'):  # /dev/null keeps the other side's path
+                        current_file = path[2:]
+                elif line.startswith('@@'):
+                    in_hunk = True
+                elif in_hunk and current_file and line[:1] in ('+', '-'):
+                    markers = len(TECHNICAL_DEBT_PATTERN.findall(line, 1))
+                    if markers:
+                        sign = 1 if line[0] == '+' else -1
+                        debt_deltas[current_file] = debt_deltas.get(current_file, 0) + sign * markers
+
+            yield float(timestamp), line_deltas, debt_deltas
+
+    def _load(self):
+        """Load persisted series and the last indexed SHA"""
+        with sqlite3.connect(self.db_path) as conn:
+            row = conn.execute(
+                "SELECT value FROM growth_index_state WHERE key = 'last_sha'"
+            ).fetchone()
+            self.last_sha = row[0] if row else None
+            for file_path, timestamps, lines, debt in conn.execute(
+                'SELECT file_path, timestamps, line_counts, debt_counts FROM growth_index_series'
+            ):
+                self.series[file_path] = GrowthSeries.from_row(timestamps, lines, debt)
+        self._loaded = True
+
+    def _save(self, changed: set):
+        """Persist changed series and the indexed SHA in one transaction"""
+        with sqlite3.connect(self.db_path) as conn:
+            conn.executemany(
+                'INSERT OR REPLACE INTO growth_index_series '
+                '(file_path, timestamps, line_counts, debt_counts) VALUES (?, ?, ?, ?)',
+                [(path, *self.series[path].to_row()) for path in changed]
+            )
+            conn.execute(
+                "INSERT OR REPLACE INTO growth_index_state (key, value) VALUES ('last_sha', ?)",
+                (self.last_sha,)
+            )
+            conn.commit()
+
+    def _clear(self):
+        with sqlite3.connect(self.db_path) as conn:
+            conn.execute('DELETE FROM growth_index_series')
+            conn.execute('DELETE FROM growth_index_state')
+            conn.commit()
+
+    def _git(self, *args: str) -> Optional[str]:
+        """Run a git command in the repository, returning stdout or None on failure"""
+        try:
+            result = subprocess.run(
+                ['git', '-C', str(self.repo_root), *args],
+                capture_output=True, text=True, errors='replace'
+            )
+        except (OSError, ValueError) as e:
+            logger.error(f"Failed to run git: {e}")
+            return None
+        if result.returncode != 0:
+            return None
+        return result.stdout
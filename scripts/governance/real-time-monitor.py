@@ -46,6 +46,10 @@ except ImportError:
     WATCHDOG_AVAILABLE = False
     logging.warning("watchdog not available, using polling mode")
 
+# Add governance directory to path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+from file_counters import count_lines
+
 # Configuration
 PROJECT_ROOT = Path(__file__).parent.parent.parent
 GOVERNANCE_ENGINE = Path(__file__).parent / 'governance-engine.py'
@@ -174,13 +178,8 @@ class GovernanceFileHandler(FileSystemEventHandler):
             return False
     
     def _count_lines(self, file_path: Path) -> int:
-        """Count lines in a file"""
-        try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                return sum(1 for _ in f)
-        except Exception as e:
-            logger.error(f"Failed to count lines in {file_path}: {e}")
-            return 0
+        """Count lines in a file, stopping once the size threshold is exceeded"""
+        return count_lines(file_path, stop_after=self.thresholds['file_size_max_lines'])
     
     def _add_event_to_queue(self, event: MonitoringEvent):
         """Add event to processing queue with debouncing"""
@@ -520,13 +519,8 @@ class RealTimeGovernanceMonitor:
         return [f for f in files if f.exists()]
     
     def _count_lines(self, file_path: Path) -> int:
-        """Count lines in a file"""
-        try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                return sum(1 for _ in f)
-        except Exception as e:
-            logger.error(f"Failed to count lines in {file_path}: {e}")
-            return 0
+        """Count lines in a file, stopping once the size threshold is exceeded"""
+        return count_lines(file_path, stop_after=self.thresholds['file_size_max_lines'])
 
 def signal_handler(signum, frame):
     """Handle shutdown signals"""
@@ -38,6 +38,11 @@ import queue
 import hashlib
 import tempfile
 import re
+import sys
+
+# Add governance directory to path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+from file_counters import count_lines
 
 # Configuration
 PROJECT_ROOT = Path(__file__).parent.parent.parent
@@ -349,7 +354,8 @@ class ResponseProtocols:
                         continue
                     
                     # Check if file actually needs modularization
-                    line_count = self._count_lines(full_path)
+                    # Stop counting as soon as the file is known to exceed the limit
+                    line_count = count_lines(full_path, stop_after=1500)
                     if line_count <= 1500:
                         logger.info(f"File {file_path} is within limits ({line_count} lines)")
                         continue
@@ -691,15 +697,6 @@ class ResponseProtocols:
             logger.error(f"Failed to create backup: {e}")
             return ""
     
-    def _count_lines(self, file_path: Path) -> int:
-        """Count lines in a file"""
-        try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                return sum(1 for _ in f)
-        except Exception as e:
-            logger.error(f"Failed to count lines in {file_path}: {e}")
-            return 0
-    
     def _modularize_file(self, file_path: Path) -> Dict[str, Any]:
         """Modularize a large file"""
         try:
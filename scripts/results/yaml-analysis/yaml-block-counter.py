@@ -6,11 +6,15 @@ Counts actual YAML code blocks (```yaml) vs casual yaml mentions
 
 import os
 import re
+import sys
 from pathlib import Path
 
+# Add utilities directory to path
+sys.path.append(str(Path(__file__).parent.parent.parent / "utilities"))
+import code_fences
+
 def count_yaml_blocks(directory):
     """Count actual YAML code blocks vs casual mentions"""
-    yaml_block_pattern = r'```yaml'
     yaml_mention_pattern = r'\byaml\b'
     
     stats = {
@@ -36,7 +40,7 @@ def count_yaml_blocks(directory):
                     stats['files_analyzed'] += 1
                     
                     # Count YAML code blocks
-                    yaml_blocks = len(re.findall(yaml_block_pattern, content))
+                    yaml_blocks = code_fences.count_yaml_blocks(content)
                     if yaml_blocks > 0:
                         stats['files_with_yaml_blocks'] += 1
                         stats['total_yaml_blocks'] += yaml_blocks
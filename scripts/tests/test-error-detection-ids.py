@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Regression tests for error detection ids
+Streamed and polled detections are recorded in tight loops, so ids must stay
+unique within one millisecond or INSERT OR REPLACE silently drops detections
+"""
+
+import unittest
+import importlib.util
+import shutil
+import sqlite3
+import tempfile
+import os
+from pathlib import Path
+
+ENFORCEMENT_DIR = Path(__file__).parent.parent / "enforcement"
+
+spec = importlib.util.spec_from_file_location("error_protocol_activator",
+                                              ENFORCEMENT_DIR / "error-protocol-activator.py")
+activator_module = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(activator_module)
+
+class TestErrorDetectionIds(unittest.TestCase):
+    """Test that every detection is stored as its own row"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.log_root = Path(self.temp_dir) / "logs"
+        self.log_root.mkdir()
+        self.db_path = Path(self.temp_dir) / "error_protocol.db"
+
+        self.saved_config = {name: getattr(activator_module, name)
+                             for name in ('DB_PATH', 'LOG_ROOT', 'LOG_TAIL_STATE')}
+        activator_module.DB_PATH = self.db_path
+        activator_module.LOG_ROOT = self.log_root
+        activator_module.LOG_TAIL_STATE = Path(self.temp_dir) / "error_log_tail.json"
+        self.activator = activator_module.ErrorProtocolActivator()
+
+    def tearDown(self):
+        for name, value in self.saved_config.items():
+            setattr(activator_module, name, value)
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def stored_error_ids(self):
+        self.activator.db.flush()
+        with sqlite3.connect(self.db_path) as conn:
+            return [row[0] for row in conn.execute('SELECT error_id FROM error_detections')]
+
+    def test_streamed_detections_are_all_stored(self):
+        """Twenty erroring chunks in a tight loop give twenty rows"""
+        chunks = [f"step {i}\nSyntaxError: invalid syntax\n" for i in range(20)]
+
+        detections = list(self.activator.watch_output(chunks, context="test"))
+
+        self.assertEqual(len(detections), 20)
+        self.assertEqual(len({error.error_id for error in detections}), 20)
+        self.assertEqual(len(self.stored_error_ids()), 20)
+
+    def test_log_poll_stores_every_failing_log(self):
+        """One poll over two failing logs gives two rows"""
+        for name in ("build.log", "deploy.log"):
+            with open(self.log_root / name, 'w', encoding='utf-8') as f:
+                f.write("starting\nSyntaxError: invalid syntax\n")
+
+        detections = self.activator.watch_logs()
+
+        self.assertEqual(sorted(Path(error.file_location).name for error in detections),
+                         ["build.log", "deploy.log"])
+        self.assertEqual(sorted(self.stored_error_ids()), sorted(error.error_id for error in detections))
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
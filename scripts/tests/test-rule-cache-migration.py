@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Regression tests for the first CLAUDE.md section-cache parse
+Rules stored before the section cache existed (legacy RULE_NNN_TYPE ids)
+must be retired by the first cached refresh, not enforced alongside the new ids
+"""
+
+import re
+import unittest
+import importlib.util
+import shutil
+import sqlite3
+import tempfile
+import os
+from pathlib import Path
+
+ENFORCEMENT_DIR = Path(__file__).parent.parent / "enforcement"
+SHIPPED_DB = Path(__file__).parent.parent / "results/compliance/metrics/enforcement_engine.db"
+CLAUDE_MD = Path(__file__).parent.parent.parent / "CLAUDE.md"
+LEGACY_RULE_ID = re.compile(r'^RULE_\d+_[A-Z_]+$')
+
+spec = importlib.util.spec_from_file_location("principle_blocking_engine",
+                                              ENFORCEMENT_DIR / "principle-blocking-engine.py")
+engine = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(engine)
+
+SAMPLE_CLAUDE_MD = """# Sample
+
+## Orchestration
+Sistema WILL orchestrate every complex task. **CRITICAL: never skip validation**
+
+## Boundaries
+MANDATORY boundary checks before writing files.
+"""
+
+class TestRuleCacheMigration(unittest.TestCase):
+    """Test the first cached parse against a database holding pre-cache rules"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.db_path = os.path.join(self.temp_dir, "enforcement_engine.db")
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def refresh(self, claude_md_path):
+        """Parse CLAUDE.md through the section cache and apply the delta"""
+        db = engine.EnforcementDatabase(self.db_path)
+        cache = engine.ClaudeMdParseCache(str(claude_md_path), self.db_path, 'principle_rules',
+                                          id_field='rule_id')
+        delta = engine.SistemaWillParser(str(claude_md_path)).parse_rule_delta(cache)
+        db.apply_rule_delta(delta, cache)
+        return delta
+
+    def active_rule_ids(self):
+        with sqlite3.connect(self.db_path) as conn:
+            return {row[0] for row in conn.execute('SELECT rule_id FROM enforcement_rules WHERE active = TRUE')}
+
+    def test_first_parse_retires_legacy_rules(self):
+        """Rules stored before the cache are deactivated, current ones stay active"""
+        claude_md_path = os.path.join(self.temp_dir, "CLAUDE.md")
+        with open(claude_md_path, 'w', encoding='utf-8') as f:
+            f.write(SAMPLE_CLAUDE_MD)
+
+        db = engine.EnforcementDatabase(self.db_path)
+        for number, rule_type in enumerate(['WILL', 'CRITICAL', 'BOUNDARY_MANDATORY'], 1):
+            db.upsert_rule(engine.EnforcementRule(
+                rule_id=f"RULE_{number:03d}_{rule_type}", rule_type=rule_type, severity='HIGH',
+                principle_ref='General', description='legacy rule',
+                trigger_conditions=[], blocking_actions=[]
+            ))
+
+        delta = self.refresh(claude_md_path)
+
+        self.assertTrue(delta.initial)
+        current_ids = {item['rule_id'] for item in delta.items}
+        self.assertTrue(current_ids)
+        self.assertEqual(self.active_rule_ids(), current_ids)
+
+    def test_later_parses_keep_active_rules(self):
+        """Once the cache is populated, unchanged rules are left alone"""
+        claude_md_path = os.path.join(self.temp_dir, "CLAUDE.md")
+        with open(claude_md_path, 'w', encoding='utf-8') as f:
+            f.write(SAMPLE_CLAUDE_MD)
+
+        first = self.refresh(claude_md_path)
+        second = self.refresh(claude_md_path)
+
+        self.assertFalse(second.initial)
+        self.assertFalse(second.changed)
+        self.assertEqual(self.active_rule_ids(), {item['rule_id'] for item in first.items})
+
+    @unittest.skipUnless(SHIPPED_DB.exists(), "shipped enforcement database missing")
+    def test_shipped_database_migration(self):
+        """The shipped database ends up enforcing each CLAUDE.md rule once"""
+        shutil.copy(SHIPPED_DB, self.db_path)
+        with sqlite3.connect(self.db_path) as conn:
+            legacy = {row[0] for row in conn.execute('SELECT rule_id FROM enforcement_rules WHERE active = TRUE')
+                      if LEGACY_RULE_ID.match(row[0])}
+        claude_md_path = CLAUDE_MD
+        if not claude_md_path.exists():
+            claude_md_path = os.path.join(self.temp_dir, "CLAUDE.md")
+            with open(claude_md_path, 'w', encoding='utf-8') as f:
+                f.write(SAMPLE_CLAUDE_MD)
+
+        delta = self.refresh(claude_md_path)
+
+        active = self.active_rule_ids()
+        self.assertEqual(active, {item['rule_id'] for item in delta.items})
+        self.assertTrue(legacy)
+        self.assertFalse(active & legacy)
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -2,38 +2,31 @@
 import re
 import os
 
+from code_fences import iter_code_blocks
+
 def analyze_code_blocks(file_path):
     try:
         with open(file_path, 'r', encoding='utf-8') as f:
             lines = f.readlines()
         
         issues = []
-        in_code_block = False
-        prev_line = ''
-        
-        for i, line in enumerate(lines, 1):
-            stripped = line.strip()
-            if stripped == '```':
-                if not in_code_block:
-                    # This is an opening block without language specification
-                    issues.append(f'Line {i}: Opening code block without language specification')
-                    # Try to guess language from context
-                    prev_stripped = prev_line.strip()
-                    if any(x in prev_stripped.lower() for x in ['yaml', 'configuration', 'config']):
-                        issues.append(f'  -> Suggested: yaml')
-                    elif any(x in prev_stripped.lower() for x in ['json', 'object', 'structure']):
-                        issues.append(f'  -> Suggested: json')
-                    elif any(x in prev_stripped.lower() for x in ['bash', 'shell', 'command', 'script']):
-                        issues.append(f'  -> Suggested: bash')
-                    elif any(x in prev_stripped.lower() for x in ['markdown', 'example']):
-                        issues.append(f'  -> Suggested: markdown')
-                    else:
-                        issues.append(f'  -> Suggested: text')
-                in_code_block = not in_code_block
-            elif stripped.startswith('```'):
-                in_code_block = not in_code_block
-            
-            prev_line = line
+        for block in iter_code_blocks(lines):
+            if block.info:
+                continue
+            # This is an opening block without language specification
+            issues.append(f'Line {block.start + 1}: Opening code block without language specification')
+            # Try to guess language from context
+            prev_stripped = lines[block.start - 1].strip() if block.start > 0 else ''
+            if any(x in prev_stripped.lower() for x in ['yaml', 'configuration', 'config']):
+                issues.append(f'  -> Suggested: yaml')
+            elif any(x in prev_stripped.lower() for x in ['json', 'object', 'structure']):
+                issues.append(f'  -> Suggested: json')
+            elif any(x in prev_stripped.lower() for x in ['bash', 'shell', 'command', 'script']):
+                issues.append(f'  -> Suggested: bash')
+            elif any(x in prev_stripped.lower() for x in ['markdown', 'example']):
+                issues.append(f'  -> Suggested: markdown')
+            else:
+                issues.append(f'  -> Suggested: text')
         
         return issues
     except Exception as e:
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""Single-pass fenced code block parser shared by the code block and YAML block scripts.
+
+A fence line (``` or ~~~, at any indentation) opens a block; only a bare
+fence of the same character and at least the same length closes it. Every
+line is looked at once, so a closing fence is never taken for the opening
+of another block and unmatched fences cost nothing extra.
+"""
+import re
+from dataclasses import dataclass
+from typing import Iterator, List, Optional
+
+FENCE_PATTERN = re.compile(r'^(\s*)(`{3,}|~{3,})(.*)$')
+YAML_LANGUAGES = ('yaml', 'yml')
+
+@dataclass
+class CodeBlock:
+    start: int              # Line index of the opening fence
+    end: Optional[int]      # Line index of the closing fence, None if unclosed
+    indent: str
+    fence: str
+    info: str
+
+    @property
+    def language(self):
+        """First word of the info string, lowercased; '' when unspecified."""
+        return self.info.split()[0].lower() if self.info else ''
+
+    @property
+    def closed(self):
+        return self.end is not None
+
+    def body(self, lines):
+        """Lines between the fences; an unclosed block runs to the end."""
+        return lines[self.start + 1:self.end if self.closed else len(lines)]
+
+def iter_code_blocks(lines) -> Iterator[CodeBlock]:
+    """Fenced code blocks in document order, with their line spans.
+
+    Accepts a list of lines or a whole document as one string.
+    """
+    if isinstance(lines, str):
+        lines = lines.split('\n')
+    open_block = None
+    for index, line in enumerate(lines):
+        # Cheap filter before the regex: fences start with ` or ~ after indentation
+        stripped = line.lstrip()
+        if not stripped.startswith(('```', '~~~')):
+            continue
+        indent, fence, info = FENCE_PATTERN.match(line.rstrip('\r\n')).groups()
+        if open_block is None:
+            # Backtick fences cannot carry backticks in their info string
+            if fence[0] == '`' and '`' in info:
+                continue
+            open_block = CodeBlock(index, None, indent, fence, info.strip())
+        elif fence[0] == open_block.fence[0] and len(fence) >= len(open_block.fence) and not info.strip():
+            open_block.end = index
+            yield open_block
+            open_block = None
+    if open_block is not None:
+        yield open_block
+
+def code_block_mask(lines, blocks=None) -> List[bool]:
+    """Per line, whether it belongs to a code block, fences included."""
+    if blocks is None:
+        blocks = iter_code_blocks(lines)
+    mask = [False] * len(lines)
+    for block in blocks:
+        end = block.end if block.closed else len(lines) - 1
+        for index in range(block.start, end + 1):
+            mask[index] = True
+    return mask
+
+def count_yaml_blocks(lines):
+    """Number of closed code blocks tagged yaml or yml."""
+    return sum(1 for block in iter_code_blocks(lines) if block.closed and block.language in YAML_LANGUAGES)
+
+def iter_yaml_blocks(content):
+    """Closed YAML blocks of a document as (full block, body, start offset, end offset).
+
+    Offsets run from the opening fence to the end of the closing fence, so
+    content[start:end] can be replaced in place.
+    """
+    lines = content.split('\n')
+    line_starts = [0]
+    for line in lines[:-1]:
+        line_starts.append(line_starts[-1] + len(line) + 1)
+    for block in iter_code_blocks(lines):
+        if not block.closed or block.language not in YAML_LANGUAGES:
+            continue
+        start = line_starts[block.start] + len(block.indent)
+        end = line_starts[block.end] + len(lines[block.end].rstrip())
+        yield content[start:end], '\n'.join(block.body(lines)), start, end
@@ -3,6 +3,8 @@ import os
 import re
 import glob
 
+from code_fences import iter_code_blocks
+
 def find_unspecified_code_blocks(root_dir):
     """Find code blocks that should have language specifications but don't."""
     problems = []
@@ -13,39 +15,25 @@ def find_unspecified_code_blocks(root_dir):
                 content = f.read()
                 lines = content.split('\n')
             
-            i = 0
-            while i < len(lines):
-                line = lines[i].strip()
-                # Found an unspecified opening code block
-                if line == '```':
-                    # Check if this is an opening block by looking ahead
-                    if i + 1 < len(lines):
-                        next_line = lines[i + 1].strip()
-                        # If next line has content (not empty or just whitespace), this is likely an opening block
-                        if next_line and not next_line.startswith('#') and not next_line.startswith('*'):
-                            # Look for the closing block
-                            j = i + 1
-                            found_content = False
-                            while j < len(lines):
-                                if lines[j].strip() == '```':
-                                    break
-                                if lines[j].strip():  # Found non-empty content
-                                    found_content = True
-                                j += 1
-                            
-                            if found_content:
-                                # Guess the language based on content
-                                block_content = '\n'.join(lines[i+1:j])
-                                language = guess_language(block_content, lines[i-1] if i > 0 else '')
-                                
-                                rel_path = os.path.relpath(file_path, root_dir)
-                                problems.append({
-                                    'file': rel_path,
-                                    'line': i + 1,
-                                    'suggested_language': language,
-                                    'content_preview': lines[i+1].strip()[:50] + '...' if len(lines[i+1].strip()) > 50 else lines[i+1].strip()
-                                })
-                i += 1
+            for block in iter_code_blocks(lines):
+                # Unclosed blocks and blocks with a language are left alone
+                if block.info or not block.closed:
+                    continue
+                body = block.body(lines)
+                if not any(line.strip() for line in body):
+                    continue
+                
+                # Guess the language based on content
+                language = guess_language('\n'.join(body), lines[block.start - 1] if block.start > 0 else '')
+                
+                rel_path = os.path.relpath(file_path, root_dir)
+                preview = body[0].strip()
+                problems.append({
+                    'file': rel_path,
+                    'line': block.start + 1,
+                    'suggested_language': language,
+                    'content_preview': preview[:50] + '...' if len(preview) > 50 else preview
+                })
                 
         except Exception as e:
             print(f"Error processing {file_path}: {e}")
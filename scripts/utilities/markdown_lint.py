@@ -0,0 +1,305 @@
+#!/usr/bin/env python3
+"""Unified markdown lint engine for the utilities/ checks.
+
+Each file is read and parsed once into a small document model (lines,
+fenced code blocks, headings, links, anchors). The code block, header
+hierarchy and cross-reference checks run as passes over that model,
+files are processed across a process pool, and fixes from all passes
+are merged and written atomically, once per file.
+"""
+import os
+import sys
+import json
+import time
+import shutil
+import argparse
+import tempfile
+import subprocess
+from dataclasses import dataclass, field
+from multiprocessing import Pool, cpu_count
+from typing import List
+
+from code_fences import CodeBlock, iter_code_blocks, code_block_mask
+from fix_code_blocks import guess_language
+from fix_header_hierarchy import should_consolidate_header
+from validate_cross_references import (
+    LinkGraph, walk_markdown_tree, parse_markdown_links, check_file_links, apply_link_replacements
+)
+
+CHUNKS_PER_WORKER = 8
+
+# The standalone scripts this engine replaces, in back-to-back order
+LEGACY_SCRIPTS = [
+    'find_unspecified_blocks.py',
+    'fix_code_blocks.py',
+    'fix_header_hierarchy.py',
+    'analyze_code_blocks.py',
+    'validate_cross_references.py',
+]
+
+@dataclass
+class Heading:
+    line: int               # Line index
+    level: int
+    text: str
+
+@dataclass
+class MarkdownDocument:
+    lines: List[str]
+    code_blocks: List[CodeBlock] = field(default_factory=list)
+    headings: List[Heading] = field(default_factory=list)
+    links: List[list] = field(default_factory=list)
+    anchors: List[str] = field(default_factory=list)
+
+def parse_markdown(content):
+    """Parse one file into its document model."""
+    lines = content.split('\n')
+    doc = MarkdownDocument(lines=lines, code_blocks=list(iter_code_blocks(lines)))
+    in_block = code_block_mask(lines, doc.code_blocks)
+
+    for index, line in enumerate(lines):
+        if line.startswith('#') and not in_block[index]:
+            level = len(line) - len(line.lstrip('#'))
+            if line[level:level + 1] == ' ':
+                doc.headings.append(Heading(index, level, line[level + 1:]))
+
+    doc.links, doc.anchors = parse_markdown_links(content, in_block)
+    return doc
+
+def check_code_blocks(doc):
+    """Unspecified-language code blocks with content, and the fence line that fixes each."""
+    findings = []
+    for block in doc.code_blocks:
+        if block.info or not block.closed:
+            continue
+        body = block.body(doc.lines)
+        if not any(line.strip() for line in body):
+            continue
+        prev_line = doc.lines[block.start - 1] if block.start > 0 else ''
+        language = guess_language('\n'.join(body), prev_line)
+        preview = body[0].strip()
+        findings.append({
+            'line': block.start + 1,
+            'language': language,
+            'content_preview': preview[:50] + '...' if len(preview) > 50 else preview,
+            'new_line': f'{block.indent}{block.fence}{language}'
+        })
+    return findings
+
+def check_headers(doc):
+    """Fourth- and fifth-level headings outside code blocks, with their replacement lines."""
+    findings = []
+    for heading in doc.headings:
+        if heading.level == 4:
+            if should_consolidate_header(heading.text, doc.lines, heading.line):
+                change, new_line = '#### -> ###', f'### {heading.text}'
+            else:
+                change, new_line = '#### -> **bold**', f'**{heading.text}**'
+        elif heading.level == 5:
+            change, new_line = '##### -> **bold**', f'**{heading.text}**'
+        else:
+            continue
+        findings.append({
+            'line': heading.line + 1,
+            'change': change,
+            'text': heading.text,
+            'new_line': new_line
+        })
+    return findings
+
+def lint_file(task):
+    """Worker: parse one file and run the per-file passes."""
+    root_dir, rel_path = task
+    file_path = os.path.join(root_dir, rel_path)
+    try:
+        stat = os.stat(file_path)
+        with open(file_path, 'r', encoding='utf-8') as f:
+            doc = parse_markdown(f.read())
+    except Exception as e:
+        return {'file': rel_path, 'error': str(e)}
+
+    return {
+        'file': rel_path,
+        'mtime_ns': stat.st_mtime_ns,
+        'size': stat.st_size,
+        'code_blocks': check_code_blocks(doc),
+        'headers': check_headers(doc),
+        'links': doc.links,
+        'anchors': doc.anchors
+    }
+
+def write_atomically(file_path, text):
+    """Replace a file's content without ever leaving it half written."""
+    directory = os.path.dirname(file_path)
+    fd, tmp_path = tempfile.mkstemp(prefix='.lint-', suffix='.tmp', dir=directory)
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            f.write(text)
+        shutil.copymode(file_path, tmp_path)
+        os.replace(tmp_path, file_path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+def apply_fixes(root_dir, result, link_replacements):
+    """Merge every pass's edits for one file and write it once; False if it changed meanwhile."""
+    file_path = os.path.join(root_dir, result['file'])
+    stat = os.stat(file_path)
+    if stat.st_mtime_ns != result['mtime_ns'] or stat.st_size != result['size']:
+        return False
+
+    with open(file_path, 'r', encoding='utf-8') as f:
+        lines = f.read().split('\n')
+    for finding in result['code_blocks'] + result['headers']:
+        lines[finding['line'] - 1] = finding['new_line']
+    # Link edits replace text within lines, so they follow the whole-line edits
+    apply_link_replacements(lines, link_replacements)
+    write_atomically(file_path, '\n'.join(lines))
+    return True
+
+def lint_tree(root_dir, fix=False, workers=None):
+    """Run every pass over every markdown file under root_dir; returns the combined report."""
+    start_time = time.time()
+    workers = workers or cpu_count()
+    paths, markdown = walk_markdown_tree(root_dir)
+    tasks = [(root_dir, rel_path) for rel_path in sorted(markdown)]
+
+    # Per-file passes run in the pool; results stream back as files finish
+    results = {}
+    chunksize = max(1, len(tasks) // (workers * CHUNKS_PER_WORKER))
+    with Pool(processes=workers) as pool:
+        for result in pool.imap_unordered(lint_file, tasks, chunksize):
+            results[result['file']] = result
+    parse_time = time.time() - start_time
+
+    errors = {rel: r['error'] for rel, r in results.items() if 'error' in r}
+    parsed = {rel: r for rel, r in results.items() if 'error' not in r}
+
+    # Links resolve against the whole tree, so that pass runs once all files are parsed
+    graph = LinkGraph(root_dir)
+    graph.replace_index(paths, {
+        rel: {'mtime_ns': r['mtime_ns'], 'size': r['size'], 'anchors': r['anchors'], 'links': r['links']}
+        for rel, r in parsed.items()
+    })
+
+    report = {
+        'root_dir': root_dir,
+        'files': len(markdown),
+        'unspecified_code_blocks': [],
+        'header_violations': [],
+        'cross_references': {
+            'total_references': 0,
+            'broken_references': 0,
+            'broken_anchors': 0,
+            'standardized_references': 0,
+            'issues': []
+        },
+        'errors': [{'file': rel, 'error': error} for rel, error in sorted(errors.items())],
+        'fixed_files': 0,
+        'skipped_files': []
+    }
+    cross_references = report['cross_references']
+
+    for rel_path in sorted(parsed):
+        result = parsed[rel_path]
+        report['unspecified_code_blocks'].extend(
+            {'file': rel_path, 'line': f['line'], 'suggested_language': f['language'],
+             'content_preview': f['content_preview']} for f in result['code_blocks'])
+        report['header_violations'].extend(
+            {'file': rel_path, 'line': f['line'], 'change': f['change'], 'text': f['text']}
+            for f in result['headers'])
+
+        checked = check_file_links(graph, rel_path, graph.files[rel_path])
+        for key in ('total_references', 'broken_references', 'broken_anchors', 'standardized_references'):
+            cross_references[key] += checked[key]
+        cross_references['issues'].extend(checked['issues'])
+
+        if fix and (result['code_blocks'] or result['headers'] or checked['replacements']):
+            if apply_fixes(root_dir, result, checked['replacements']):
+                report['fixed_files'] += 1
+            else:
+                report['skipped_files'].append(rel_path)
+
+    report['timing'] = {
+        'workers': workers,
+        'parse_seconds': parse_time,
+        'total_seconds': time.time() - start_time
+    }
+    return report
+
+def compare_with_scripts(root_dir, workers=None):
+    """Wall-clock of the standalone scripts back-to-back versus one engine run, each on its own copy."""
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    timings = {}
+
+    with tempfile.TemporaryDirectory() as scratch:
+        for mode in ('scripts', 'engine'):
+            # The scripts operate on ./docs, so each mode gets a copy laid out that way
+            workdir = os.path.join(scratch, mode)
+            docs_copy = os.path.join(workdir, 'docs')
+            shutil.copytree(root_dir, docs_copy)
+
+            start_time = time.time()
+            if mode == 'scripts':
+                for script in LEGACY_SCRIPTS:
+                    subprocess.run([sys.executable, os.path.join(script_dir, script)], cwd=workdir,
+                                   stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=False)
+            else:
+                command = [sys.executable, os.path.abspath(__file__), 'docs', '--fix']
+                if workers:
+                    command += ['--workers', str(workers)]
+                subprocess.run(command, cwd=workdir, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=False)
+            timings[mode] = time.time() - start_time
+
+            # Link graph indexes are keyed by root, so the copies' would only go stale
+            index_path = LinkGraph(docs_copy).index_path
+            if os.path.exists(index_path):
+                os.remove(index_path)
+
+    return {
+        'scripts_seconds': timings['scripts'],
+        'engine_seconds': timings['engine'],
+        'speedup': timings['scripts'] / timings['engine'] if timings['engine'] > 0 else 0,
+        'available_cpus': cpu_count()
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description='Unified markdown lint engine')
+    parser.add_argument('root_dir', nargs='?', default='docs', help='Markdown tree to lint')
+    parser.add_argument('--fix', action='store_true', help='Apply code block, header and link fixes')
+    parser.add_argument('--workers', '-w', type=int, help='Worker processes (default: CPU count)')
+    parser.add_argument('--compare', action='store_true', help='Time against running the standalone scripts back-to-back')
+    parser.add_argument('--output', '-o', type=str, help='Write the combined report as JSON')
+    args = parser.parse_args()
+
+    if args.compare:
+        comparison = compare_with_scripts(args.root_dir, args.workers)
+        print(f"Standalone scripts: {comparison['scripts_seconds']:.2f}s")
+        print(f"Lint engine:        {comparison['engine_seconds']:.2f}s "
+              f"({comparison['speedup']:.1f}x, {comparison['available_cpus']} CPUs)")
+        return
+
+    report = lint_tree(args.root_dir, fix=args.fix, workers=args.workers)
+    cross_references = report['cross_references']
+
+    print(f"Linted {report['files']} markdown files in {report['timing']['total_seconds']:.2f}s "
+          f"({report['timing']['workers']} workers)")
+    print(f"Unspecified code blocks: {len(report['unspecified_code_blocks'])}")
+    print(f"Header violations: {len(report['header_violations'])}")
+    print(f"References: {cross_references['total_references']} total, "
+          f"{cross_references['broken_references']} broken, {cross_references['broken_anchors']} broken anchors, "
+          f"{cross_references['standardized_references']} to standardize")
+    if report['errors']:
+        print(f"Read errors: {len(report['errors'])}")
+    if args.fix:
+        print(f"Fixed files: {report['fixed_files']}")
+        if report['skipped_files']:
+            print(f"Skipped (changed during lint): {len(report['skipped_files'])}")
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2, ensure_ascii=False)
+        print(f"Report saved to: {args.output}")
+
+if __name__ == "__main__":
+    main()
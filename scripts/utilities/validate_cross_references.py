@@ -1,158 +1,337 @@
 #!/usr/bin/env python3
 import os
 import re
+import sys
 import glob
+import json
+import hashlib
 from urllib.parse import unquote
 
-def validate_cross_references(root_dir):
-    """Validate and optimize cross-references across all markdown files."""
+from code_fences import code_block_mask
+
+GRAPH_VERSION = 2
+GRAPH_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'results', 'validation')
+
+# Reference patterns; a reference never spans lines
+LINK_PATTERNS = [
+    re.compile(r'\[([^\]\n]*)\]\(([^)\n]+)\)'),         # [text](link)
+    re.compile(r'\[([^\]\n]*)\]\[([^\]\n]*)\]'),        # [text][ref]
+    re.compile(r'\]\(([^)\n]+\.md[^)\n]*)\)'),           # Direct .md links
+]
+HEADING_PATTERN = re.compile(r'^ {0,3}(#{1,6})\s+(.*?)\s*#*\s*$')
+HTML_ANCHOR_PATTERN = re.compile(r'<a\s+(?:name|id)=["\']([^"\']+)["\']', re.IGNORECASE)
+INLINE_LINK_PATTERN = re.compile(r'\[([^\]]*)\]\([^)]*\)')
+
+def slugify_heading(heading):
+    """GitHub-style anchor for a heading."""
+    text = INLINE_LINK_PATTERN.sub(r'\1', heading).strip().lower()
+    text = re.sub(r'[^\w\- ]', '', text)
+    return text.replace(' ', '-')
+
+def parse_markdown_links(content, in_block=None):
+    """Links as (line, pattern index, text, url) and heading anchors of one file.
+    
+    in_block is the file's code block mask, when the caller already has it.
+    """
+    line_starts = [0]
+    for match in re.finditer('\n', content):
+        line_starts.append(match.end())
+    
+    links = []
+    for pattern_index, pattern in enumerate(LINK_PATTERNS):
+        line_num = 1
+        for match in pattern.finditer(content):
+            while line_num < len(line_starts) and line_starts[line_num] <= match.start():
+                line_num += 1
+            if pattern.groups >= 2:
+                link_text, link_url = match.group(1), match.group(2)
+            else:
+                link_text, link_url = "", match.group(1)
+            links.append((line_num, pattern_index, match.start(), link_text, link_url))
+    # Per-line order, patterns in turn, as the references read
+    links.sort(key=lambda link: (link[0], link[1], link[2]))
+    
+    anchors = []
+    seen = {}
+    lines = content.split('\n')
+    if in_block is None:
+        in_block = code_block_mask(lines)
+    for line, line_in_block in zip(lines, in_block):
+        if line_in_block:
+            continue
+        heading = HEADING_PATTERN.match(line)
+        if heading:
+            slug = slugify_heading(heading.group(2))
+            # Repeated headings get -1, -2, ... like GitHub
+            count = seen.get(slug, 0)
+            seen[slug] = count + 1
+            anchors.append(slug if count == 0 else f"{slug}-{count}")
+        anchors.extend(anchor.lower() for anchor in HTML_ANCHOR_PATTERN.findall(line))
+    
+    return [[line, text, url] for line, _, _, text, url in links], anchors
+
+def walk_markdown_tree(root_dir):
+    """Every file and directory under root_dir, and the markdown files among them."""
+    paths = set()
+    markdown = {}
+    for dirpath, dirnames, filenames in os.walk(root_dir):
+        # Hidden entries stay out of the index, as with glob
+        dirnames[:] = sorted(d for d in dirnames if not d.startswith('.'))
+        rel_dir = os.path.relpath(dirpath, root_dir)
+        if rel_dir != '.':
+            paths.add(rel_dir)
+        for filename in sorted(filenames):
+            if filename.startswith('.'):
+                continue
+            rel_path = os.path.normpath(os.path.join(rel_dir, filename))
+            paths.add(rel_path)
+            if filename.endswith('.md'):
+                markdown[rel_path] = os.path.join(dirpath, filename)
+    return paths, markdown
+
+class LinkGraph:
+    """Persistent index of markdown files, their anchors and the links between them.
+    
+    Nodes are files and their heading anchors; edges are links. Only files
+    changed since the last refresh are parsed again, and links resolve
+    against an in-memory path set instead of filesystem checks.
+    """
+    
+    def __init__(self, root_dir, index_path=None):
+        self.root_dir = root_dir
+        if index_path is None:
+            root_key = hashlib.sha256(os.path.abspath(root_dir).encode('utf-8')).hexdigest()[:12]
+            index_path = os.path.join(GRAPH_DIR, f"link-graph-{root_key}.json")
+        self.index_path = index_path
+        self.files = {}       # rel path -> {mtime_ns, size, anchors, links}
+        self.errors = {}      # rel path -> read error
+        self.paths = set()    # every file and directory under the root
+        self.reverse = {}     # resolved target -> [(source, line, url, anchor)]
+        self._outside_root = {}
+        self._load()
+    
+    def _load(self):
+        try:
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        if data.get('version') == GRAPH_VERSION and data.get('root') == os.path.abspath(self.root_dir):
+            self.files = data.get('files', {})
+    
+    def save(self):
+        """Write the index atomically."""
+        os.makedirs(os.path.dirname(self.index_path), exist_ok=True)
+        tmp_path = self.index_path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'version': GRAPH_VERSION, 'root': os.path.abspath(self.root_dir), 'files': self.files}, f)
+        os.replace(tmp_path, self.index_path)
+    
+    def refresh(self):
+        """Re-parse added or changed markdown files; returns how many were parsed."""
+        paths, markdown = walk_markdown_tree(self.root_dir)
+        
+        parsed = 0
+        self.errors = {}
+        files = {}
+        for rel_path, file_path in markdown.items():
+            entry = self.files.get(rel_path)
+            try:
+                stat = os.stat(file_path)
+                if entry is None or entry['mtime_ns'] != stat.st_mtime_ns or entry['size'] != stat.st_size:
+                    with open(file_path, 'r', encoding='utf-8') as f:
+                        links, anchors = parse_markdown_links(f.read())
+                    entry = {'mtime_ns': stat.st_mtime_ns, 'size': stat.st_size, 'anchors': anchors, 'links': links}
+                    parsed += 1
+            except Exception as e:
+                self.errors[rel_path] = str(e)
+                continue
+            files[rel_path] = entry
+        
+        changed = parsed > 0 or len(files) != len(self.files)
+        self.replace_index(paths, files, save=changed)
+        return parsed
+    
+    def replace_index(self, paths, files, save=True):
+        """Install a path set and file entries parsed elsewhere (e.g. by the lint engine)."""
+        self.paths = paths
+        self.files = files
+        self._build_reverse_index()
+        if save:
+            self.save()
+    
+    def resolve(self, source, file_part):
+        """Existing target path of a link from source, or None."""
+        source_dir = os.path.dirname(source)
+        if file_part.startswith('/'):
+            candidates = [file_part.lstrip('/')]
+        else:
+            # Relative to the linking file first, then the root-relative
+            # and docs/ forms the validator has always accepted
+            candidates = [os.path.join(source_dir, file_part), file_part,
+                          os.path.join('docs', file_part)]
+        for candidate in candidates:
+            candidate = os.path.normpath(candidate)
+            for path in (candidate, candidate + '.md'):
+                if path in self.paths:
+                    return path
+                if path.startswith('..') and self._exists_outside_root(path):
+                    return path
+        return None
+    
+    def _exists_outside_root(self, rel_path):
+        if rel_path not in self._outside_root:
+            self._outside_root[rel_path] = os.path.exists(os.path.join(self.root_dir, rel_path))
+        return self._outside_root[rel_path]
+    
+    def has_anchor(self, target, anchor):
+        """Whether anchor names a heading or HTML anchor in target (non-markdown targets pass)."""
+        entry = self.files.get(target)
+        return entry is None or anchor.lower() in entry['anchors']
+    
+    def _build_reverse_index(self):
+        self.reverse = {}
+        for source, entry in self.files.items():
+            # [text](x.md) is also matched by the direct .md pattern; one edge per link
+            edges = dict.fromkeys((line, url) for line, _, url in entry['links'])
+            for line, url in edges:
+                target, anchor = self.resolve_link(source, url)
+                if target:
+                    self.reverse.setdefault(target, []).append((source, line, url, anchor))
+    
+    def resolve_link(self, source, link_url):
+        """(target path, anchor) of an internal link; target None if external or missing."""
+        if link_url.startswith(('http://', 'https://', 'mailto:')):
+            return None, None
+        decoded_url = unquote(link_url)
+        file_part, _, anchor = decoded_url.partition('#')
+        if not file_part or file_part == '.':
+            return source, anchor or None
+        return self.resolve(source, file_part), anchor or None
+    
+    def links_to(self, target, anchor=None):
+        """Who links here: (source, line, url) of every link resolving to target."""
+        target = os.path.normpath(target)
+        return [
+            (source, line, url) for source, line, url, link_anchor in self.reverse.get(target, [])
+            if anchor is None or (link_anchor or '').lower() == anchor.lower()
+        ]
+
+def check_file_links(graph, rel_file_path, entry):
+    """Check one file's links against the graph; replacements map line -> [(old, new)]."""
     issues = []
     fixes = []
-    all_files = {}
+    replacements = {}
+    total_references = 0
+    broken_references = 0
+    broken_anchors = 0
+    standardized_references = 0
     
-    # Build index of all markdown files
-    for file_path in glob.glob(f"{root_dir}/**/*.md", recursive=True):
-        rel_path = os.path.relpath(file_path, root_dir)
-        all_files[rel_path] = file_path
-        # Also index without extension
-        base_name = os.path.splitext(rel_path)[0]
-        all_files[base_name] = file_path
+    for line_num, link_text, link_url in entry['links']:
+        total_references += 1
+        
+        # Skip external links
+        if link_url.startswith(('http://', 'https://', 'mailto:')):
+            continue
+        
+        target, anchor = graph.resolve_link(rel_file_path, link_url)
+        if target is None:
+            broken_references += 1
+            issues.append({
+                'file': rel_file_path,
+                'line': line_num,
+                'issue': 'broken_link',
+                'link': link_url,
+                'text': link_text
+            })
+        elif anchor and not graph.has_anchor(target, anchor):
+            broken_anchors += 1
+            issues.append({
+                'file': rel_file_path,
+                'line': line_num,
+                'issue': 'broken_anchor',
+                'link': link_url,
+                'text': link_text
+            })
+        
+        # Standardize relative path format
+        if link_url.startswith('../'):
+            cleaned_url = link_url.replace('../', '')
+            
+            # Convert to consistent format if possible
+            if not cleaned_url.startswith('docs/'):
+                standardized_url = f"../{cleaned_url}"
+                if standardized_url != link_url:
+                    replacements.setdefault(line_num, []).append((link_url, standardized_url))
+                    standardized_references += 1
+                    fixes.append({
+                        'file': rel_file_path,
+                        'line': line_num,
+                        'change': f'{link_url} → {standardized_url}',
+                        'type': 'standardization'
+                    })
     
-    print(f"Indexed {len(all_files)} markdown files...")
+    return {
+        'total_references': total_references,
+        'broken_references': broken_references,
+        'broken_anchors': broken_anchors,
+        'standardized_references': standardized_references,
+        'issues': issues,
+        'fixes': fixes,
+        'replacements': replacements
+    }
+
+def apply_link_replacements(lines, replacements):
+    """Apply check_file_links replacements to a file's lines in place."""
+    for line_num, changes in replacements.items():
+        for link_url, standardized_url in changes:
+            lines[line_num - 1] = lines[line_num - 1].replace(link_url, standardized_url)
+
+def validate_cross_references(root_dir, graph=None):
+    """Validate and optimize cross-references across all markdown files."""
+    issues = []
+    fixes = []
     
-    # Patterns for finding references
-    link_patterns = [
-        r'\[([^\]]*)\]\(([^)]+)\)',  # [text](link)
-        r'\[([^\]]*)\]\[([^\]]*)\]', # [text][ref]
-        r']\(([^)]+\.md[^)]*)\)',    # Direct .md links
-    ]
+    # Build or incrementally update the link graph
+    graph = graph or LinkGraph(root_dir)
+    parsed = graph.refresh()
+    print(f"Indexed {len(graph.files)} markdown files ({parsed} parsed)...")
     
     total_references = 0
     broken_references = 0
+    broken_anchors = 0
     standardized_references = 0
     
-    for file_path in glob.glob(f"{root_dir}/**/*.md", recursive=True):
-        try:
+    for rel_file_path, error in graph.errors.items():
+        issues.append({
+            'file': rel_file_path,
+            'line': 0,
+            'issue': 'read_error',
+            'error': error
+        })
+    
+    for rel_file_path, entry in graph.files.items():
+        checked = check_file_links(graph, rel_file_path, entry)
+        total_references += checked['total_references']
+        broken_references += checked['broken_references']
+        broken_anchors += checked['broken_anchors']
+        standardized_references += checked['standardized_references']
+        issues.extend(checked['issues'])
+        fixes.extend(checked['fixes'])
+        
+        # Write back if modified
+        if checked['replacements']:
+            file_path = os.path.join(root_dir, rel_file_path)
             with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-                lines = content.split('\n')
-            
-            file_dir = os.path.dirname(file_path)
-            rel_file_path = os.path.relpath(file_path, root_dir)
-            modified = False
-            new_lines = []
-            
-            for line_num, line in enumerate(lines, 1):
-                new_line = line
-                
-                # Find markdown links
-                for pattern in link_patterns:
-                    matches = re.finditer(pattern, line)
-                    for match in matches:
-                        total_references += 1
-                        if len(match.groups()) >= 2:
-                            link_text = match.group(1)
-                            link_url = match.group(2)
-                        else:
-                            link_url = match.group(1)
-                            link_text = ""
-                        
-                        # Skip external links
-                        if link_url.startswith(('http://', 'https://', 'mailto:', '#')):
-                            continue
-                        
-                        # Decode URL encoding
-                        decoded_url = unquote(link_url)
-                        
-                        # Handle anchors
-                        if '#' in decoded_url:
-                            file_part, anchor = decoded_url.split('#', 1)
-                        else:
-                            file_part = decoded_url
-                            anchor = None
-                        
-                        if not file_part or file_part == '.':
-                            continue  # Same file reference
-                        
-                        # Resolve relative path
-                        if file_part.startswith('./'):
-                            file_part = file_part[2:]
-                        elif file_part.startswith('../'):
-                            # Handle relative paths
-                            current_dir = os.path.dirname(rel_file_path)
-                            target_path = os.path.normpath(os.path.join(current_dir, file_part))
-                        else:
-                            target_path = file_part
-                        
-                        # Check if file exists
-                        target_exists = False
-                        potential_paths = [
-                            target_path,
-                            target_path + '.md' if not target_path.endswith('.md') else target_path,
-                            os.path.join('docs', target_path),
-                            os.path.join('docs', target_path + '.md'),
-                        ]
-                        
-                        for potential_path in potential_paths:
-                            if potential_path in all_files:
-                                target_exists = True
-                                break
-                            # Also check actual file existence
-                            full_path = os.path.join(root_dir, potential_path)
-                            if os.path.exists(full_path):
-                                target_exists = True
-                                break
-                        
-                        if not target_exists:
-                            broken_references += 1
-                            issues.append({
-                                'file': rel_file_path,
-                                'line': line_num,
-                                'issue': 'broken_link',
-                                'link': link_url,
-                                'text': link_text
-                            })
-                        
-                        # Standardize relative path format
-                        if '../' in link_url or './' in link_url:
-                            # Try to standardize to a consistent format
-                            if link_url.startswith('../'):
-                                # Count how many levels up
-                                levels_up = link_url.count('../')
-                                cleaned_url = link_url.replace('../', '')
-                                
-                                # Convert to consistent format if possible
-                                if not cleaned_url.startswith('docs/'):
-                                    standardized_url = f"../{cleaned_url}"
-                                    if standardized_url != link_url:
-                                        new_line = new_line.replace(link_url, standardized_url)
-                                        modified = True
-                                        standardized_references += 1
-                                        fixes.append({
-                                            'file': rel_file_path,
-                                            'line': line_num,
-                                            'change': f'{link_url} → {standardized_url}',
-                                            'type': 'standardization'
-                                        })
-                
-                new_lines.append(new_line)
-            
-            # Write back if modified
-            if modified:
-                with open(file_path, 'w', encoding='utf-8') as f:
-                    f.write('\n'.join(new_lines))
-                
-        except Exception as e:
-            issues.append({
-                'file': os.path.relpath(file_path, root_dir),
-                'line': 0,
-                'issue': 'read_error',
-                'error': str(e)
-            })
+                lines = f.read().split('\n')
+            apply_link_replacements(lines, checked['replacements'])
+            with open(file_path, 'w', encoding='utf-8') as f:
+                f.write('\n'.join(lines))
     
     return {
         'total_references': total_references,
         'broken_references': broken_references,
+        'broken_anchors': broken_anchors,
         'standardized_references': standardized_references,
         'issues': issues,
         'fixes': fixes
@@ -197,6 +376,17 @@ def analyze_cross_reference_patterns(root_dir):
     return patterns
 
 if __name__ == "__main__":
+    if len(sys.argv) > 2 and sys.argv[1] == '--links-to':
+        # Reverse-link query for remediation: who links to a file (optionally #anchor)
+        target, _, anchor = sys.argv[2].partition('#')
+        graph = LinkGraph("docs")
+        graph.refresh()
+        referrers = graph.links_to(target, anchor or None)
+        print(f"{len(referrers)} links to {sys.argv[2]}:")
+        for source, line, url in referrers:
+            print(f"  {source}:{line} - {url}")
+        sys.exit(0)
+    
     print("Analyzing cross-reference patterns...")
     patterns = analyze_cross_reference_patterns("docs")
     
@@ -210,6 +400,7 @@ if __name__ == "__main__":
     print(f"\nCross-reference validation results:")
     print(f"Total references analyzed: {results['total_references']}")
     print(f"Broken references found: {results['broken_references']}")
+    print(f"Broken anchors found: {results['broken_anchors']}")
     print(f"References standardized: {results['standardized_references']}")
     print(f"Issues identified: {len(results['issues'])}")
     print(f"Fixes applied: {len(results['fixes'])}")
@@ -219,6 +410,8 @@ if __name__ == "__main__":
         for issue in results['issues'][:10]:
             if issue['issue'] == 'broken_link':
                 print(f"  {issue['file']}:{issue['line']} - Broken link: {issue['link']}")
+            elif issue['issue'] == 'broken_anchor':
+                print(f"  {issue['file']}:{issue['line']} - Broken anchor: {issue['link']}")
             else:
                 print(f"  {issue['file']}:{issue['line']} - {issue['issue']}: {issue.get('error', 'Unknown')}")
     
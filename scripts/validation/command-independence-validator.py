@@ -9,11 +9,18 @@ import re
 import json
 import time
 import argparse
+import hashlib
 import logging
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Any, Tuple, Optional
 
+# Pattern bank categories that only need to know whether they occur
+PRESENCE_CATEGORIES = ('coupling', 'autonomous')
+
+# Bump when scoring or report structure changes so cached results are dropped
+RESULT_CACHE_VERSION = 1
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -53,6 +60,32 @@ class CommandIndependenceValidator:
             'Task', 'Read', 'Write', 'Edit', 'Bash', 'Grep', 'LS'
         ]
         
+        # Direct command references
+        self.coupling_patterns = [
+            r'\.\.\/commands\/',
+            r'import.*command',
+            r'source.*command',
+            r'include.*command'
+        ]
+        
+        # Autonomous operation indicators
+        self.autonomous_indicators = [
+            r'MANDATORY',
+            r'REQUIRED',
+            r'CRITICAL',
+            r'Purpose',
+            r'Execution'
+        ]
+        
+        # Every pattern compiled once and shared by all files
+        self.pattern_bank = self._build_pattern_bank()
+        
+        # Per-command results keyed by content hash, plus the ecosystem tally
+        dir_key = hashlib.sha256(os.path.abspath(self.commands_dir).encode('utf-8')).hexdigest()[:12]
+        self.result_cache_path = self.results_dir / f"independence-cache-{dir_key}.json"
+        self.result_cache = None  # command_path -> {mtime_ns, size, content_hash, result}
+        self.ecosystem_tally = None
+        
         # Validation metrics
         self.validation_results = []
         self.ecosystem_metrics = {
@@ -97,17 +130,57 @@ class CommandIndependenceValidator:
             'autocontention_level': 'FULL' if external_deps == 0 else 'PARTIAL'
         }
     
-    def analyze_command_dependencies(self, command_path: str) -> Dict:
+    def _build_pattern_bank(self) -> List[Tuple[Tuple[str, int], re.Pattern]]:
         """
-        Comprehensive dependency analysis for a single command
+        Compiled patterns keyed by (category, index within category)
+        """
+        bank = [(('dependency', i), re.compile(pattern)) for i, pattern in enumerate(self.external_dependencies)]
+        bank.append((('slash', 0), re.compile(r'^/[a-zA-Z][a-zA-Z0-9-]*', re.MULTILINE)))
+        bank.append((('tool', 0), re.compile(r'(' + '|'.join(self.allowed_tools) + r')')))
+        bank.append((('reference', 0), re.compile(r'(?:https?://|\.\.?/|@|source|import|include)')))
+        bank.extend((('coupling', i), re.compile(pattern)) for i, pattern in enumerate(self.coupling_patterns))
+        bank.extend((('autonomous', i), re.compile(pattern)) for i, pattern in enumerate(self.autonomous_indicators))
+        return bank
+    
+    def scan_content(self, content: str) -> Dict[Tuple[str, int], List[Any]]:
         """
+        Categorized matches of the whole pattern bank, as re.findall returns them
+        
+        Each pattern runs once per file and every analysis reads from this
+        scan. Patterns run separately on purpose: sre has no multi-literal
+        search, so one alternation of the whole bank scans slower than the
+        individual patterns do. Presence-only categories stop at their
+        first match.
+        """
+        scan = {}
+        for key, compiled in self.pattern_bank:
+            if key[0] in PRESENCE_CATEGORIES:
+                match = compiled.search(content)
+                scan[key] = [match.group(0)] if match else []
+            else:
+                scan[key] = compiled.findall(content)
+        return scan
+    
+    def _read_command(self, command_path: str) -> Optional[str]:
+        """Read command content, None if unreadable"""
         try:
             with open(command_path, 'r', encoding='utf-8') as f:
-                content = f.read()
+                return f.read()
         except Exception as e:
             logger.error(f"Error reading command {command_path}: {e}")
+            return None
+    
+    def analyze_command_dependencies(self, command_path: str) -> Dict:
+        """
+        Comprehensive dependency analysis for a single command
+        """
+        content = self._read_command(command_path)
+        if content is None:
             return {}
-        
+        return self._dependency_analysis(command_path, self.scan_content(content))
+    
+    def _dependency_analysis(self, command_path: str, scan: Dict[Tuple[str, int], List[Any]]) -> Dict:
+        """Dependency analysis from a content scan"""
         analysis = {
             'command_path': command_path,
             'external_dependencies': 0,
@@ -120,8 +193,8 @@ class CommandIndependenceValidator:
         }
         
         # Check for external dependencies
-        for pattern in self.external_dependencies:
-            matches = re.findall(pattern, content)
+        for i, pattern in enumerate(self.external_dependencies):
+            matches = scan[('dependency', i)]
             if matches:
                 analysis['external_dependencies'] += len(matches)
                 analysis['dependency_patterns'].extend(matches)
@@ -132,18 +205,15 @@ class CommandIndependenceValidator:
                 })
         
         # Count slash commands
-        slash_matches = re.findall(r'^/[a-zA-Z][a-zA-Z0-9-]*', content, re.MULTILINE)
-        analysis['slash_commands'] = len(slash_matches)
+        analysis['slash_commands'] = len(scan[('slash', 0)])
         
         # Count tool calls
-        tool_patterns = r'(' + '|'.join(self.allowed_tools) + r')'
-        tool_matches = re.findall(tool_patterns, content)
+        tool_matches = scan[('tool', 0)]
         analysis['tool_calls'] = len(tool_matches)
         analysis['allowed_tools_used'] = list(set(tool_matches))
         
         # Count total references
-        all_refs = re.findall(r'(?:https?://|\.\.?/|@|source|import|include)', content)
-        analysis['total_references'] = len(all_refs)
+        analysis['total_references'] = len(scan[('reference', 0)])
         
         return analysis
     
@@ -151,19 +221,19 @@ class CommandIndependenceValidator:
         """
         Principle #102 compliance verification
         """
-        try:
-            with open(command_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-        except Exception as e:
-            logger.error(f"Error reading command {command_path}: {e}")
+        content = self._read_command(command_path)
+        if content is None:
             return {}
-        
+        return self._compliance_verification(self.scan_content(content))
+    
+    def _compliance_verification(self, scan: Dict[Tuple[str, int], List[Any]]) -> Dict:
+        """Compliance verification from a content scan"""
         compliance_checks = {
-            'zero_external_deps': self._check_external_dependencies(content),
-            'slash_invocation': self._check_slash_commands(content),
-            'tool_communication': self._check_tool_usage(content),
-            'no_direct_coupling': self._check_command_coupling(content),
-            'autonomous_operation': self._check_autonomous_patterns(content)
+            'zero_external_deps': self._check_external_dependencies(scan),
+            'slash_invocation': self._check_slash_commands(scan),
+            'tool_communication': self._check_tool_usage(scan),
+            'no_direct_coupling': self._check_command_coupling(scan),
+            'autonomous_operation': self._check_autonomous_patterns(scan)
         }
         
         compliance_score = sum(compliance_checks.values()) / len(compliance_checks) * 100
@@ -175,50 +245,25 @@ class CommandIndependenceValidator:
             'violations': [k for k, v in compliance_checks.items() if not v]
         }
     
-    def _check_external_dependencies(self, content: str) -> bool:
+    def _check_external_dependencies(self, scan: Dict) -> bool:
         """Check for external dependencies"""
-        for pattern in self.external_dependencies:
-            if re.search(pattern, content):
-                return False
-        return True
+        return not any(scan[('dependency', i)] for i in range(len(self.external_dependencies)))
     
-    def _check_slash_commands(self, content: str) -> bool:
+    def _check_slash_commands(self, scan: Dict) -> bool:
         """Check for proper slash command usage"""
-        slash_commands = re.findall(r'^/[a-zA-Z]', content, re.MULTILINE)
-        return len(slash_commands) >= 1  # At least one slash command
+        return len(scan[('slash', 0)]) >= 1  # At least one slash command
     
-    def _check_tool_usage(self, content: str) -> bool:
+    def _check_tool_usage(self, scan: Dict) -> bool:
         """Check for proper tool usage patterns"""
-        tool_pattern = r'(' + '|'.join(self.allowed_tools) + r')'
-        tool_matches = re.findall(tool_pattern, content)
-        return len(tool_matches) >= 1  # At least one tool call
+        return len(scan[('tool', 0)]) >= 1  # At least one tool call
     
-    def _check_command_coupling(self, content: str) -> bool:
+    def _check_command_coupling(self, scan: Dict) -> bool:
         """Check for direct command coupling"""
-        # Look for direct command references
-        coupling_patterns = [
-            r'\.\.\/commands\/',
-            r'import.*command',
-            r'source.*command',
-            r'include.*command'
-        ]
-        
-        for pattern in coupling_patterns:
-            if re.search(pattern, content):
-                return False
-        return True
+        return not any(scan[('coupling', i)] for i in range(len(self.coupling_patterns)))
     
-    def _check_autonomous_patterns(self, content: str) -> bool:
+    def _check_autonomous_patterns(self, scan: Dict) -> bool:
         """Check for autonomous operation patterns"""
-        autonomous_indicators = [
-            r'MANDATORY',
-            r'REQUIRED',
-            r'CRITICAL',
-            r'Purpose',
-            r'Execution'
-        ]
-        
-        found_indicators = sum(1 for pattern in autonomous_indicators if re.search(pattern, content))
+        found_indicators = sum(1 for i in range(len(self.autonomous_indicators)) if scan[('autonomous', i)])
         return found_indicators >= 3  # At least 3 autonomous indicators
     
     def generate_independence_metrics(self, command_data: Dict) -> Dict:
@@ -226,8 +271,19 @@ class CommandIndependenceValidator:
         Generate comprehensive independence metrics
         """
         autocontention_score = self.calculate_independence_score(command_data)
-        dependency_analysis = self.analyze_command_dependencies(command_data['command_path'])
-        compliance_verification = self.verify_autocontention_compliance(command_data['command_path'])
+        
+        # Read (unless the caller already did) and scan once for both analyses
+        command_path = command_data['command_path']
+        read_start = time.perf_counter()
+        content = command_data.get('content')
+        if content is None:
+            content = self._read_command(command_path)
+        scan_start = time.perf_counter()
+        scan = self.scan_content(content) if content is not None else None
+        scan_end = time.perf_counter()
+        
+        dependency_analysis = self._dependency_analysis(command_path, scan) if scan is not None else {}
+        compliance_verification = self._compliance_verification(scan) if scan is not None else {}
         
         # Calculate overall independence score
         overall_score = (
@@ -243,7 +299,12 @@ class CommandIndependenceValidator:
             'dependency_analysis': dependency_analysis,
             'compliance_verification': compliance_verification,
             'compliance_status': 'FULL' if overall_score >= 95 else 'PARTIAL',
-            'recommendations': self._generate_recommendations(dependency_analysis, compliance_verification)
+            'recommendations': self._generate_recommendations(dependency_analysis, compliance_verification),
+            'scan_timing': {
+                'read_seconds': scan_start - read_start,
+                'scan_seconds': scan_end - scan_start,
+                'content_bytes': len(content.encode('utf-8'))
+            }
         }
     
     def _generate_recommendations(self, dependency_analysis: Dict, compliance_verification: Dict) -> List[str]:
@@ -272,14 +333,16 @@ class CommandIndependenceValidator:
         
         return recommendations
     
-    def validate_single_command(self, command_path: str) -> Dict:
+    def validate_single_command(self, command_path: str, content: Optional[str] = None) -> Dict:
         """
         Validate a single command for independence
+        
+        content may carry the command text when the caller has already read it.
         """
         logger.info(f"Validating command: {command_path}")
         
         # Analyze command
-        command_data = {'command_path': command_path}
+        command_data = {'command_path': command_path, 'content': content}
         metrics = self.generate_independence_metrics(command_data)
         
         # Create validation report
@@ -303,6 +366,7 @@ class CommandIndependenceValidator:
             },
             'detailed_metrics': metrics,
             'recommendations': metrics['recommendations'],
+            'scan_timing': metrics['scan_timing'],
             'quality_gates': {
                 'autocontention_compliance': 'PASS' if metrics['dependency_analysis']['external_dependencies'] == 0 else 'FAIL',
                 'independence_score': 'PASS' if metrics['overall_independence'] >= 95 else 'FAIL',
@@ -322,9 +386,12 @@ class CommandIndependenceValidator:
         
         return report
     
-    def validate_all_commands(self) -> Dict:
+    def validate_all_commands(self, use_cache: bool = True) -> Dict:
         """
         Validate all commands in the ecosystem
+        
+        With the cache only added or changed commands are revalidated; the
+        ecosystem report comes from a tally adjusted by their changes.
         """
         logger.info("Starting ecosystem-wide validation...")
         
@@ -334,11 +401,38 @@ class CommandIndependenceValidator:
                 if file.endswith('.md'):
                     command_files.append(os.path.join(root, file))
         
-        results = []
+        if not use_cache:
+            self.result_cache = {}
+            self.ecosystem_tally = self._empty_tally()
+        elif self.result_cache is None:
+            self._load_result_cache()
+        
+        revalidated = []
+        unchanged = 0
+        cache_dirty = not use_cache
         for command_file in command_files:
+            entry = self.result_cache.get(command_file)
             try:
-                result = self.validate_single_command(command_file)
-                results.append(result)
+                stat = os.stat(command_file)
+                if entry and entry['mtime_ns'] == stat.st_mtime_ns and entry['size'] == stat.st_size:
+                    unchanged += 1
+                    continue
+                with open(command_file, 'rb') as f:
+                    raw = f.read()
+                content_hash = hashlib.sha256(raw).hexdigest()
+                if entry and entry['content_hash'] == content_hash:
+                    # Touched but identical content
+                    entry['mtime_ns'], entry['size'] = stat.st_mtime_ns, stat.st_size
+                    unchanged += 1
+                    cache_dirty = True
+                    continue
+                
+                # Reuse the hashed bytes, decoded as a text-mode read would
+                try:
+                    content = raw.decode('utf-8').replace('\r\n', '\n').replace('\r', '\n')
+                except UnicodeDecodeError:
+                    content = None  # Left to _read_command, which reports it unreadable
+                result = self.validate_single_command(command_file, content=content)
                 
                 # Log result
                 status = "✅ COMPLIANT" if result['quality_gates']['autocontention_compliance'] == 'PASS' else "❌ NON-COMPLIANT"
@@ -346,9 +440,37 @@ class CommandIndependenceValidator:
                 
             except Exception as e:
                 logger.error(f"Error validating {command_file}: {e}")
+                self._drop_cached_result(command_file)
+                continue
+            
+            self._drop_cached_result(command_file)
+            self.result_cache[command_file] = {
+                'mtime_ns': stat.st_mtime_ns,
+                'size': stat.st_size,
+                'content_hash': content_hash,
+                'result': result
+            }
+            self._apply_to_tally(result, 1)
+            revalidated.append(result)
+        
+        current = set(command_files)
+        removed = [path for path in self.result_cache if path not in current]
+        for path in removed:
+            self._drop_cached_result(path)
+        
+        if revalidated or removed or cache_dirty:
+            self._save_result_cache()
+        
+        results = [self.result_cache[f]['result'] for f in command_files if f in self.result_cache]
         
         # Generate ecosystem report
-        ecosystem_report = self._generate_ecosystem_report(results)
+        ecosystem_report = self._generate_ecosystem_report(self.ecosystem_tally, revalidated)
+        ecosystem_report['cache_summary'] = {
+            'revalidated_commands': len(revalidated),
+            'unchanged_commands': unchanged,
+            'removed_commands': len(removed)
+        }
+        logger.info(f"Revalidated {len(revalidated)} commands, {unchanged} unchanged, {len(removed)} removed")
         
         return {
             'individual_results': results,
@@ -356,14 +478,87 @@ class CommandIndependenceValidator:
             'validation_complete': True
         }
     
-    def _generate_ecosystem_report(self, results: List[Dict]) -> Dict:
+    def _cache_fingerprint(self) -> str:
+        """Identity of the patterns and scoring that produced cached results"""
+        config = [RESULT_CACHE_VERSION, self.external_dependencies, self.allowed_tools,
+                  self.coupling_patterns, self.autonomous_indicators]
+        return hashlib.sha256(json.dumps(config).encode('utf-8')).hexdigest()
+    
+    def _load_result_cache(self):
+        """Load cached per-command results and rebuild the tally from them"""
+        self.result_cache = {}
+        self.ecosystem_tally = self._empty_tally()
+        if not self.result_cache_path.exists():
+            return
+        try:
+            with open(self.result_cache_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable result cache: {e}")
+            return
+        if data.get('fingerprint') != self._cache_fingerprint():
+            logger.info("Validator patterns changed, result cache discarded")
+            return
+        
+        self.result_cache = data.get('commands', {})
+        for entry in self.result_cache.values():
+            self._apply_to_tally(entry['result'], 1)
+        logger.info(f"Loaded {len(self.result_cache)} cached command results")
+    
+    def _save_result_cache(self):
+        """Persist cached results atomically"""
+        data = {
+            'fingerprint': self._cache_fingerprint(),
+            'commands_dir': self.commands_dir,
+            'commands': self.result_cache
+        }
+        tmp_path = self.result_cache_path.with_suffix('.json.tmp')
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f, ensure_ascii=False)
+            os.replace(tmp_path, self.result_cache_path)
+        except OSError as e:
+            logger.warning(f"Could not save result cache: {e}")
+    
+    def _drop_cached_result(self, command_path: str):
+        """Remove a command's cached result and its share of the tally"""
+        entry = self.result_cache.pop(command_path, None)
+        if entry:
+            self._apply_to_tally(entry['result'], -1)
+    
+    def _empty_tally(self) -> Dict:
+        """Additive ecosystem counters"""
+        return {
+            'total_commands': 0,
+            'independence_score_sum': 0.0,
+            'dependency_issues': 0,
+            'gates_passed': {
+                'autocontention_compliance': 0,
+                'independence_score': 0,
+                'dependency_analysis': 0,
+                'communication_patterns': 0
+            }
+        }
+    
+    def _apply_to_tally(self, result: Dict, sign: int):
+        """Add (sign=1) or remove (sign=-1) one command's contribution"""
+        tally = self.ecosystem_tally
+        tally['total_commands'] += sign
+        tally['independence_score_sum'] += sign * result['independence_analysis']['overall_score']
+        if result['independence_analysis']['external_dependencies'] > 0:
+            tally['dependency_issues'] += sign
+        for gate, outcome in result['quality_gates'].items():
+            if outcome == 'PASS':
+                tally['gates_passed'][gate] += sign
+    
+    def _generate_ecosystem_report(self, tally: Dict, scanned_results: List[Dict]) -> Dict:
         """Generate comprehensive ecosystem validation report"""
-        total_commands = len(results)
-        compliant_commands = sum(1 for r in results if r['quality_gates']['autocontention_compliance'] == 'PASS')
+        total_commands = tally['total_commands']
+        compliant_commands = tally['gates_passed']['autocontention_compliance']
         
         compliance_rate = (compliant_commands / total_commands * 100) if total_commands > 0 else 0
         
-        avg_independence = sum(r['independence_analysis']['overall_score'] for r in results) / total_commands if total_commands > 0 else 0
+        avg_independence = tally['independence_score_sum'] / total_commands if total_commands > 0 else 0
         
         return {
             'ecosystem_summary': {
@@ -373,22 +568,36 @@ class CommandIndependenceValidator:
                 'compliance_rate': compliance_rate,
                 'average_independence_score': avg_independence
             },
-            'compliance_breakdown': {
-                'autocontention_compliance': sum(1 for r in results if r['quality_gates']['autocontention_compliance'] == 'PASS'),
-                'independence_score': sum(1 for r in results if r['quality_gates']['independence_score'] == 'PASS'),
-                'dependency_analysis': sum(1 for r in results if r['quality_gates']['dependency_analysis'] == 'PASS'),
-                'communication_patterns': sum(1 for r in results if r['quality_gates']['communication_patterns'] == 'PASS')
-            },
-            'recommendations': self._generate_ecosystem_recommendations(results),
+            'compliance_breakdown': dict(tally['gates_passed']),
+            'recommendations': self._generate_ecosystem_recommendations(tally),
+            'scan_timing': self._summarize_scan_timing(scanned_results),
             'validation_timestamp': datetime.now().isoformat()
         }
     
-    def _generate_ecosystem_recommendations(self, results: List[Dict]) -> List[str]:
+    def _summarize_scan_timing(self, results: List[Dict]) -> Dict:
+        """Read versus scan time of the commands validated this run, and the slowest scan"""
+        timings = [(r['metadata']['command_path'], r['scan_timing']) for r in results]
+        total_read = sum(t['read_seconds'] for _, t in timings)
+        total_scan = sum(t['scan_seconds'] for _, t in timings)
+        total_bytes = sum(t['content_bytes'] for _, t in timings)
+        slowest_path, slowest = max(timings, key=lambda item: item[1]['scan_seconds'], default=(None, None))
+        
+        return {
+            'total_read_seconds': total_read,
+            'total_scan_seconds': total_scan,
+            'scan_throughput_mb_per_second': (total_bytes / 1024 / 1024) / total_scan if total_scan > 0 else 0,
+            'slowest_scan': {
+                'command_path': slowest_path,
+                'scan_seconds': slowest['scan_seconds'] if slowest else 0
+            }
+        }
+    
+    def _generate_ecosystem_recommendations(self, tally: Dict) -> List[str]:
         """Generate ecosystem-wide recommendations"""
         recommendations = []
         
-        total_commands = len(results)
-        compliant_commands = sum(1 for r in results if r['quality_gates']['autocontention_compliance'] == 'PASS')
+        total_commands = tally['total_commands']
+        compliant_commands = tally['gates_passed']['autocontention_compliance']
         
         if compliant_commands == total_commands:
             recommendations.append("✅ All commands achieve full autocontention compliance")
@@ -397,11 +606,11 @@ class CommandIndependenceValidator:
             recommendations.append(f"⚠️ {non_compliant} commands need autocontention improvements")
         
         # Analyze common issues
-        dependency_issues = sum(1 for r in results if r['independence_analysis']['external_dependencies'] > 0)
+        dependency_issues = tally['dependency_issues']
         if dependency_issues > 0:
             recommendations.append(f"❌ {dependency_issues} commands have external dependencies")
         
-        communication_issues = sum(1 for r in results if r['quality_gates']['communication_patterns'] == 'FAIL')
+        communication_issues = total_commands - tally['gates_passed']['communication_patterns']
         if communication_issues > 0:
             recommendations.append(f"⚠️ {communication_issues} commands need better tool communication")
         
@@ -429,6 +638,7 @@ class CommandIndependenceValidator:
         
         while True:
             try:
+                # Only added or changed commands are revalidated each interval
                 results = self.validate_all_commands()
                 
                 # Alert on non-compliance
@@ -436,8 +646,10 @@ class CommandIndependenceValidator:
                 if non_compliant > 0:
                     logger.warning(f"⚠️ {non_compliant} commands are non-compliant")
                 
-                # Save results
-                self.save_results(results)
+                # Save results when anything changed
+                changes = results['ecosystem_report']['cache_summary']
+                if changes['revalidated_commands'] or changes['removed_commands']:
+                    self.save_results(results)
                 
                 # Sleep until next check
                 time.sleep(interval)
@@ -458,6 +670,7 @@ def main():
     parser.add_argument('--interval', '-i', type=int, default=300, help='Monitoring interval in seconds')
     parser.add_argument('--output', '-o', type=str, help='Output filename')
     parser.add_argument('--commands-dir', '-d', type=str, help='Commands directory path')
+    parser.add_argument('--no-cache', action='store_true', help='Revalidate every command, ignoring cached results')
     
     args = parser.parse_args()
     
@@ -472,7 +685,7 @@ def main():
         
     elif args.all:
         # Validate all commands
-        results = validator.validate_all_commands()
+        results = validator.validate_all_commands(use_cache=not args.no_cache)
         output_file = validator.save_results(results, args.output)
         print(f"Ecosystem validation complete. Results saved to: {output_file}")
         
@@ -485,6 +698,10 @@ def main():
         print(f"Compliance Rate: {summary['compliance_rate']:.1f}%")
         print(f"Average Independence Score: {summary['average_independence_score']:.1f}")
         
+        timing = results['ecosystem_report']['scan_timing']
+        print(f"Read Time: {timing['total_read_seconds']:.3f}s, Scan Time: {timing['total_scan_seconds']:.3f}s "
+              f"({timing['scan_throughput_mb_per_second']:.1f} MB/s)")
+        
     elif args.monitor:
         # Start continuous monitoring
         validator.monitor_continuous_compliance(args.interval)
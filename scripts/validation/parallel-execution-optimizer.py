@@ -9,11 +9,12 @@ import json
 import time
 import asyncio
 import threading
+import importlib.util
 from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
-from multiprocessing import cpu_count
+from multiprocessing import cpu_count, Pool
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Any, Optional, Tuple
+from typing import Dict, List, Any, Optional, Tuple, Iterator
 import logging
 
 # Configure logging
@@ -23,14 +24,65 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+VALIDATOR_PATH = Path(__file__).parent / "command-independence-validator.py"
+BACKENDS = ('process', 'thread')
+CHUNKS_PER_WORKER = 8  # Small chunks let idle workers take over the tail of a skewed batch
+ASYNC_READ_CONCURRENCY = 8  # Command files read at once in async mode
+QUEUE_DEPTH_PER_WORKER = 4  # Read-ahead per CPU worker before readers wait
+
+_validator_class = None
+_worker_validator = None
+
+def load_validator_class():
+    """CommandIndependenceValidator from its script, loaded once per process"""
+    global _validator_class
+    if _validator_class is None:
+        spec = importlib.util.spec_from_file_location("command_independence_validator", VALIDATOR_PATH)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        _validator_class = module.CommandIndependenceValidator
+    return _validator_class
+
+def _init_worker():
+    """Process pool initializer: build the validator once per worker"""
+    global _worker_validator
+    _worker_validator = load_validator_class()()
+
+def _validate_content_in_worker(command_path: str, content: Optional[str]) -> Dict:
+    """Validate already-read command content with the worker's validator"""
+    return _worker_validator.validate_single_command(command_path, content)
+
+def _read_command_text(command_path: str) -> Optional[str]:
+    """Command text, or None to let the validator report the read failure"""
+    try:
+        with open(command_path, 'r', encoding='utf-8') as f:
+            return f.read()
+    except (OSError, UnicodeDecodeError):
+        return None
+
+def _validate_in_worker(command_path: str) -> Dict:
+    """Validate one command with the worker's validator"""
+    try:
+        return _worker_validator.validate_single_command(command_path)
+    except Exception as e:
+        logger.error(f"Error validating {command_path}: {e}")
+        return {
+            'command_path': command_path,
+            'error': str(e),
+            'status': 'FAILED'
+        }
+
 class ParallelExecutionOptimizer:
     """
     Optimizes parallel execution for command independence validation
     Targets ≥90% resource utilization with intelligent load balancing
     """
     
-    def __init__(self, max_workers: int = None):
+    def __init__(self, max_workers: int = None, backend: str = 'process'):
+        if backend not in BACKENDS:
+            raise ValueError(f"Unknown backend {backend}, expected one of {BACKENDS}")
         self.max_workers = max_workers or cpu_count()
+        self.backend = backend
         self.results_dir = Path(__file__).parent.parent / "results" / "parallel-execution"
         self.results_dir.mkdir(parents=True, exist_ok=True)
         
@@ -61,35 +113,21 @@ class ParallelExecutionOptimizer:
         # Initialize monitoring
         self.resource_monitor.start_monitoring()
         
-        # Partition commands for optimal parallel processing
-        command_batches = self._partition_commands(command_paths)
-        
-        # Execute validation in parallel
+        # Execute validation in parallel, collecting results as they stream in
         results = []
-        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-            # Submit all batches
-            future_to_batch = {
-                executor.submit(self._validate_batch, batch): batch 
-                for batch in command_batches
-            }
+        for result in self.iter_validation_results(command_paths):
+            results.append(result)
             
-            # Collect results with progress tracking
-            for future in as_completed(future_to_batch):
-                batch = future_to_batch[future]
-                try:
-                    batch_results = future.result()
-                    results.extend(batch_results)
-                    
-                    # Update metrics
-                    self.metrics['processed_commands'] += len(batch_results)
-                    
-                    # Log progress
-                    progress = (self.metrics['processed_commands'] / len(command_paths)) * 100
-                    logger.info(f"Progress: {progress:.1f}% ({self.metrics['processed_commands']}/{len(command_paths)})")
-                    
-                except Exception as e:
-                    logger.error(f"Batch processing failed: {e}")
-                    self.metrics['failed_commands'] += len(batch)
+            # Update metrics
+            self.metrics['processed_commands'] += 1
+            if result.get('status') == 'FAILED':
+                self.metrics['failed_commands'] += 1
+            
+            # Log progress
+            done = len(results)
+            if done % max(1, len(command_paths) // 20) == 0 or done == len(command_paths):
+                progress = (done / len(command_paths)) * 100
+                logger.info(f"Progress: {progress:.1f}% ({done}/{len(command_paths)})")
         
         # Stop monitoring and calculate metrics
         self.resource_monitor.stop_monitoring()
@@ -109,6 +147,89 @@ class ParallelExecutionOptimizer:
             'resource_utilization': self.resource_monitor.get_metrics()
         }
     
+    def iter_validation_results(self, command_paths: List[str]) -> Iterator[Dict]:
+        """
+        Yield validation results as workers complete them (completion order)
+        """
+        if not command_paths:
+            return
+        
+        if self.backend == 'thread':
+            yield from self._iter_thread_results(command_paths)
+            return
+        
+        # Largest files first with small chunks: workers pull the next chunk
+        # from the shared queue as they finish, so one heavy file cannot
+        # leave the others idle at the end of the run
+        ordered = self._order_by_size(command_paths)
+        chunksize = max(1, len(ordered) // (self.max_workers * CHUNKS_PER_WORKER))
+        logger.info(f"Process pool: {self.max_workers} workers, chunk size {chunksize}")
+        
+        with Pool(processes=self.max_workers, initializer=_init_worker) as pool:
+            yield from pool.imap_unordered(_validate_in_worker, ordered, chunksize)
+    
+    def _iter_thread_results(self, command_paths: List[str]) -> Iterator[Dict]:
+        """
+        Thread pool over command batches; bound by the GIL for this regex work
+        """
+        command_batches = self._partition_commands(command_paths)
+        
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            future_to_batch = {
+                executor.submit(self._validate_batch, batch): batch 
+                for batch in command_batches
+            }
+            
+            for future in as_completed(future_to_batch):
+                batch = future_to_batch[future]
+                try:
+                    yield from future.result()
+                except Exception as e:
+                    logger.error(f"Batch processing failed: {e}")
+                    for command_path in batch:
+                        yield {'command_path': command_path, 'error': str(e), 'status': 'FAILED'}
+    
+    def _order_by_size(self, command_paths: List[str]) -> List[str]:
+        """
+        Command paths by descending file size
+        """
+        def size(command_path: str) -> int:
+            try:
+                return os.path.getsize(command_path)
+            except OSError:
+                return 0
+        
+        return sorted(command_paths, key=size, reverse=True)
+    
+    def benchmark_backends(self, command_paths: List[str], worker_counts: Tuple[int, ...] = (1, 4, 16)) -> Dict:
+        """
+        Time the thread and process backends on the same commands per worker count
+        """
+        benchmark = {
+            'commands': len(command_paths),
+            'available_cpus': cpu_count(),
+            'runs': []
+        }
+        
+        for workers in worker_counts:
+            timings = {}
+            for backend in BACKENDS:
+                optimizer = ParallelExecutionOptimizer(workers, backend)
+                start_time = time.perf_counter()
+                for _ in optimizer.iter_validation_results(command_paths):
+                    pass
+                timings[backend] = time.perf_counter() - start_time
+            
+            benchmark['runs'].append({
+                'workers': workers,
+                'thread_seconds': timings['thread'],
+                'process_seconds': timings['process'],
+                'speedup': timings['thread'] / timings['process'] if timings['process'] > 0 else 0
+            })
+            logger.info(f"{workers} workers: thread {timings['thread']:.2f}s, process {timings['process']:.2f}s")
+        
+        return benchmark
+    
     def _partition_commands(self, command_paths: List[str]) -> List[List[str]]:
         """
         Partition commands for optimal parallel processing
@@ -128,9 +249,7 @@ class ParallelExecutionOptimizer:
         """
         Validate a batch of commands
         """
-        from command_independence_validator import CommandIndependenceValidator
-        
-        validator = CommandIndependenceValidator()
+        validator = load_validator_class()()
         batch_results = []
         
         for command_path in command_batch:
@@ -227,53 +346,65 @@ class ParallelExecutionOptimizer:
     async def async_validate_commands(self, command_paths: List[str]) -> Dict:
         """
         Asynchronous validation for maximum performance
+        
+        Pipeline: bounded concurrent reads fill a queue that the CPU workers
+        drain; a full queue makes readers wait, so read-ahead stays bounded.
         """
         logger.info(f"Starting async validation for {len(command_paths)} commands")
         
         start_time = time.time()
-        
-        # Create semaphore to limit concurrent operations
-        semaphore = asyncio.Semaphore(self.max_workers)
-        
-        async def validate_command_async(command_path: str) -> Dict:
-            async with semaphore:
-                # Run validation in thread pool
-                loop = asyncio.get_event_loop()
-                return await loop.run_in_executor(None, self._validate_single_command, command_path)
-        
-        # Execute all validations concurrently
-        tasks = [validate_command_async(cmd) for cmd in command_paths]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-        
-        # Process results
+        loop = asyncio.get_running_loop()
+        queue = asyncio.Queue(maxsize=self.max_workers * QUEUE_DEPTH_PER_WORKER)
+        pending_paths = iter(command_paths)
         successful_results = []
         failed_results = []
-        
-        for result in results:
-            if isinstance(result, Exception):
-                failed_results.append(str(result))
-            else:
-                successful_results.append(result)
+        in_flight = 0
+        
+        self.resource_monitor.start_pipeline(queue.maxsize)
+        
+        async def read_commands(io_pool: ThreadPoolExecutor):
+            for command_path in pending_paths:
+                content = await loop.run_in_executor(io_pool, _read_command_text, command_path)
+                await queue.put((command_path, content))
+                self.resource_monitor.record_pipeline_sample(queue.qsize(), in_flight)
+        
+        async def validate_commands(cpu_pool: ProcessPoolExecutor):
+            nonlocal in_flight
+            while True:
+                item = await queue.get()
+                if item is None:
+                    break
+                command_path, content = item
+                in_flight += 1
+                self.resource_monitor.record_pipeline_sample(queue.qsize(), in_flight)
+                try:
+                    result = await loop.run_in_executor(cpu_pool, _validate_content_in_worker, command_path, content)
+                    successful_results.append(result)
+                except Exception as e:
+                    failed_results.append(str(e))
+                in_flight -= 1
+                self.resource_monitor.record_completion()
+        
+        with ThreadPoolExecutor(max_workers=ASYNC_READ_CONCURRENCY) as io_pool, \
+                ProcessPoolExecutor(max_workers=self.max_workers, initializer=_init_worker) as cpu_pool:
+            validators = [asyncio.create_task(validate_commands(cpu_pool)) for _ in range(self.max_workers)]
+            await asyncio.gather(*(read_commands(io_pool) for _ in range(ASYNC_READ_CONCURRENCY)))
+            for _ in validators:
+                await queue.put(None)
+            await asyncio.gather(*validators)
         
         execution_time = time.time() - start_time
+        total = len(command_paths)
         
         return {
             'successful_validations': successful_results,
             'failed_validations': failed_results,
             'execution_time': execution_time,
-            'success_rate': len(successful_results) / len(command_paths) * 100,
-            'throughput': len(command_paths) / execution_time
+            'success_rate': len(successful_results) / total * 100 if total else 0,
+            'throughput': total / execution_time if execution_time > 0 else 0,
+            'pipeline_metrics': self.resource_monitor.get_pipeline_metrics()
         }
     
-    def _validate_single_command(self, command_path: str) -> Dict:
-        """
-        Validate single command (thread-safe)
-        """
-        from command_independence_validator import CommandIndependenceValidator
-        
-        validator = CommandIndependenceValidator()
-        return validator.validate_single_command(command_path)
-    
     def monitor_real_time_performance(self, interval: int = 30) -> None:
         """
         Real-time performance monitoring
@@ -331,6 +462,49 @@ class ResourceMonitor:
         self.monitoring = False
         self.metrics_history = []
         self.monitor_thread = None
+        
+        # Pipeline metrics pushed by async validation
+        self.pipeline_capacity = 0
+        self.pipeline_samples = []  # (timestamp, queue_depth, in_flight)
+        self.pipeline_completed = 0
+        self.pipeline_start = None
+    
+    def start_pipeline(self, capacity: int):
+        """Reset pipeline metrics for a run with the given queue capacity"""
+        self.pipeline_capacity = capacity
+        self.pipeline_samples = []
+        self.pipeline_completed = 0
+        self.pipeline_start = time.time()
+    
+    def record_pipeline_sample(self, queue_depth: int, in_flight: int):
+        """Record queue depth and busy workers at a pipeline event"""
+        self.pipeline_samples.append((time.time(), queue_depth, in_flight))
+        if len(self.pipeline_samples) > 10000:
+            self.pipeline_samples = self.pipeline_samples[-10000:]
+    
+    def record_completion(self):
+        """Count one validated command"""
+        self.pipeline_completed += 1
+    
+    def get_pipeline_metrics(self) -> Dict:
+        """Queue depth, worker occupancy and throughput of the last pipeline run"""
+        if not self.pipeline_samples:
+            return {'completed': self.pipeline_completed, 'throughput': 0}
+        
+        depths = [depth for _, depth, _ in self.pipeline_samples]
+        busy = [in_flight for _, _, in_flight in self.pipeline_samples]
+        duration = time.time() - self.pipeline_start
+        
+        return {
+            'completed': self.pipeline_completed,
+            'throughput': self.pipeline_completed / duration if duration > 0 else 0,
+            'queue_capacity': self.pipeline_capacity,
+            'avg_queue_depth': sum(depths) / len(depths),
+            'max_queue_depth': max(depths),
+            'queue_full_ratio': sum(1 for depth in depths if depth >= self.pipeline_capacity) / len(depths),
+            'avg_in_flight': sum(busy) / len(busy),
+            'data_points': len(self.pipeline_samples)
+        }
     
     def start_monitoring(self):
         """Start resource monitoring"""
@@ -458,12 +632,14 @@ def main():
     parser.add_argument('--workers', '-w', type=int, help='Number of worker processes')
     parser.add_argument('--monitor', '-m', action='store_true', help='Start performance monitoring')
     parser.add_argument('--async-mode', '-a', action='store_true', help='Use asynchronous validation')
+    parser.add_argument('--backend', '-b', choices=BACKENDS, default='process', help='Parallel execution backend')
+    parser.add_argument('--benchmark', action='store_true', help='Compare thread and process backends on 1/4/16 workers')
     parser.add_argument('--output', '-o', type=str, help='Output report filename')
     
     args = parser.parse_args()
     
     # Initialize optimizer
-    optimizer = ParallelExecutionOptimizer(args.workers)
+    optimizer = ParallelExecutionOptimizer(args.workers, args.backend)
     
     if args.monitor:
         # Start monitoring mode
@@ -479,12 +655,24 @@ def main():
         
         logger.info(f"Found {len(command_files)} command files for validation")
         
-        if args.async_mode:
+        if args.benchmark:
+            benchmark = optimizer.benchmark_backends(command_files)
+            report_file = optimizer.save_performance_report(benchmark, args.output)
+            
+            print(f"\nBackend Benchmark ({benchmark['commands']} commands, {benchmark['available_cpus']} CPUs):")
+            for run in benchmark['runs']:
+                print(f"  {run['workers']:>2} workers: thread {run['thread_seconds']:.2f}s, "
+                      f"process {run['process_seconds']:.2f}s, speedup {run['speedup']:.2f}x")
+            print(f"Report saved to: {report_file}")
+        elif args.async_mode:
             # Async validation
             async def run_async():
                 results = await optimizer.async_validate_commands(command_files)
                 report_file = optimizer.save_performance_report(results, args.output)
-                print(f"Async validation complete. Report saved to: {report_file}")
+                pipeline = results['pipeline_metrics']
+                print(f"Async validation complete: {results['throughput']:.2f} commands/second, "
+                      f"avg queue depth {pipeline.get('avg_queue_depth', 0):.1f}/{pipeline.get('queue_capacity', 0)}")
+                print(f"Report saved to: {report_file}")
             
             asyncio.run(run_async())
         else: